@@ -3,7 +3,7 @@
 Weltenwind .arb Validator (Enhanced)
 Validiert .arb-Dateien für Syntax, Konsistenz und Best Practices
 
-Usage: python arb_validator.py [file.arb] [--fix] [--strict] [--compare-to ref.arb]
+Usage: python arb_validator.py [file.arb] [--fix] [--strict] [--compare-to ref.arb] [--sarif out.sarif] [--db]
 """
 
 import json
@@ -14,6 +14,11 @@ from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional, Union
 from dataclasses import dataclass
 
+from i18n_report_writers import SARIF_LEVELS, SarifWriter, open_output
+from i18n_findings_db import VALIDATOR, FindingsDB, default_db_file, relative_file
+
+CLIENT_ROOT = Path(__file__).resolve().parent.parent
+
 # ✅ 3. YAML-Unterstützung (optional)
 try:
     import yaml
@@ -49,6 +54,11 @@ class ArbValidator:
             (r'[^\x00-\x7F\u00C0-\u017F\u2000-\u206F\u2070-\u209F\u20A0-\u20CF\u2100-\u214F\u2190-\u21FF]', 'Unerlaubte Unicode-Zeichen'),
         ]
         
+        # Key-Naming (camelCase mit Kategorie-Prefix), Key-Suffixe und Platzhalter-Spannen
+        self.key_naming_pattern = r'^[a-z]+[A-Z][a-zA-Z0-9]*$'
+        self.key_suffix_pattern = r'(Button|Title|Label|Text|Message|Error)$'
+        self.placeholder_span_pattern = r'\{[^}]+\}'
+        
         # Gaming-spezifische Begriffe (Konsistenz)
         self.gaming_terms = {
             'player': ['Spieler', 'Player'],
@@ -98,10 +108,21 @@ class ArbValidator:
         """Lädt .arb- oder .yaml-Datei"""
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                if yaml_mode and YAML_SUPPORT:
-                    return yaml.safe_load(f)
-                else:
-                    return json.load(f)
+                content = f.read()
+        except Exception as e:
+            self.add_error('error', 'FILE_READ', 
+                          f'Datei kann nicht gelesen werden: {e}',
+                          file_path=filepath)
+            return None
+        return self.parse_content(content, filepath, yaml_mode)
+
+    def parse_content(self, content: str, filepath: str, yaml_mode: bool = False) -> Optional[Dict]:
+        """Parst .arb- oder .yaml-Inhalt aus dem Speicher (z.B. Staging-Blob)"""
+        try:
+            if yaml_mode and YAML_SUPPORT:
+                data = yaml.safe_load(content)
+            else:
+                data = json.loads(content)
         except json.JSONDecodeError as e:
             self.add_error('error', 'JSON_SYNTAX', 
                           f'JSON-Syntax-Fehler: {e.msg}', 
@@ -109,17 +130,26 @@ class ArbValidator:
                           'Überprüfe Kommata, Anführungszeichen und Klammern',
                           filepath)
             return None
-        except yaml.YAMLError as e:
-            self.add_error('error', 'YAML_SYNTAX',
-                          f'YAML-Syntax-Fehler: {e}',
-                          suggestion='Überprüfe Einrückung und Syntax',
-                          file_path=filepath)
-            return None
         except Exception as e:
-            self.add_error('error', 'FILE_READ', 
-                          f'Datei kann nicht gelesen werden: {e}',
+            if YAML_SUPPORT and isinstance(e, yaml.YAMLError):
+                self.add_error('error', 'YAML_SYNTAX',
+                              f'YAML-Syntax-Fehler: {e}',
+                              suggestion='Überprüfe Einrückung und Syntax',
+                              file_path=filepath)
+            else:
+                self.add_error('error', 'FILE_READ', 
+                              f'Datei kann nicht gelesen werden: {e}',
+                              file_path=filepath)
+            return None
+        
+        # Gültiges JSON, aber kein Objekt (z.B. [] oder "x" beim Editieren)
+        if not isinstance(data, dict):
+            self.add_error('error', 'INVALID_ROOT',
+                          f'Wurzelelement muss ein Objekt sein, gefunden: {type(data).__name__}',
+                          suggestion='Umschließe die Einträge mit { ... }',
                           file_path=filepath)
             return None
+        return data
 
     def validate_json_syntax(self, content: str, filename: str) -> Optional[Dict]:
         """Validiert JSON-Syntax (Legacy-Support)"""
@@ -146,6 +176,14 @@ class ArbValidator:
         string_keys = {k for k in data.keys() if not k.startswith('@')}
         metadata_keys = {k for k in data.keys() if k.startswith('@') and not k.startswith('@@')}
         
+        # String-Keys müssen auf Text zeigen, alle weiteren Checks überspringen den Rest
+        for key in sorted(string_keys):
+            if not isinstance(data[key], str):
+                self.add_error('error', 'INVALID_VALUE_TYPE',
+                              f'Wert von "{key}" ist kein String ({type(data[key]).__name__})',
+                              suggestion=f'Setze "{key}" auf einen Text, z.B. "{key}": "..."',
+                              file_path=filename)
+        
         # Prüfe ob jeder String-Key Metadaten hat
         for key in string_keys:
             meta_key = f'@{key}'
@@ -159,7 +197,7 @@ class ArbValidator:
         """Validiert Key-Naming-Conventions"""
         
         # Erlaubtes Pattern: camelCase mit Kategorie-Prefix
-        valid_pattern = re.compile(r'^[a-z]+[A-Z][a-zA-Z0-9]*$')
+        valid_pattern = re.compile(self.key_naming_pattern)
         
         # Bekannte Kategorien
         known_categories = {
@@ -222,7 +260,7 @@ class ArbValidator:
             meta_key = f'@{key}'
             if meta_key in data and isinstance(data[meta_key], dict):
                 metadata = data[meta_key]
-                if 'placeholders' in metadata:
+                if isinstance(metadata.get('placeholders'), dict):
                     defined_placeholders = set(metadata['placeholders'].keys())
                     
                     # Prüfe fehlende Definitionen
@@ -250,7 +288,7 @@ class ArbValidator:
         key_groups = {}
         for key in string_entries.keys():
             # Extrahiere Basis (ohne Suffix wie Button, Title, etc.)
-            base = re.sub(r'(Button|Title|Label|Text|Message|Error)$', '', key)
+            base = re.sub(self.key_suffix_pattern, '', key)
             if base not in key_groups:
                 key_groups[base] = []
             key_groups[base].append(key)
@@ -260,6 +298,8 @@ class ArbValidator:
             found_variants = set()
             
             for key, value in string_entries.items():
+                if not isinstance(value, str):
+                    continue
                 for variant in german_variants:
                     if variant.lower() in value.lower():
                         found_variants.add(variant)
@@ -340,7 +380,7 @@ class ArbValidator:
                     break
             
             # Prüfe Länge (ohne Platzhalter)
-            text_without_placeholders = re.sub(r'\{[^}]+\}', 'XX', value)
+            text_without_placeholders = re.sub(self.placeholder_span_pattern, 'XX', value)
             if len(text_without_placeholders) > max_length:
                 self.add_error('warning', 'TEXT_TOO_LONG',
                               f'Text zu lang für "{key}": {len(text_without_placeholders)} > {max_length} Zeichen',
@@ -399,7 +439,18 @@ class ArbValidator:
         if data is None:
             return False
         
-        # ARB-spezifische Validierungen
+        return self.validate_data(data, filepath)
+
+    def validate_content(self, content: str, filepath: str, yaml_mode: bool = False) -> bool:
+        """Validiert .arb-Inhalt aus dem Speicher (filepath nur für Meldungen)"""
+        data = self.parse_content(content, filepath, yaml_mode)
+        if data is None:
+            return False
+        
+        return self.validate_data(data, filepath)
+
+    def validate_data(self, data: Dict, filepath: str) -> bool:
+        """Führt alle ARB-spezifischen Validierungen auf geparsten Daten aus"""
         self.validate_arb_structure(data, filepath)
         self.validate_key_naming(data, filepath)
         self.validate_placeholders(data, filepath)
@@ -531,6 +582,31 @@ class ArbValidator:
         
         return report
 
+    def write_sarif(self, output_file: str):
+        """SARIF 2.1.0 für Code-Scanning (*.gz = gzip), ein Ergebnis pro Befund"""
+        sarif = SarifWriter(output_file, 'weltenwind-arb-validator')
+        for error in self.errors:
+            message = f"{error.message} - {error.suggestion}" if error.suggestion else error.message
+            sarif.add_result(error.code, SARIF_LEVELS.get(error.severity, 'note'), message,
+                             error.file_path, error.line)
+        sarif.close()
+
+    def record_findings(self, db: FindingsDB, filepath: str) -> Dict[str, int]:
+        """Schreibt alle Befunde als Lauf in die Findings-DB (Scope: die validierte Datei)
+
+        Gibt zurück, wie viele Befunde neu bzw. seit dem letzten Lauf behoben sind.
+        """
+        scope = relative_file(filepath, CLIENT_ROOT)
+        findings = db.start_run(VALIDATOR, scope, cwd=CLIENT_ROOT)
+        for error in self.errors:
+            findings.add(error.code, relative_file(error.file_path or filepath, CLIENT_ROOT), error.message,
+                         error.line, severity=error.severity, message=error.message,
+                         data={'suggestion': error.suggestion} if error.suggestion else None)
+        findings.finish({'errors': sum(1 for e in self.errors if e.severity == 'error'),
+                         'warnings': sum(1 for e in self.errors if e.severity == 'warning')})
+        delta = db.delta(VALIDATOR, scope)
+        return {'new': len(delta['new']), 'fixed': len(delta['fixed'])}
+
 def main():
     parser = argparse.ArgumentParser(description='Weltenwind .arb Validator (Enhanced)')
     parser.add_argument('file', help='.arb- oder .yaml-Datei zum Validieren')
@@ -544,10 +620,14 @@ def main():
                        help='✅ 3. Behandle Datei als YAML statt JSON')
     parser.add_argument('--json-report', 
                        help='✅ 4. Speichere JSON-Report für CI-Integration')
+    parser.add_argument('--sarif', metavar='FILE',
+                       help='Befunde als SARIF 2.1.0 speichern (Code-Scanning, *.gz = gzip)')
     parser.add_argument('--quiet', action='store_true',
                        help='✅ 4. Unterdrücke Konsolenausgabe, nur Exit-Code')
     parser.add_argument('--fail-on-warning', action='store_true',
                        help='✅ 4. Bricht auch bei Warnungen mit Exit 1 ab')
+    parser.add_argument('--db', nargs='?', const='', metavar='FILE',
+                       help='Befunde in die Findings-DB schreiben (Default: tools/.i18n_history/findings.db)')
     
     args = parser.parse_args()
     
@@ -590,7 +670,7 @@ def main():
     if args.json_report:
         report = validator.generate_json_report()
         try:
-            with open(args.json_report, 'w', encoding='utf-8') as f:
+            with open_output(args.json_report) as f:
                 json.dump(report, f, indent=2, ensure_ascii=False)
             if not args.quiet:
                 print(f"📊 JSON-Report gespeichert: {args.json_report}")
@@ -598,6 +678,22 @@ def main():
             if not args.quiet:
                 print(f"❌ Fehler beim Speichern des JSON-Reports: {e}")
     
+    if args.sarif:
+        try:
+            validator.write_sarif(args.sarif)
+            if not args.quiet:
+                print(f"🛡️ SARIF gespeichert: {args.sarif}")
+        except Exception as e:
+            if not args.quiet:
+                print(f"❌ Fehler beim Speichern des SARIF-Reports: {e}")
+    
+    if args.db is not None:
+        db = FindingsDB(Path(args.db) if args.db else default_db_file(CLIENT_ROOT))
+        delta = validator.record_findings(db, args.file)
+        db.close()
+        if not args.quiet:
+            print(f"🗃️ Findings-DB: {delta['new']} neu, {delta['fixed']} behoben seit dem letzten Lauf")
+    
     # Bericht ausgeben
     report_success = validator.print_report(args.quiet)
     
@@ -11,6 +11,8 @@ import re
 from pathlib import Path
 from typing import Set, Dict, List
 
+from i18n_source_walker import SourceWalker
+
 def extract_applocalization_keys(dart_files: List[Path]) -> Set[str]:
     """Extrahiert alle AppLocalizations.of(context)!.xyz Keys aus Dart-Dateien"""
     keys = set()
@@ -47,7 +49,8 @@ def main():
     l10n_dir = lib_dir / "l10n"
     
     print("🔍 Suche alle .dart-Dateien...")
-    dart_files = list(lib_dir.rglob("*.dart"))
+    # Gleicher Durchlauf wie der Extractor: ohne ignorierte und generierte Dateien
+    dart_files = [source.path for source in SourceWalker(lib_dir).files() if not source.generated]
     print(f"📂 {len(dart_files)} Dart-Dateien gefunden")
     
     print("\n🎯 Extrahiere AppLocalizations-Keys aus Code...")
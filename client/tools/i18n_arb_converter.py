@@ -3,7 +3,7 @@
 Weltenwind i18n ARB Converter
 Konvertiert extrahierte deutsche Strings automatisch in .arb-Dateien
 
-Usage: python i18n_arb_converter.py [--source report.json] [--auto-translate] [--update-code]
+Usage: python i18n_arb_converter.py [--source report.json|report.jsonl|-] [--auto-translate] [--update-code] [--merge-similar]
 """
 
 import json
@@ -11,10 +11,19 @@ import re
 import argparse
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Set, Optional, Tuple
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 import shutil
 
+from i18n_key_allocator import KeyAllocator
+from i18n_report_writers import open_input
+from i18n_near_duplicates import DEFAULT_THRESHOLD, arb_members, canonical_keys, cluster_strings, extraction_members
+from i18n_value_index import ValueIndex
+
+# Obergrenze des Übersetzungs-Memos (eindeutige deutsche Texte)
+TRANSLATION_MEMO_SIZE = 1 << 16
+
 @dataclass
 class StringConversion:
     key: str
@@ -26,12 +35,14 @@ class StringConversion:
     line_numbers: List[int]
     success: bool = False
     error_message: Optional[str] = None
+    reuses_key: bool = False  # Key eines gleichen oder fast gleichen Textes, kein neuer .arb-Eintrag
 
 class I18nArbConverter:
     def __init__(self, client_root: str = ".", lib_dir: str = "lib"):
         self.client_root = Path(client_root)
         self.lib_dir = self.client_root / lib_dir
         self.l10n_dir = self.lib_dir / "l10n"
+        self.last_dedup_stats = {'total': 0, 'unique': 0, 'renamed': 0}
         
         # Einfache Übersetzungs-Mappings (kann erweitert werden)
         self.translation_mappings = {
@@ -100,15 +111,51 @@ class I18nArbConverter:
             'Erforderlich': 'Required',
             'Optional': 'Optional',
         }
+        
+        # Mappings einmal vorbereiten, Übersetzungen pro eindeutigem Text nur einmal berechnen
+        self._exact_translations = {}
+        for german, english in self.translation_mappings.items():
+            self._exact_translations.setdefault(german.lower(), english)
+        self._translation_patterns = [(re.compile(re.escape(german), re.IGNORECASE), english)
+                                      for german, english in self.translation_mappings.items()]
+        self._translation_memo = lru_cache(maxsize=TRANSLATION_MEMO_SIZE)(self._translate)
     
     def load_extraction_report(self, report_path: str) -> List[Dict]:
         """Lädt den JSON-Report vom String-Extractor"""
+        return list(self.iter_extraction_report(report_path))
+    
+    def iter_extraction_report(self, report_path: str) -> Iterator[Dict]:
+        """Liest Extractions lazy: JSON Lines (auch "-" = stdin) oder JSON-Array
+        
+        JSON Lines werden Zeile für Zeile verarbeitet, sobald sie ankommen;
+        ein klassischer JSON-Array-Report wird wie bisher komplett geladen.
+        Reports auf .gz werden beim Lesen entpackt.
+        """
         try:
-            with open(report_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            if report_path == '-':
+                yield from self._iter_jsonl(sys.stdin, '<stdin>')
+                return
+            
+            with open_input(report_path) as f:
+                first_char = f.read(1)
+                while first_char and first_char.isspace():
+                    first_char = f.read(1)
+                f.seek(0)
+                if first_char == '[':
+                    yield from json.load(f)
+                else:
+                    yield from self._iter_jsonl(f, report_path)
         except Exception as e:
             print(f"❌ Fehler beim Laden des Reports: {e}")
-            return []
+    
+    def _iter_jsonl(self, stream, source: str) -> Iterator[Dict]:
+        for line_num, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"⚠️ Ungültige JSONL-Zeile {source}:{line_num} übersprungen: {e}")
     
     def load_existing_arb(self, lang: str) -> Tuple[Dict, Set[str]]:
         """Lädt existierende .arb-Datei und extrahiert Keys"""
@@ -129,18 +176,19 @@ class I18nArbConverter:
             return {}, set()
     
     def generate_english_translation(self, german_text: str) -> str:
-        """Generiert eine einfache englische Übersetzung"""
-        
+        """Generiert eine einfache englische Übersetzung (memoisiert)"""
+        return self._translation_memo(german_text)
+    
+    def _translate(self, german_text: str) -> str:
         # Exakte Übereinstimmungen
-        for german, english in self.translation_mappings.items():
-            if german.lower() == german_text.lower().strip():
-                return english
+        exact = self._exact_translations.get(german_text.lower().strip())
+        if exact is not None:
+            return exact
         
         # Teilweise Übereinstimmungen (für längere Texte)
         english_text = german_text
-        for german, english in self.translation_mappings.items():
+        for pattern, english in self._translation_patterns:
             # Case-insensitive replacement, aber behält Groß-/Kleinschreibung bei
-            pattern = re.compile(re.escape(german), re.IGNORECASE)
             english_text = pattern.sub(english, english_text)
         
         # Fallback: Englische Übersetzung placeholder
@@ -150,28 +198,78 @@ class I18nArbConverter:
         
         return english_text
     
-    def deduplicate_keys(self, extractions: List[Dict]) -> List[Dict]:
-        """Entfernt Duplikate basierend auf suggested_key"""
-        seen_keys = set()
-        unique_extractions = []
+    def deduplicate_keys(self, extractions: Iterable[Dict],
+                         allocator: Optional[KeyAllocator] = None) -> List[Dict]:
+        """Entfernt Duplikate basierend auf suggested_key
+        
+        Keys werden vorher über den Allocator vergeben: Verschiedene Texte mit
+        gleichem suggested_key bekommen einen Hash-Suffix statt verworfen zu
+        werden, ein gleicher Key heißt damit gleicher Text. Behält pro Key nur
+        die Extraction mit der höchsten Konfidenz (bei Gleichstand die zuerst
+        gelesene). Der Speicherbedarf hängt damit von der Zahl der Keys ab,
+        nicht von der Zahl der Treffer.
+        """
+        if allocator is None:
+            allocator = KeyAllocator()
+        # key -> (Konfidenz, Lese-Reihenfolge, Extraction)
+        best: Dict[str, Tuple[float, int, Dict]] = {}
+        total = 0
+        renamed = 0
+        
+        for order, extraction in enumerate(extractions):
+            total += 1
+            if extraction.get('localized_as'):
+                # Vorhandener Key aus der .arb-Datei, wird nicht neu vergeben
+                key = extraction['suggested_key']
+            else:
+                key = allocator.allocate(extraction['suggested_key'], extraction['original'])
+            if key != extraction['suggested_key']:
+                print(f"🔑 Key-Kollision: {extraction['suggested_key']} → {key}")
+                extraction['suggested_key'] = key
+                renamed += 1
+            confidence = extraction['confidence']
+            current = best.get(key)
+            if current is None:
+                best[key] = (confidence, order, extraction)
+                continue
+            
+            print(f"⚠️ Duplikat-Key übersprungen: {key}")
+            if confidence > current[0]:
+                best[key] = (confidence, order, extraction)
         
-        # Sortiere nach Konfidenz (höchste zuerst)
-        sorted_extractions = sorted(extractions, key=lambda x: x['confidence'], reverse=True)
+        self.last_dedup_stats = {'total': total, 'unique': len(best), 'renamed': renamed}
         
-        for extraction in sorted_extractions:
-            key = extraction['suggested_key']
-            if key not in seen_keys:
-                seen_keys.add(key)
-                unique_extractions.append(extraction)
+        # Höchste Konfidenz zuerst, sonst Lese-Reihenfolge
+        ranked = sorted(best.values(), key=lambda item: (-item[0], item[1]))
+        return [extraction for _, _, extraction in ranked]
+    
+    def mark_localized(self, extractions: Iterable[Dict], values: ValueIndex) -> Iterator[Dict]:
+        """Setzt localized_as für Texte, die schon in einer .arb-Datei stehen
+
+        Der Index ist maßgeblich, nicht der Report: eine Markierung aus einem
+        älteren Report fällt weg, wenn der Text inzwischen nicht mehr übersetzt ist.
+        """
+        for extraction in extractions:
+            key = values.lookup(extraction['original'])
+            if key is not None:
+                extraction['localized_as'] = key
+                extraction['suggested_key'] = key
             else:
-                print(f"⚠️ Duplikat-Key übersprungen: {key}")
-        
-        return unique_extractions
+                extraction.pop('localized_as', None)
+            yield extraction
     
-    def convert_extractions_to_arb(self, extractions: List[Dict], 
+    def convert_extractions_to_arb(self, extractions: Iterable[Dict], 
                                   confidence_threshold: float = 0.7,
-                                  auto_translate: bool = False) -> List[StringConversion]:
-        """Konvertiert Extractions in .arb-Format"""
+                                  auto_translate: bool = False,
+                                  merge_similar: bool = False,
+                                  similarity: float = DEFAULT_THRESHOLD) -> List[StringConversion]:
+        """Konvertiert Extractions in .arb-Format
+
+        Texte, die schon in einer .arb-Datei stehen (siehe i18n_value_index),
+        verwenden deren Key weiter. Mit merge_similar bekommen fast gleiche Texte
+        (siehe i18n_near_duplicates) den kanonischen Key ihres Clusters statt
+        eines eigenen Eintrags.
+        """
         
         conversions = []
         
@@ -179,24 +277,65 @@ class I18nArbConverter:
         de_data, de_keys = self.load_existing_arb('de')
         en_data, en_keys = self.load_existing_arb('en')
         
+        # Keys gegen die .arb-Datei vergeben: existierender Key nur bei gleichem Text
+        existing = {key: de_data[key] for key in de_keys}
+        values = ValueIndex.load(self.l10n_dir)
+        
         # Dedupliziere und filtere nach Konfidenz
-        unique_extractions = self.deduplicate_keys(extractions)
+        unique_extractions = self.deduplicate_keys(self.mark_localized(extractions, values), KeyAllocator(existing))
         filtered_extractions = [e for e in unique_extractions if e['confidence'] >= confidence_threshold]
         
+        print(f"✅ {self.last_dedup_stats['total']} Extractions geladen")
         print(f"🔍 {len(unique_extractions)} einzigartige Strings")
         print(f"🎯 {len(filtered_extractions)} Strings über Konfidenz-Schwelle ({confidence_threshold})")
         
+        similar = {}
+        if merge_similar:
+            clusters, _ = cluster_strings(arb_members(de_data) + extraction_members(filtered_extractions),
+                                          similarity)
+            similar = canonical_keys(clusters)
+            print(f"🧩 {len(clusters)} Cluster fast gleicher Texte (Ähnlichkeit ≥ {similarity})")
+        
         for extraction in filtered_extractions:
             key = extraction['suggested_key']
             german_text = extraction['original']
             category = extraction['category']
             confidence = extraction['confidence']
             
+            if extraction.get('localized_as'):
+                print(f"♻️ Bereits lokalisiert: \"{german_text}\" → {key}")
+                conversions.append(StringConversion(
+                    key=key,
+                    german_text=german_text,
+                    english_text='',
+                    category=category,
+                    confidence=confidence,
+                    files_to_update=[extraction['file']],
+                    line_numbers=[extraction['line']],
+                    reuses_key=True
+                ))
+                continue
+            
             # Überspringe bereits existierende Keys
             if key in de_keys:
                 print(f"⏭️ Überspringe existierenden Key: {key}")
                 continue
             
+            cluster = similar.get(key)
+            if cluster is not None:
+                print(f"♻️ {key} → {cluster.canonical_key}: \"{german_text}\" ≈ \"{cluster.canonical_text}\"")
+                conversions.append(StringConversion(
+                    key=cluster.canonical_key,
+                    german_text=german_text,
+                    english_text='',
+                    category=category,
+                    confidence=confidence,
+                    files_to_update=[extraction['file']],
+                    line_numbers=[extraction['line']],
+                    reuses_key=True
+                ))
+                continue
+            
             # Generiere englische Übersetzung
             if auto_translate:
                 english_text = self.generate_english_translation(german_text)
@@ -216,6 +355,12 @@ class I18nArbConverter:
             
             conversions.append(conversion)
         
+        if auto_translate:
+            info = self._translation_memo.cache_info()
+            lookups = info.hits + info.misses
+            if lookups:
+                print(f"🧠 Übersetzungs-Memo: {info.hits / lookups:.0%} Treffer ({info.currsize} eindeutige Texte)")
+        
         return conversions
     
     def update_arb_files(self, conversions: List[StringConversion], 
@@ -243,6 +388,10 @@ class I18nArbConverter:
         successful_conversions = 0
         
         for conversion in conversions:
+            if conversion.reuses_key:
+                # Eintrag existiert bereits oder kommt vom kanonischen Text des Clusters
+                conversion.success = True
+                continue
             try:
                 key = conversion.key
                 
@@ -448,7 +597,7 @@ def main():
     parser = argparse.ArgumentParser(description='Weltenwind i18n ARB Converter')
     parser.add_argument('--source', '-s', 
                        default='i18n_extraction_report.json',
-                       help='Pfad zum JSON-Report des String-Extractors')
+                       help='Pfad zum JSON/JSONL-Report des String-Extractors ("-" = stdin, *.gz = gzip)')
     parser.add_argument('--confidence', '-c', type=float, default=0.7,
                        help='Minimale Konfidenz für String-Konvertierung (0.0-1.0)')
     parser.add_argument('--auto-translate', action='store_true',
@@ -459,6 +608,10 @@ def main():
                        help='Zeige nur was geändert würde, ohne Dateien zu modifizieren')
     parser.add_argument('--no-backup', action='store_true',
                        help='Keine Backups erstellen')
+    parser.add_argument('--merge-similar', action='store_true',
+                       help='Fast gleiche Texte auf einen kanonischen Key zusammenlegen')
+    parser.add_argument('--similarity', type=float, default=DEFAULT_THRESHOLD,
+                       help='Minimale Ähnlichkeit für --merge-similar (Jaccard der 3-Gramme, 0.0-1.0)')
     parser.add_argument('--output-report', default='conversion_report.json',
                        help='Pfad für Zusammenfassungsbericht')
     
@@ -468,31 +621,31 @@ def main():
     print("=" * 50)
     
     # Prüfe ob Source-Report existiert
-    if not Path(args.source).exists():
+    if args.source != '-' and not Path(args.source).exists():
         print(f"❌ Source-Report nicht gefunden: {args.source}")
-        print("💡 Führe zuerst 'python i18n_string_extractor.py --json' aus")
+        print("💡 Führe zuerst 'python i18n_string_extractor.py --jsonl report.jsonl' aus")
         sys.exit(1)
     
     converter = I18nArbConverter()
     
-    # 1. Lade Extraction-Report
-    print(f"📊 Lade Report: {args.source}")
-    extractions = converter.load_extraction_report(args.source)
-    
-    if not extractions:
-        print("❌ Keine Extractions im Report gefunden")
-        sys.exit(1)
-    
-    print(f"✅ {len(extractions)} Extractions geladen")
+    # 1. Extraction-Report lazy lesen (wird während der Konvertierung konsumiert)
+    print(f"📊 Lese Report: {args.source}")
+    extractions = converter.iter_extraction_report(args.source)
     
     # 2. Konvertiere zu .arb-Format
     print(f"🔄 Konvertiere Strings (Konfidenz ≥ {args.confidence})...")
     conversions = converter.convert_extractions_to_arb(
         extractions, 
         confidence_threshold=args.confidence,
-        auto_translate=args.auto_translate
+        auto_translate=args.auto_translate,
+        merge_similar=args.merge_similar,
+        similarity=args.similarity
     )
     
+    if converter.last_dedup_stats['total'] == 0:
+        print("❌ Keine Extractions im Report gefunden")
+        sys.exit(1)
+    
     if not conversions:
         print("ℹ️ Keine neuen Strings zum Konvertieren gefunden")
         sys.exit(0)
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Benchmark Suite
+Misst Durchsatz und Peak-RSS der i18n-Tools auf synthetischen Flutter-Projekten
+
+Erzeugt pro Größe ein reproduzierbares Projekt (N Dart-Dateien, ARB-Kataloge
+mit N Keys in mehreren Sprachen, passender Extraktions-Report) und führt jede
+Messung in einem frischen Prozess aus. Gemessen wird nur die Operation selbst,
+Peak-RSS gilt für den ganzen Messprozess. Ergebnisse landen als JSON und
+lassen sich mit --compare gegen einen früheren Lauf vergleichen.
+
+Usage: python client/tools/i18n_benchmark.py [--sizes 1000 10000] [--locales 3] [--compare alt.json]
+"""
+
+import io
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import multiprocessing
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCHMARKS = ('scan_all_files', 'convert_extractions_to_arb', 'update_dart_files',
+              'validate_file', 'compare_with_reference', 'find_missing_keys')
+
+LOCALES = ('de', 'en', 'fr', 'es', 'it', 'nl', 'pl', 'pt')
+
+# Bausteine für UI-Texte (treffen die German-Patterns wie echte Strings)
+_NOUNS = ('Welt', 'Einladung', 'Spieler', 'Einstellungen', 'Nachricht', 'Gilde', 'Karte',
+          'Aufgabe', 'Profil', 'Rangliste', 'Belohnung', 'Sitzung')
+_PHRASES = ('Bitte {noun} auswählen', '{noun} konnte nicht geladen werden',
+            'Möchten Sie die {noun} wirklich löschen?', 'Fehler beim Speichern der {noun}',
+            'Neue {noun} erstellen', 'Die {noun} wurde erfolgreich geändert',
+            '{noun} {index} beitreten', 'Zurück zur {noun}', 'Keine {noun} verfügbar')
+_CATEGORIES = ('auth', 'world', 'invite', 'error', 'button', 'dialog', 'form', 'navigation', 'ui')
+_WIDGETS = ('Text', 'ElevatedButton', 'AlertDialog', 'TextFormField', 'ListTile', 'SnackBar')
+
+@dataclass
+class CorpusInfo:
+    root: str
+    files: int
+    keys: int
+    locales: int
+    bytes: int = 0
+    literals: int = 0
+
+@dataclass
+class BenchmarkResult:
+    benchmark: str
+    files: int
+    keys: int
+    locales: int
+    items: int
+    unit: str
+    seconds: float
+    throughput: float
+    peak_rss_mb: Optional[float]
+
+# --- Synthetisches Projekt ---
+
+def _ui_text(rng: random.Random, index: int) -> str:
+    return rng.choice(_PHRASES).format(noun=rng.choice(_NOUNS), index=index)
+
+def _arb_key(index: int) -> str:
+    category = _CATEGORIES[index % len(_CATEGORIES)]
+    return f"{category}{_NOUNS[index % len(_NOUNS)]}Label{index}"
+
+def generate_arb_catalogs(l10n_dir: Path, keys: int, locales: int, rng: random.Random) -> List[str]:
+    """Schreibt app_<locale>.arb mit keys Einträgen; Nicht-Referenz-Sprachen sind zu ~98% übersetzt"""
+    l10n_dir.mkdir(parents=True, exist_ok=True)
+    key_names = [_arb_key(index) for index in range(keys)]
+    texts = [_ui_text(rng, index) for index in range(keys)]
+
+    for locale in LOCALES[:locales]:
+        data = {'@@locale': locale, '@@context': 'weltenwind-game'}
+        for index, key in enumerate(key_names):
+            if locale != 'de' and rng.random() < 0.02:
+                continue
+            text = texts[index] if locale == 'de' else f"[{locale}] {texts[index]}"
+            if index % 10 == 0:
+                text += ' ({count})'
+                data[key] = text
+                data[f'@{key}'] = {'description': f'Text {index}', 'context': key_names[index][:4],
+                                   'placeholders': {'count': {'type': 'int'}}}
+            else:
+                data[key] = text
+                data[f'@{key}'] = {'description': f'Text {index}', 'context': key_names[index][:4]}
+        with open(l10n_dir / f'app_{locale}.arb', 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    return key_names
+
+def _dart_file(rng: random.Random, index: int, key_names: List[str],
+               extractions: List[Dict], rel_path: str) -> str:
+    lines = [
+        "import 'package:flutter/material.dart';",
+        "import '../../l10n/app_localizations.dart';",
+        "import '../../core/services/app_logger.dart';",
+        "",
+        f"/// Synthetische Seite {index}",
+        f"class Feature{index}Page extends StatelessWidget {{",
+        f"  const Feature{index}Page({{super.key}});",
+        "",
+        f"  static const String routeName = '/feature/{index}';",
+        "",
+        "  @override",
+        "  Widget build(BuildContext context) {",
+        "    return Scaffold(",
+    ]
+
+    def localized_key() -> str:
+        # ~3% der Aufrufe verweisen auf Keys, die es in den ARB-Dateien nicht gibt
+        if not key_names or rng.random() < 0.03:
+            return f"missingKey{rng.randrange(1000)}"
+        return rng.choice(key_names)
+
+    lines.append(f"      appBar: AppBar(title: Text(AppLocalizations.of(context)!.{localized_key()})),")
+    lines.append("      body: Column(")
+    lines.append("        children: [")
+    for block in range(rng.randint(3, 12)):
+        widget = rng.choice(_WIDGETS)
+        if rng.random() < 0.4:
+            text = _ui_text(rng, block)
+            quote = rng.choice(("'", '"'))
+            extractions.append({
+                'file': rel_path,
+                'line': len(lines) + 1,
+                'original': text,
+                'suggested_key': f"{rng.choice(_CATEGORIES)}{text.split()[0].capitalize()}{index}x{block}",
+                'category': rng.choice(_CATEGORIES),
+                'confidence': round(rng.uniform(0.6, 1.0), 2)
+            })
+            lines.append(f"          {widget}(child: Text({quote}{text}{quote})),")
+        else:
+            lines.append(f"          {widget}(child: Text(AppLocalizations.of(context)!.{localized_key()})),")
+        if rng.random() < 0.2:
+            lines.append(f"          // TODO: Layout für Block {block} prüfen")
+    lines.extend([
+        "        ],",
+        "      ),",
+        "    );",
+        "  }",
+        "",
+        "  void _log(String message) {",
+        f"    AppLogger.app.i('feature_{index}: $message', error: {{'id': {index}}});",
+        "  }",
+        "}",
+        ""
+    ])
+    return '\n'.join(lines)
+
+def generate_corpus(root: Path, files: int, keys: int, locales: int, seed: int = 42) -> CorpusInfo:
+    """Erzeugt ein reproduzierbares Flutter-Projekt unter root (lib/, lib/l10n/, extractions.jsonl)"""
+    rng = random.Random(seed)
+    lib_dir = root / 'lib'
+    key_names = generate_arb_catalogs(lib_dir / 'l10n', keys, locales, rng)
+
+    info = CorpusInfo(root=str(root), files=files, keys=keys, locales=locales)
+    extractions: List[Dict] = []
+    features = max(1, files // 50)
+    for index in range(files):
+        feature_dir = lib_dir / 'features' / f'feature_{index % features}'
+        feature_dir.mkdir(parents=True, exist_ok=True)
+        path = feature_dir / f'page_{index}.dart'
+        content = _dart_file(rng, index, key_names, extractions, path.relative_to(root).as_posix())
+        data = content.encode('utf-8')
+        path.write_bytes(data)
+        info.bytes += len(data)
+    info.literals = len(extractions)
+
+    with open(root / 'extractions.jsonl', 'w', encoding='utf-8') as f:
+        for extraction in extractions:
+            f.write(json.dumps(extraction, ensure_ascii=False) + '\n')
+    return info
+
+# --- Messungen (laufen im eigenen Prozess) ---
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux meldet KiB, macOS Bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def _measure(name: str, root: Path, jobs: int) -> Tuple[int, str, float]:
+    """Führt eine Messung aus und liefert (Anzahl, Einheit, Sekunden der Operation)"""
+    from i18n_string_extractor import I18nStringExtractor
+    from i18n_arb_converter import I18nArbConverter
+    from arb_validator import ArbValidator
+    from find_missing_keys import extract_applocalization_keys, load_arb_keys
+    from i18n_source_walker import SourceWalker
+
+    l10n_dir = root / 'lib' / 'l10n'
+    clock = time.perf_counter
+
+    if name == 'scan_all_files':
+        extractor = I18nStringExtractor(str(root))
+        started = clock()
+        extractor.scan_all_files(jobs=jobs)
+        return extractor.last_scan_stats.get('files_total', 0), 'files', clock() - started
+
+    if name in ('convert_extractions_to_arb', 'update_dart_files'):
+        converter = I18nArbConverter(str(root))
+        extractions = converter.iter_extraction_report(str(root / 'extractions.jsonl'))
+        started = clock()
+        conversions = converter.convert_extractions_to_arb(extractions, confidence_threshold=0.0)
+        if name == 'convert_extractions_to_arb':
+            return converter.last_dedup_stats['total'], 'extractions', clock() - started
+
+        for conversion in conversions:
+            conversion.success = True
+        started = clock()
+        converter.update_dart_files(conversions, backup=False, dry_run=True)
+        return len(conversions), 'conversions', clock() - started
+
+    if name == 'validate_file':
+        validator = ArbValidator()
+        started = clock()
+        validator.validate_file(str(l10n_dir / 'app_de.arb'))
+        return len(load_arb_keys(l10n_dir / 'app_de.arb')), 'keys', clock() - started
+
+    if name == 'compare_with_reference':
+        validator = ArbValidator()
+        started = clock()
+        validator.compare_with_reference(str(l10n_dir / 'app_en.arb'), str(l10n_dir / 'app_de.arb'))
+        return len(load_arb_keys(l10n_dir / 'app_de.arb')), 'keys', clock() - started
+
+    if name == 'find_missing_keys':
+        started = clock()
+        dart_files = [source.path for source in SourceWalker(root / 'lib').files() if not source.generated]
+        used_keys = extract_applocalization_keys(dart_files)
+        missing = {path.stem: used_keys - load_arb_keys(path) for path in l10n_dir.glob('app_*.arb')}
+        return len(dart_files), 'files', clock() - started
+
+    raise ValueError(f"Unbekannter Benchmark: {name}")
+
+def _benchmark_worker(name: str, root: str, jobs: int, connection):
+    # Tool-Ausgaben (pro Datei/Key) würden die Messung dominieren
+    with contextlib.redirect_stdout(io.StringIO()):
+        items, unit, seconds = _measure(name, Path(root), jobs)
+    connection.send((items, unit, seconds, _peak_rss_mb()))
+
+def run_benchmark(name: str, corpus: CorpusInfo, jobs: int = 1) -> BenchmarkResult:
+    """Misst einen Benchmark in einem frisch gestarteten Prozess (saubere Peak-RSS)"""
+    context = multiprocessing.get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    worker = context.Process(target=_benchmark_worker, args=(name, corpus.root, jobs, sender))
+    worker.start()
+    sender.close()
+    try:
+        items, unit, seconds, peak_rss = receiver.recv()
+    except EOFError:
+        raise RuntimeError(f"Benchmark {name} abgebrochen (Exit-Code {worker.exitcode})")
+    finally:
+        worker.join()
+    return BenchmarkResult(
+        benchmark=name,
+        files=corpus.files,
+        keys=corpus.keys,
+        locales=corpus.locales,
+        items=items,
+        unit=unit,
+        seconds=round(seconds, 4),
+        throughput=round(items / seconds, 1) if seconds > 0 else 0.0,
+        peak_rss_mb=peak_rss
+    )
+
+# --- Ausgabe ---
+
+def _git_commit(cwd: Path) -> Optional[str]:
+    from i18n_git import GitError, run_git
+    try:
+        return run_git(['rev-parse', 'HEAD'], cwd).decode('ascii').strip()
+    except GitError:
+        return None
+
+def compare_results(previous: Dict, current: Dict):
+    """Durchsatz-Verhältnis pro Benchmark und Größe gegenüber einem früheren Lauf"""
+    def index(data: Dict) -> Dict[Tuple, Dict]:
+        return {(r['benchmark'], r['files'], r['keys'], r['locales']): r for r in data.get('results', [])}
+
+    old = index(previous)
+    print(f"\n📈 Vergleich mit {(previous.get('commit') or '?')[:10]}")
+    print(f"{'Benchmark':<28}{'Größe':>8}{'alt/s':>12}{'neu/s':>12}{'Faktor':>8}{'RSS Δ MB':>10}")
+    for key, result in index(current).items():
+        before = old.get(key)
+        if before is None or not before['throughput']:
+            continue
+        ratio = result['throughput'] / before['throughput']
+        marker = '🔻' if ratio < 0.9 else ('🔺' if ratio > 1.1 else '  ')
+        rss_delta = ''
+        if result['peak_rss_mb'] is not None and before.get('peak_rss_mb') is not None:
+            rss_delta = f"{result['peak_rss_mb'] - before['peak_rss_mb']:+.1f}"
+        print(f"{marker}{result['benchmark']:<26}{result['files']:>8}{before['throughput']:>12.0f}"
+              f"{result['throughput']:>12.0f}{ratio:>8.2f}{rss_delta:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Benchmark Suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000],
+                       help='Projektgrößen: je N Dart-Dateien und N ARB-Keys (z.B. 1000 10000 100000)')
+    parser.add_argument('--locales', type=int, default=2,
+                       help=f'Anzahl ARB-Sprachen (2-{len(LOCALES)}, de ist Referenz)')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS,
+                       help='Nur diese Benchmarks ausführen')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Scan-Prozesse für scan_all_files (0 = alle CPU-Kerne)')
+    parser.add_argument('--seed', type=int, default=42,
+                       help='Seed für das synthetische Projekt')
+    parser.add_argument('--workdir',
+                       help='Verzeichnis für die generierten Projekte (Default: temporär, wird gelöscht)')
+    parser.add_argument('--output', '-o', default='i18n_benchmark.json',
+                       help='JSON-Ergebnisdatei')
+    parser.add_argument('--compare', metavar='FILE',
+                       help='Früheres Ergebnis-JSON zum Vergleich')
+    args = parser.parse_args()
+
+    if not 2 <= args.locales <= len(LOCALES):
+        parser.error(f'--locales muss zwischen 2 und {len(LOCALES)} liegen')
+
+    print("🏁 Weltenwind i18n Benchmark Suite")
+    print("=" * 60)
+
+    keep = args.workdir is not None
+    workdir = Path(args.workdir) if keep else Path(tempfile.mkdtemp(prefix='i18n_bench_'))
+    results: List[BenchmarkResult] = []
+    corpora: List[CorpusInfo] = []
+    try:
+        for size in args.sizes:
+            root = workdir / f'project_{size}'
+            if root.exists():
+                shutil.rmtree(root)
+            started = time.perf_counter()
+            corpus = generate_corpus(root, files=size, keys=size, locales=args.locales, seed=args.seed)
+            corpora.append(corpus)
+            print(f"\n🏗️ Projekt {size}: {corpus.files} Dateien ({corpus.bytes / 1e6:.1f} MB), "
+                  f"{corpus.keys} Keys × {corpus.locales} Sprachen, {corpus.literals} Literale "
+                  f"({time.perf_counter() - started:.1f} s)")
+            for name in args.only or BENCHMARKS:
+                result = run_benchmark(name, corpus, jobs=args.jobs)
+                results.append(result)
+                rss = f"{result.peak_rss_mb:.1f} MB" if result.peak_rss_mb is not None else '-'
+                print(f"   ⏱️ {name:<28}{result.seconds:>9.3f} s {result.throughput:>12.0f} "
+                      f"{result.unit}/s   Peak-RSS {rss}")
+    finally:
+        if not keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'commit': _git_commit(Path(__file__).resolve().parent),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'jobs': args.jobs,
+        'corpora': [asdict(corpus) for corpus in corpora],
+        'results': [asdict(result) for result in results]
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n📊 Ergebnisse gespeichert: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Weltenwind Dart Lexer
+Zerlegt Dart-Quelltext in einem einzigen Durchlauf in String-Literale
+
+Unterstützt '...', "...", '''...''', \"\"\"...\"\"\", Raw-Strings (r'...'),
+${...}-Interpolation (inkl. verschachtelter Strings) und Kommentare.
+Sehr große Dateien lassen sich fensterweise lexen (lex_window).
+
+Dazu ein Klammer-Index, der für jeden Offset die umschließenden
+Konstruktor-Aufrufe und benannten Argumente liefert (Widget-Kontext).
+"""
+
+import re
+import bisect
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+
+@dataclass
+class DartStringLiteral:
+    start: int          # Offset des öffnenden Quotes (ohne r-Prefix)
+    body_start: int     # Offset des ersten Zeichens im String
+    body_end: int       # Offset hinter dem letzten Zeichen im String
+    end: int            # Offset hinter dem schließenden Quote
+    quote: str          # '"' oder "'"
+    triple: bool = False
+    raw: bool = False
+    terminated: bool = True
+
+    def body(self, content: str) -> str:
+        """Gibt den Roh-Inhalt zwischen den Quotes zurück (inkl. ${...})"""
+        return content[self.body_start:self.body_end]
+
+class LineIndex:
+    """Zeilenanfänge einer Datei: Offset → (Zeile, Spalte) per bisect statt count()"""
+
+    __slots__ = ('line_starts', 'length')
+
+    def __init__(self, content: str):
+        line_starts = [0]
+        find = content.find
+        newline = find('\n')
+        while newline >= 0:
+            line_starts.append(newline + 1)
+            newline = find('\n', newline + 1)
+        self.line_starts = line_starts
+        self.length = len(content)
+
+    def line_of(self, offset: int) -> int:
+        """1-basierte Zeile eines Offsets"""
+        return bisect.bisect_right(self.line_starts, offset)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """1-basierte (Zeile, Spalte) eines Offsets"""
+        line = bisect.bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def line_span(self, first_line: int, last_line: int) -> Tuple[int, int]:
+        """Offsets der Zeilen first_line..last_line (1-basiert, ohne letzten Zeilenumbruch)"""
+        first_line = max(1, first_line)
+        last_line = min(len(self.line_starts), last_line)
+        start = self.line_starts[first_line - 1]
+        end = self.line_starts[last_line] - 1 if last_line < len(self.line_starts) else self.length
+        return start, end
+
+# Code-Modus: nur Kommentare, String-Anfänge und Klammern sind interessant
+_CODE_TOKEN = re.compile(r'//|/\*|r?(?:"""|\'\'\'|"|\')|[{}]')
+_BLOCK_COMMENT_TOKEN = re.compile(r'/\*|\*/')
+
+# String-Modus: (quote, triple, raw) -> nächstes relevantes Token im String-Inhalt
+_BODY_TOKENS = {
+    ('"', False, False): re.compile(r'[\\"\n]|\$\{'),
+    ("'", False, False): re.compile(r"[\\'\n]|\$\{"),
+    ('"', True, False): re.compile(r'\\|"""|\$\{'),
+    ("'", True, False): re.compile(r"\\|'''|\$\{"),
+    ('"', False, True): re.compile(r'["\n]'),
+    ("'", False, True): re.compile(r"['\n]"),
+    ('"', True, True): re.compile(r'"""'),
+    ("'", True, True): re.compile(r"'''"),
+}
+
+def _is_identifier_char(char: str) -> bool:
+    return char.isalnum() or char in '_$'
+
+def _skip_block_comment(content: str, pos: int) -> int:
+    """Überspringt einen (in Dart verschachtelbaren) Block-Kommentar ab pos (hinter /*)"""
+    depth = 1
+    while depth:
+        token = _BLOCK_COMMENT_TOKEN.search(content, pos)
+        if token is None:
+            return len(content)
+        depth += 1 if token.group() == '/*' else -1
+        pos = token.end()
+    return pos
+
+# Längstes Code-Token (r""") - kürzere Treffer am Fensterende könnten abgeschnitten sein
+_MAX_CODE_TOKEN = 4
+
+def iter_string_literals(content: str) -> List[DartStringLiteral]:
+    """Liefert alle String-Literale einer Datei in Quelltext-Reihenfolge
+
+    Kommentare werden übersprungen. Strings innerhalb von ${...} werden als
+    eigene Literale geliefert; der Inhalt des äußeren Strings enthält die
+    Interpolation weiterhin als Text.
+    """
+    return lex_window(content)[0]
+
+def lex_window(content: str, start: int = 0,
+               stop: Optional[int] = None) -> Tuple[List[DartStringLiteral], Optional[int]]:
+    """Lext content ab start (im Code-Modus) und liefert (Literale, sichere Stelle)
+
+    Ohne stop ist content die ganze Datei. Mit stop ist content nur ein
+    Fenster einer größeren Datei: gelext wird bis zur ersten sicheren Stelle
+    ab stop - Code-Modus, kein offener String, keine offene Interpolation,
+    kein Token über das Fensterende hinaus. Ab dieser Stelle kann ein neues
+    Fenster mit frischem Zustand weiterlexen. Reicht das Fenster dafür nicht,
+    ist die sichere Stelle None (Fenster vergrößern). stop muss mindestens
+    _MAX_CODE_TOKEN Zeichen vor dem Fensterende liegen.
+    """
+    literals: List[DartStringLiteral] = []
+    length = len(content)
+    window = stop is not None
+    pos = start
+    depth = 0
+    # Offener String, dessen Inhalt gerade gelesen wird
+    current: Optional[Tuple[DartStringLiteral, re.Pattern]] = None
+    # Strings, die in einer ${...}-Interpolation unterbrochen wurden
+    suspended: List[Tuple[Tuple[DartStringLiteral, re.Pattern], int]] = []
+
+    while pos < length:
+        if current is not None:
+            literal, body_token = current
+            token = body_token.search(content, pos)
+            if token is None:
+                if window:
+                    return literals, None
+                # Nicht abgeschlossener String bis Dateiende
+                literal.body_end = literal.end = length
+                literal.terminated = False
+                current = None
+                break
+
+            text = token.group()
+            if text == '\\':
+                pos = token.end() + 1
+            elif text == '${':
+                suspended.append((current, depth))
+                current = None
+                depth = 0
+                pos = token.end()
+            elif text == '\n':
+                # Einzeiliger String ohne schließenden Quote
+                literal.body_end = literal.end = token.start()
+                literal.terminated = False
+                current = None
+                pos = token.start()
+            else:
+                literal.body_end = token.start()
+                literal.end = token.end()
+                current = None
+                pos = token.end()
+            continue
+
+        if window and not suspended:
+            if pos >= stop:
+                return literals, pos
+            token = _CODE_TOKEN.search(content, pos)
+            # Zwischen pos und stop liegt kein Token: stop ist selbst sicher
+            if token is None or token.start() >= stop:
+                return literals, stop
+        else:
+            token = _CODE_TOKEN.search(content, pos)
+            if token is None or (window and token.start() + _MAX_CODE_TOKEN > length):
+                if window:
+                    return literals, None
+                break
+
+        text = token.group()
+        if text == '//':
+            newline = content.find('\n', token.end())
+            if newline < 0 and window:
+                return literals, None
+            pos = length if newline < 0 else newline
+        elif text == '/*':
+            pos = _skip_block_comment(content, token.end())
+        elif text == '{':
+            depth += 1
+            pos = token.end()
+        elif text == '}':
+            if depth == 0 and suspended:
+                current, depth = suspended.pop()
+            elif depth > 0:
+                depth -= 1
+            pos = token.end()
+        else:
+            raw = text[0] == 'r'
+            quote_text = text[1:] if raw else text
+            quote_start = token.end() - len(quote_text)
+            # "r" als Ende eines Bezeichners ist kein Raw-Prefix
+            if raw and token.start() > 0 and _is_identifier_char(content[token.start() - 1]):
+                raw = False
+
+            triple = len(quote_text) == 3
+            literal = DartStringLiteral(
+                start=quote_start,
+                body_start=token.end(),
+                body_end=token.end(),
+                end=token.end(),
+                quote=quote_text[0],
+                triple=triple,
+                raw=raw
+            )
+            literals.append(literal)
+            current = (literal, _BODY_TOKENS[(literal.quote, triple, raw)])
+            pos = token.end()
+
+    if window:
+        # Fensterende innerhalb eines Strings, Kommentars oder einer Interpolation
+        return literals, None
+
+    # Dateiende innerhalb eines Strings oder einer Interpolation
+    open_literals = [state[0] for state, _ in suspended]
+    if current is not None:
+        open_literals.append(current[0])
+    for literal in open_literals:
+        literal.body_end = literal.end = length
+        literal.terminated = False
+
+    return literals, length
+
+@dataclass(frozen=True)
+class CallFrame:
+    bracket: str                # '(', '[' oder '{'
+    callee: Optional[str] = None  # z.B. 'ElevatedButton' oder 'Text.rich' (nur bei '(')
+    arg: Optional[str] = None     # aktuelles benanntes Argument, z.B. 'child'
+
+    @property
+    def is_constructor(self) -> bool:
+        """Type(...), prefix.Type(...) oder Type.named(...) - keine Methodenketten"""
+        if self.callee is None:
+            return False
+        # Dart-Konvention: Typen beginnen mit Großbuchstaben
+        parts = self.callee.split('.')
+        return parts[-1][0].isupper() or (len(parts) == 2 and parts[0][0].isupper())
+
+    def describe(self) -> str:
+        return f"{self.callee}.{self.arg}" if self.arg else self.callee
+
+# Code-Modus für den Klammer-Index: nur Klammern, Kommas, Doppelpunkte,
+# String-Anfänge und Kommentare; Namen werden vom Token aus rückwärts gelesen
+_INDEX_TOKEN = re.compile(r'[()\[\]{},:\'"]|/[/*]')
+_CLOSING = {')': '(', ']': '[', '}': '{'}
+_WHITESPACE = ' \t\r\n'
+_GENERIC_CHARS = set('<>,.? \t\r\n_$')
+
+def _skip_whitespace_back(content: str, pos: int) -> int:
+    while pos > 0 and content[pos - 1] in _WHITESPACE:
+        pos -= 1
+    return pos
+
+def _identifier_start(content: str, end: int, dotted: bool) -> int:
+    start = end
+    while start > 0 and (content[start - 1].isalnum() or content[start - 1] in '_$'
+                         or (dotted and content[start - 1] == '.')):
+        start -= 1
+    return start
+
+def _callee_before(content: str, paren: int) -> Optional[str]:
+    """Name vor "(" (inkl. Typ-Argumenten wie Name<T>), None bei Methodenketten/Ausdrücken"""
+    end = _skip_whitespace_back(content, paren)
+    if end > 0 and content[end - 1] == '>':
+        # Typ-Argumente rückwärts überspringen
+        depth = 0
+        while end > 0:
+            char = content[end - 1]
+            end -= 1
+            if char == '>':
+                depth += 1
+            elif char == '<':
+                depth -= 1
+                if depth == 0:
+                    break
+            elif not (char.isalnum() or char in _GENERIC_CHARS):
+                return None
+        end = _skip_whitespace_back(content, end)
+
+    start = _identifier_start(content, end, dotted=True)
+    name = content[start:end]
+    # ".push(" ist ein Methodenaufruf auf einem Ausdruck
+    if not name or name[0].isdigit() or '' in name.split('.'):
+        return None
+    return name
+
+def backward_read_floor(content: str, pos: int) -> int:
+    """Offset, unter den die Namensauflösung (vor "(" bzw. ":") ab pos nie zurückliest
+
+    Die Rückwärts-Lesungen laufen nur über Bezeichner, Leerraum und
+    Typ-Argumente und halten am ersten anderen Zeichen an.
+    """
+    while pos > 0:
+        pos -= 1
+        char = content[pos]
+        if not (char.isalnum() or char in _GENERIC_CHARS):
+            return pos
+    return 0
+
+# Interner Frame: (Klammer, Offset der Klammer, Offset eines ":" oder None,
+# Offset hinter dem vorangehenden "(" bzw. "," oder None) - Namen werden erst
+# beim Lookup aufgelöst, da nur wenige Offsets je abgefragt werden
+_RawFrame = Tuple[str, int, Optional[int], Optional[int]]
+# Unveränderliche verkettete Liste: (innerster Frame, Rest) - Zustände teilen sich Präfixe
+_Node = Optional[Tuple[_RawFrame, 'Optional[tuple]']]
+
+@dataclass
+class CallIndexCarry:
+    """Offene Klammern an einer sicheren Stelle, verschoben in das nächste Fenster
+
+    Offsets vor dem Fensteranfang sind negativ; ihre Namen wurden noch im
+    alten Fenster aufgelöst und kommen mit.
+    """
+    node: _Node = None
+    allowed_after: Optional[int] = None
+    resolved: Dict[_RawFrame, CallFrame] = field(default_factory=dict)
+    callees: Dict[int, Optional[str]] = field(default_factory=dict)
+
+class EnclosingCallIndex:
+    """Umschließende Aufrufe pro Offset (ein Durchlauf pro Datei, Lookup per bisect)"""
+
+    def __init__(self, content: str, offsets: List[int], states: List[_Node],
+                 end_state: Tuple[_Node, Optional[int]] = (None, None)):
+        # states[i] gilt ab offsets[i] bis zum nächsten Eintrag
+        self.content = content
+        self.offsets = offsets
+        self.states = states
+        # (Frames, allowed_after) am Ende des indizierten Bereichs
+        self.end_state = end_state
+        # Äußere Frames werden von vielen Offsets geteilt
+        self._resolved: Dict[_RawFrame, CallFrame] = {}
+        # Aufgelöste Namen vor "(" aus früheren Fenstern (negative Offsets)
+        self._callees: Dict[int, Optional[str]] = {}
+
+    def _node_at(self, offset: int) -> _Node:
+        index = bisect.bisect_right(self.offsets, offset) - 1
+        return self.states[index] if index >= 0 else None
+
+    def frames_at(self, offset: int) -> Tuple[CallFrame, ...]:
+        """Alle offenen Klammern an offset, von außen nach innen"""
+        node = self._node_at(offset)
+        frames = []
+        while node is not None:
+            frames.append(self._resolve(node[0]))
+            node = node[1]
+        frames.reverse()
+        return tuple(frames)
+
+    def _resolve(self, raw: _RawFrame) -> CallFrame:
+        frame = self._resolved.get(raw)
+        if frame is None:
+            frame = self._resolved[raw] = self._parse_frame(raw)
+        return frame
+
+    def _parse_frame(self, raw: _RawFrame) -> CallFrame:
+        bracket, position, colon, allowed_after = raw
+        content = self.content
+        callee = None
+        if bracket == '(':
+            callee = (self._callees[position] if position in self._callees
+                      else _callee_before(content, position))
+        arg = None
+        if colon is not None:
+            name_end = _skip_whitespace_back(content, colon)
+            name_start = _identifier_start(content, name_end, dotted=False)
+            # Nur "name:" direkt hinter "(" oder "," ist ein benanntes Argument
+            if name_start < name_end and _skip_whitespace_back(content, name_start) == allowed_after:
+                arg = content[name_start:name_end]
+        return CallFrame(bracket, callee=callee, arg=arg)
+
+    def widget_context(self, offset: int) -> str:
+        """z.B. "Widget: AlertDialog.title > Text" (die zwei innersten Konstruktoren)"""
+        node = self._node_at(offset)
+        innermost = self._resolve(node[0]) if node is not None else None
+        widgets: List[CallFrame] = []
+        while node is not None and len(widgets) < 2:
+            frame = self._resolve(node[0])
+            if frame.is_constructor:
+                widgets.append(frame)
+            node = node[1]
+
+        if widgets:
+            return "Widget: " + " > ".join(frame.describe() for frame in reversed(widgets))
+        if innermost is not None and innermost.arg:
+            return f"Widget: {innermost.arg} property"
+        return "Widget: unknown"
+
+    def carry(self, shift: int) -> CallIndexCarry:
+        """Zustand am Ende des Index für ein Fenster, das shift Zeichen weiter hinten beginnt"""
+        node, allowed_after = self.end_state
+        frames: List[_RawFrame] = []
+        while node is not None:
+            frames.append(node[0])
+            node = node[1]
+
+        carry = CallIndexCarry(allowed_after=None if allowed_after is None else allowed_after - shift)
+        for raw in reversed(frames):
+            bracket, position, colon, after = raw
+            moved = (bracket, position - shift,
+                     None if colon is None else colon - shift,
+                     None if after is None else after - shift)
+            frame = self._resolve(raw)
+            carry.resolved[moved] = frame
+            if bracket == '(':
+                carry.callees[position - shift] = frame.callee
+            carry.node = (moved, carry.node)
+        return carry
+
+def build_call_index(content: str,
+                     literals: Optional[List[DartStringLiteral]] = None,
+                     end: Optional[int] = None,
+                     start: int = 0,
+                     carry: Optional[CallIndexCarry] = None) -> EnclosingCallIndex:
+    """Baut den Klammer-Index; String-Literale und Kommentare werden übersprungen
+
+    Mit end wird nur bis zu diesem Offset indiziert (Lookups dahinter sind ungültig).
+    Fensterweise: ab einer sicheren Stelle start mit dem Zustand aus carry.
+    """
+    if literals is None:
+        literals = iter_string_literals(content)
+    literal_end: Dict[int, int] = {literal.start: literal.end for literal in literals}
+
+    node: _Node = None
+    # Offset hinter dem letzten "(" bzw. "," (nur dort kann ein benanntes Argument beginnen)
+    allowed_after: Optional[int] = None
+    if carry is not None:
+        node = carry.node
+        allowed_after = carry.allowed_after
+    offsets: List[int] = [start]
+    states: List[_Node] = [node]
+
+    length = len(content) if end is None else min(end, len(content))
+    search = _INDEX_TOKEN.search
+    pos = start
+    while pos < length:
+        token = search(content, pos, length)
+        if token is None:
+            break
+
+        text = token.group()
+        start = token.start()
+        pos = token.end()
+        if text == '"' or text == "'":
+            # String-Literal komplett überspringen (inkl. Interpolation)
+            pos = literal_end.get(start, pos)
+            allowed_after = None
+            continue
+        if text == '//':
+            newline = content.find('\n', pos)
+            pos = length if newline < 0 else newline
+            continue
+        if text == '/*':
+            pos = _skip_block_comment(content, pos)
+            continue
+
+        if text == ':':
+            if node is not None and node[0][0] == '(' and allowed_after is not None:
+                bracket, position, _, _ = node[0]
+                node = ((bracket, position, start, allowed_after), node[1])
+            else:
+                allowed_after = None
+                continue
+            allowed_after = None
+        elif text == ',':
+            allowed_after = pos
+            if node is None or node[0][2] is None:
+                continue
+            bracket, position, _, _ = node[0]
+            node = ((bracket, position, None, None), node[1])
+        elif text in '([{':
+            node = ((text, start, None, None), node)
+            allowed_after = pos
+        else:
+            allowed_after = None
+            # Tolerant bei unbalancierten Klammern (z.B. halb getippter Code)
+            if node is None or node[0][0] != _CLOSING[text]:
+                continue
+            node = node[1]
+
+        if offsets[-1] == pos:
+            states[-1] = node
+        else:
+            offsets.append(pos)
+            states.append(node)
+
+    index = EnclosingCallIndex(content, offsets, states, end_state=(node, allowed_after))
+    if carry is not None:
+        index._resolved.update(carry.resolved)
+        index._callees.update(carry.callees)
+    return index
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n File Watcher
+Meldet geänderte Dateien unterhalb eines Verzeichnisses für Watch-Modi der i18n-Tools
+
+Unter Linux per inotify (über ctypes, ohne Zusatzpakete), sonst per
+Polling der Datei-Zeitstempel.
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from i18n_source_walker import SourceWalker
+
+# inotify-Konstanten aus <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+               IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+_EVENT_HEADER = struct.Struct('iIII')
+
+# Nach dem ersten Event kurz weitersammeln (Editoren schreiben in mehreren Schritten)
+DEBOUNCE_SECONDS = 0.05
+MAX_DEBOUNCE_SECONDS = 0.5
+
+class PollingWatcher:
+    """Vergleicht Größe und mtime aller passenden Dateien in festen Intervallen"""
+
+    backend = 'polling'
+
+    def __init__(self, root: Path, suffixes: Tuple[str, ...] = ('.dart',), interval: float = 0.5):
+        self.root = Path(root)
+        self.suffixes = suffixes
+        self.interval = interval
+        # Ignorierte Verzeichnisse werden beim Pollen gar nicht erst betreten
+        self.walker = SourceWalker(self.root, suffixes, detect_generated=False)
+        self.snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        self.walker.refresh()
+        return {source.path: (source.size, source.mtime_ns) for source in self.walker.files()}
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Set[Path]]:
+        """Blockiert bis Dateien geändert wurden und liefert deren Pfade
+
+        Gelöschte Dateien sind enthalten; bei Timeout kommt eine leere Menge.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval)
+            current = self._take_snapshot()
+            changed = {path for path, state in current.items() if self.snapshot.get(path) != state}
+            changed.update(path for path in self.snapshot if path not in current)
+            self.snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+    def close(self):
+        pass
+
+class InotifyWatcher:
+    """Rekursiver inotify-Watch über libc (nur Linux)"""
+
+    backend = 'inotify'
+
+    def __init__(self, root: Path, suffixes: Tuple[str, ...] = ('.dart',)):
+        self.root = Path(root)
+        self.suffixes = suffixes
+        self.libc = _load_libc()
+        if self.libc is None:
+            raise OSError(errno.ENOSYS, "inotify nicht verfügbar")
+
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 fehlgeschlagen")
+        self.watches: Dict[int, Path] = {}
+        try:
+            self._add_tree(self.root)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: Path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC:
+                raise OSError(error, "inotify-Limit erreicht (fs.inotify.max_user_watches)")
+            # Verzeichnis inzwischen wieder verschwunden
+            return
+        self.watches[wd] = directory
+
+    def _add_tree(self, directory: Path) -> Set[Path]:
+        """Beobachtet ein Verzeichnis rekursiv und liefert die bereits vorhandenen Dateien"""
+        found = set()
+        self._add_watch(directory)
+        for dirpath, dirnames, filenames in os.walk(directory):
+            for name in dirnames:
+                self._add_watch(Path(dirpath) / name)
+            for name in filenames:
+                if name.endswith(self.suffixes):
+                    found.add(Path(dirpath) / name)
+        return found
+
+    def _read_events(self, changed: Set[Path]) -> bool:
+        """Liest anstehende Events; False bei Überlauf oder gelöschtem Verzeichnis"""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return True
+
+        complete = True
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                complete = False
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # Neues Verzeichnis: Watches ergänzen, enthaltene Dateien melden
+                    changed.update(self._add_tree(path))
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    # Welche Dateien darin lagen, weiß nur der Aufrufer
+                    complete = False
+            elif mask & IN_DELETE_SELF:
+                if directory == self.root:
+                    complete = False
+            elif path.name.endswith(self.suffixes):
+                changed.add(path)
+        return complete
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Set[Path]]:
+        """Blockiert bis Dateien geändert wurden und liefert deren Pfade
+
+        None bedeutet: Änderungen nicht genau bekannt (Event-Überlauf oder
+        verschobenes Verzeichnis), der Aufrufer sollte komplett neu scannen.
+        """
+        changed: Set[Path] = set()
+        complete = True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not changed and complete:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return set()
+            complete = self._read_events(changed)
+
+            # Zusammengehörige Events (Speichern, Formatieren, git checkout) bündeln
+            settle_until = time.monotonic() + MAX_DEBOUNCE_SECONDS
+            while time.monotonic() < settle_until:
+                ready, _, _ = select.select([self.fd], [], [], DEBOUNCE_SECONDS)
+                if not ready:
+                    break
+                complete = self._read_events(changed) and complete
+
+        return changed if complete else None
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+def _load_libc():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+def create_watcher(root: Path, suffixes: Tuple[str, ...] = ('.dart',),
+                   interval: float = 0.5, polling: bool = False):
+    """inotify wenn möglich, sonst Polling (oder Polling erzwungen)"""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root, suffixes)
+        except OSError as e:
+            print(f"⚠️ inotify nicht nutzbar ({e.strerror or e}) - verwende Polling")
+    return PollingWatcher(root, suffixes, interval)
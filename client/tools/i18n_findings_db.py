@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Findings DB
+Lokaler SQLite-Speicher für die Befunde von Extractor und Validator
+
+Jeder Lauf legt einen Eintrag in runs an und schreibt pro Befund eine Zeile
+in occurrences. Befunde haben eine stabile Identität (Hash aus Regel, Datei,
+Text und laufender Nummer gleicher Texte in der Datei) ohne Zeilennummer:
+verschobener Code bleibt derselbe Befund. Damit sind "neu seit dem letzten
+Lauf", "behoben seit dem letzten Lauf", "Top-Dateien" und der Verlauf pro
+Kategorie reine Index-Abfragen, und Reports lassen sich ohne neuen Scan aus
+dem Speicher rendern.
+
+Verglichen werden nur Läufe mit gleichem Tool und gleichem Scope (voller
+Scan, --since REF oder die validierte Datei); abgebrochene Läufe zählen nicht.
+
+Usage: python i18n_findings_db.py [runs|new|fixed|top-files|trend|report] [--tool extractor] [--output report.md]
+"""
+
+import json
+import sqlite3
+import argparse
+import datetime
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from i18n_git import GitError, run_git
+from i18n_key_allocator import text_digest
+
+SCHEMA_VERSION = 1
+
+# Abgeschlossene Läufe pro (Tool, Scope), ältere werden beim Abschluss gelöscht
+KEEP_RUNS = 30
+
+# Befunde werden in Blöcken dieser Größe geschrieben
+BATCH_SIZE = 500
+
+EXTRACTOR = 'extractor'
+VALIDATOR = 'validator'
+
+# Tool-Namen in SARIF (wie in den Tools selbst)
+SARIF_TOOL_NAMES = {EXTRACTOR: 'weltenwind-i18n-extractor', VALIDATOR: 'weltenwind-arb-validator'}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    tool TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    git_head TEXT,
+    complete INTEGER NOT NULL DEFAULT 0,
+    finding_count INTEGER NOT NULL DEFAULT 0,
+    stats TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_scope ON runs(tool, scope, complete, id);
+
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    tool TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    file TEXT NOT NULL,
+    text TEXT NOT NULL,
+    category TEXT,
+    key TEXT,
+    first_run INTEGER NOT NULL,
+    last_run INTEGER NOT NULL,
+    data TEXT
+);
+
+CREATE TABLE IF NOT EXISTS occurrences (
+    run_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    finding_id INTEGER NOT NULL,
+    line INTEGER,
+    column INTEGER,
+    confidence REAL,
+    severity TEXT,
+    message TEXT,
+    PRIMARY KEY (run_id, seq)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_occurrences_finding ON occurrences(run_id, finding_id);
+"""
+
+_FINDING_COLUMNS = ('f.fingerprint, f.rule, f.file, f.text, f.category, f.key, f.data, '
+                    'o.line, o.column, o.confidence, o.severity, o.message')
+
+@dataclass
+class Run:
+    id: int
+    tool: str
+    scope: str
+    started_at: str
+    git_head: Optional[str]
+    finding_count: int
+    stats: Dict = field(default_factory=dict)
+
+@dataclass
+class Finding:
+    fingerprint: str
+    rule: str
+    file: str
+    text: str
+    category: Optional[str]
+    key: Optional[str]
+    data: Dict
+    line: Optional[int]
+    column: Optional[int]
+    confidence: Optional[float]
+    severity: Optional[str]
+    message: Optional[str]
+
+def default_db_file(client_root: Path) -> Path:
+    """Eigenes Verzeichnis: tools/.i18n_cache ist Wegwerf-Cache und wird von 'clean' gelöscht"""
+    return Path(client_root) / "tools" / ".i18n_history" / "findings.db"
+
+def relative_file(path, client_root: Path) -> str:
+    """Pfad relativ zum Client-Root (so speichert der Extractor seine Dateien)"""
+    resolved = Path(path).resolve()
+    try:
+        return resolved.relative_to(Path(client_root).resolve()).as_posix()
+    except ValueError:
+        return resolved.as_posix()
+
+def extraction_scope(since_ref: Optional[str] = None) -> str:
+    """Scope eines Extractor-Laufs: voller Scan oder Diff gegen REF"""
+    return f"since:{since_ref}" if since_ref else 'full'
+
+def _run_from_row(row) -> Run:
+    return Run(row[0], row[1], row[2], row[3], row[4], row[5], json.loads(row[6]) if row[6] else {})
+
+def _finding_from_row(row) -> Finding:
+    return Finding(*row[:6], json.loads(row[6]) if row[6] else {}, *row[7:])
+
+class FindingsRun:
+    """Ein laufender Lauf; Befunde werden gepuffert und blockweise geschrieben"""
+
+    def __init__(self, db: 'FindingsDB', run_id: int, tool: str):
+        self.db = db
+        self.id = run_id
+        self.tool = tool
+        self.count = 0
+        # Basis-Hash -> bisherige Vorkommen (laufende Nummer gleicher Texte pro Datei)
+        self._ordinals: Dict[str, int] = {}
+        self._findings: List[Tuple] = []
+        self._occurrences: List[Tuple] = []
+
+    def add(self, rule: str, file: str, text: str, line: Optional[int] = None, column: Optional[int] = None,
+            confidence: Optional[float] = None, severity: Optional[str] = None, message: Optional[str] = None,
+            category: Optional[str] = None, key: Optional[str] = None, data: Optional[Dict] = None) -> str:
+        """Speichert einen Befund und gibt seine stabile Identität zurück
+
+        Befunde müssen je Datei in Quelltext-Reihenfolge kommen, sonst
+        tauschen gleiche Texte einer Datei ihre Identität.
+        """
+        base = text_digest(f"{self.tool}\0{rule}\0{file}\0{text}")
+        ordinal = self._ordinals.get(base, 0)
+        self._ordinals[base] = ordinal + 1
+        fingerprint = text_digest(f"{base}\0{ordinal}")
+
+        self._findings.append((fingerprint, self.tool, rule, file, text, category, key, self.id, self.id,
+                               json.dumps(data, ensure_ascii=False) if data else None))
+        self._occurrences.append((self.id, self.count, line, column, confidence, severity, message, fingerprint))
+        self.count += 1
+        if len(self._findings) >= BATCH_SIZE:
+            self.flush()
+        return fingerprint
+
+    def flush(self):
+        if not self._findings:
+            return
+        connection = self.db.connection
+        with connection:
+            connection.executemany(
+                "INSERT INTO findings (fingerprint, tool, rule, file, text, category, key, first_run, last_run, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(fingerprint) DO UPDATE SET category = excluded.category, key = excluded.key, "
+                "last_run = excluded.last_run, data = excluded.data",
+                self._findings)
+            connection.executemany(
+                "INSERT OR IGNORE INTO occurrences (run_id, seq, finding_id, line, column, confidence, severity, message) "
+                "SELECT ?, ?, id, ?, ?, ?, ?, ? FROM findings WHERE fingerprint = ?",
+                self._occurrences)
+        self._findings = []
+        self._occurrences = []
+
+    def finish(self, stats: Optional[Dict] = None):
+        """Schließt den Lauf ab; erst dann zählt er für Vergleiche"""
+        self.flush()
+        with self.db.connection:
+            self.db.connection.execute(
+                "UPDATE runs SET complete = 1, finding_count = ?, stats = ? WHERE id = ?",
+                (self.count, json.dumps(stats or {}, ensure_ascii=False), self.id))
+        self.db.prune()
+
+    def abort(self):
+        """Verwirft den Lauf samt Befunden (z.B. nach einem Fehler im Scan)"""
+        self._findings = []
+        self._occurrences = []
+        with self.db.connection:
+            self.db.connection.execute("DELETE FROM occurrences WHERE run_id = ?", (self.id,))
+            self.db.connection.execute("DELETE FROM runs WHERE id = ?", (self.id,))
+
+class FindingsDB:
+    def __init__(self, db_file: Path):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.db_file), timeout=30)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise sqlite3.DatabaseError(f"Findings-DB {self.db_file} hat Schema-Version {version}, "
+                                        f"erwartet {SCHEMA_VERSION}")
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.connection.close()
+
+    def start_run(self, tool: str, scope: str = 'full', cwd: Optional[Path] = None) -> FindingsRun:
+        try:
+            git_head = run_git(['rev-parse', 'HEAD'], cwd or self.db_file.parent).decode().strip()
+        except (GitError, OSError):
+            git_head = None
+        started_at = datetime.datetime.now().isoformat(timespec='seconds')
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (tool, scope, started_at, git_head) VALUES (?, ?, ?, ?)",
+                (tool, scope, started_at, git_head))
+        return FindingsRun(self, cursor.lastrowid, tool)
+
+    def prune(self, keep: int = KEEP_RUNS):
+        """Hält pro (Tool, Scope) die letzten keep Läufe; verwaiste Befunde fallen weg
+
+        Abgebrochene Läufe fallen weg, sobald es im selben (Tool, Scope) einen
+        neueren abgeschlossenen Lauf gibt oder sie älter als jeder abgeschlossene
+        Lauf sind. Neuere können noch laufen und bleiben stehen.
+        """
+        connection = self.connection
+        with connection:
+            old = [row[0] for row in connection.execute(
+                "SELECT id FROM runs r WHERE complete = 1 AND "
+                "(SELECT COUNT(*) FROM runs n WHERE n.tool = r.tool AND n.scope = r.scope "
+                "AND n.complete = 1 AND n.id > r.id) >= ?", (keep,))]
+            old += [row[0] for row in connection.execute(
+                "SELECT id FROM runs r WHERE complete = 0 AND EXISTS (SELECT 1 FROM runs n "
+                "WHERE n.tool = r.tool AND n.scope = r.scope AND n.complete = 1 AND n.id > r.id)")]
+            connection.executemany("DELETE FROM occurrences WHERE run_id = ?", [(run_id,) for run_id in old])
+            connection.executemany("DELETE FROM runs WHERE id = ?", [(run_id,) for run_id in old])
+
+            # Nur abgeschlossene Läufe bestimmen die Grenze, ein abgestürzter Lauf hält sie nicht fest
+            cutoff = connection.execute("SELECT MIN(id) FROM runs WHERE complete = 1").fetchone()[0]
+            if cutoff is None:
+                return
+            connection.execute("DELETE FROM occurrences WHERE run_id IN "
+                               "(SELECT id FROM runs WHERE complete = 0 AND id < ?)", (cutoff,))
+            connection.execute("DELETE FROM runs WHERE complete = 0 AND id < ?", (cutoff,))
+            # Zuletzt vor dem ältesten verbliebenen Lauf gesehen: kein Vorkommen mehr
+            connection.execute("DELETE FROM findings WHERE last_run < ?", (cutoff,))
+
+    def run(self, run_id: int) -> Optional[Run]:
+        row = self.connection.execute(
+            "SELECT id, tool, scope, started_at, git_head, finding_count, stats FROM runs "
+            "WHERE id = ? AND complete = 1", (run_id,)).fetchone()
+        return _run_from_row(row) if row else None
+
+    def runs(self, tool: Optional[str] = None, scope: Optional[str] = None, limit: int = 10) -> List[Run]:
+        """Abgeschlossene Läufe, neueste zuerst"""
+        query = "SELECT id, tool, scope, started_at, git_head, finding_count, stats FROM runs WHERE complete = 1"
+        params: List = []
+        if tool:
+            query += " AND tool = ?"
+            params.append(tool)
+        if scope:
+            query += " AND scope = ?"
+            params.append(scope)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return [_run_from_row(row) for row in self.connection.execute(query, params)]
+
+    def latest_pair(self, tool: str, scope: str = 'full') -> Tuple[Optional[Run], Optional[Run]]:
+        """(letzter, vorletzter) abgeschlossener Lauf mit gleichem Tool und Scope"""
+        runs = self.runs(tool, scope, limit=2)
+        return (runs[0] if runs else None, runs[1] if len(runs) > 1 else None)
+
+    def findings(self, run_id: int) -> Iterator[Finding]:
+        """Alle Befunde eines Laufs in Fund-Reihenfolge"""
+        for row in self.connection.execute(
+                f"SELECT {_FINDING_COLUMNS} FROM occurrences o JOIN findings f ON f.id = o.finding_id "
+                "WHERE o.run_id = ? ORDER BY o.seq", (run_id,)):
+            yield _finding_from_row(row)
+
+    def new_findings(self, run_id: int, previous_id: Optional[int]) -> List[Finding]:
+        """Befunde in run_id, die es in previous_id nicht gab (ohne Vorlauf: alle)"""
+        return [_finding_from_row(row) for row in self.connection.execute(
+            f"SELECT {_FINDING_COLUMNS} FROM occurrences o JOIN findings f ON f.id = o.finding_id "
+            "WHERE o.run_id = ? AND NOT EXISTS (SELECT 1 FROM occurrences p "
+            "WHERE p.run_id = ? AND p.finding_id = o.finding_id) ORDER BY o.seq",
+            (run_id, previous_id if previous_id is not None else -1))]
+
+    def fixed_findings(self, run_id: int, previous_id: Optional[int]) -> List[Finding]:
+        """Befunde aus previous_id, die in run_id nicht mehr vorkommen"""
+        if previous_id is None:
+            return []
+        return self.new_findings(previous_id, run_id)
+
+    def delta(self, tool: str, scope: str = 'full') -> Dict:
+        """Neu und behoben im letzten Lauf gegenüber dem vorletzten"""
+        latest, previous = self.latest_pair(tool, scope)
+        if latest is None:
+            return {'run': None, 'previous': None, 'new': [], 'fixed': []}
+        previous_id = previous.id if previous else None
+        return {'run': latest, 'previous': previous,
+                'new': self.new_findings(latest.id, previous_id),
+                'fixed': self.fixed_findings(latest.id, previous_id)}
+
+    def file_counts(self, run_id: int) -> Dict[str, int]:
+        """Befunde pro Datei in einem Lauf"""
+        return dict(self.connection.execute(
+            "SELECT f.file, COUNT(*) FROM occurrences o JOIN findings f ON f.id = o.finding_id "
+            "WHERE o.run_id = ? GROUP BY f.file", (run_id,)))
+
+    def top_files(self, run_id: int, limit: int = 10) -> List[Tuple[str, int]]:
+        return self.connection.execute(
+            "SELECT f.file, COUNT(*) AS count FROM occurrences o JOIN findings f ON f.id = o.finding_id "
+            "WHERE o.run_id = ? GROUP BY f.file ORDER BY count DESC, f.file LIMIT ?", (run_id, limit)).fetchall()
+
+    def category_trend(self, tool: str, scope: str = 'full', limit: int = 10) -> List[Tuple[Run, Dict[str, int]]]:
+        """Befunde pro Kategorie (Validator: pro Regel) für die letzten Läufe, älteste zuerst"""
+        runs = list(reversed(self.runs(tool, scope, limit)))
+        if not runs:
+            return []
+        counts: Dict[int, Dict[str, int]] = {run.id: {} for run in runs}
+        placeholders = ', '.join('?' * len(runs))
+        for run_id, category, count in self.connection.execute(
+                "SELECT o.run_id, COALESCE(f.category, f.rule), COUNT(*) FROM occurrences o "
+                f"JOIN findings f ON f.id = o.finding_id WHERE o.run_id IN ({placeholders}) "
+                "GROUP BY o.run_id, COALESCE(f.category, f.rule)", [run.id for run in runs]):
+            counts[run_id][category] = count
+        return [(run, counts[run.id]) for run in runs]
+
+def render_report(db: FindingsDB, run: Run, output_file: str, client_root: Path):
+    """Rendert einen gespeicherten Lauf: *.md, *.json oder *.sarif (jeweils auch .gz)
+
+    Zeile, Spalte, Konfidenz und Meldung stammen aus dem Lauf, die übrigen
+    Felder aus der letzten Sichtung des Befunds.
+    """
+    from i18n_report_writers import SARIF_LEVELS, JsonArrayWriter, MarkdownReportWriter, SarifWriter, open_output
+
+    name = output_file[:-3] if output_file.endswith('.gz') else output_file
+
+    if name.endswith('.sarif'):
+        sarif = SarifWriter(output_file, SARIF_TOOL_NAMES[run.tool])
+        for finding in db.findings(run.id):
+            level = SARIF_LEVELS.get(finding.severity, 'note')
+            if run.tool == EXTRACTOR:
+                sarif.add_result(finding.rule, level, f"{finding.message} → {finding.key}",
+                                 Path(client_root) / finding.file, finding.line, finding.column,
+                                 finding.column + len(finding.text) + 2, properties=finding.data,
+                                 fingerprint=finding.fingerprint)
+            else:
+                sarif.add_result(finding.rule, level, finding.message, Path(client_root) / finding.file,
+                                 finding.line, fingerprint=finding.fingerprint)
+        sarif.close()
+        return
+
+    if run.tool == VALIDATOR:
+        if not name.endswith('.json'):
+            raise ValueError(f"Validator-Läufe lassen sich nur als .json oder .sarif rendern: {output_file}")
+        issues = [{"severity": finding.severity, "code": finding.rule, "message": finding.message,
+                   "line": finding.line, "suggestion": finding.data.get('suggestion'), "file": finding.file}
+                  for finding in db.findings(run.id)]
+        report = {"summary": {"total_issues": len(issues),
+                              **{label: sum(1 for issue in issues if issue['severity'] == severity)
+                                 for label, severity in (('errors', 'error'), ('warnings', 'warning'),
+                                                         ('infos', 'info'))}},
+                  "issues": issues}
+        with open_output(output_file) as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        return
+
+    from i18n_string_extractor import StringMatch
+
+    def matches() -> Iterator:
+        for finding in db.findings(run.id):
+            match = StringMatch.from_dict(finding.data)
+            match.line, match.column, match.confidence = finding.line, finding.column, finding.confidence
+            yield match
+
+    if name.endswith('.json'):
+        writer = JsonArrayWriter(output_file)
+        for match in matches():
+            writer.add((-match.confidence, match.category, match.file), match.to_dict())
+        writer.close()
+    elif name.endswith('.md'):
+        markdown = MarkdownReportWriter(output_file)
+        for match in matches():
+            if match.localized_as:
+                markdown.add_localized(match)
+            else:
+                markdown.add((-match.confidence, match.category, match.file), match)
+        markdown.close(run.stats.get('total', run.finding_count),
+                       (run.stats.get('files_prefiltered', 0), run.stats.get('files_prefilter_checked', 0)))
+    else:
+        raise ValueError(f"Unbekanntes Report-Format: {output_file}")
+
+def _print_findings(findings: List[Finding], marker: str):
+    for finding in findings:
+        location = f"{finding.file}:{finding.line}" if finding.line else finding.file
+        label = finding.key or finding.rule
+        print(f"{marker} {location} {label}: \"{finding.text[:60]}\"")
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Findings DB')
+    parser.add_argument('query', nargs='?', default='runs',
+                       choices=['runs', 'new', 'fixed', 'top-files', 'trend', 'report'],
+                       help='Abfrage (Default: runs)')
+    parser.add_argument('--client-root', default=str(Path(__file__).resolve().parent.parent),
+                       help='Pfad zum Client-Root-Verzeichnis')
+    parser.add_argument('--db', metavar='FILE',
+                       help='Pfad zur Findings-DB (Default: tools/.i18n_history/findings.db)')
+    parser.add_argument('--tool', default=EXTRACTOR, choices=[EXTRACTOR, VALIDATOR],
+                       help='Befunde welches Tools')
+    parser.add_argument('--scope',
+                       help='Scope der Läufe (Default: full; Validator: Pfad der .arb-Datei)')
+    parser.add_argument('--since', metavar='REF',
+                       help='Extractor-Läufe mit --since REF statt vollem Scan')
+    parser.add_argument('--run', type=int,
+                       help='Lauf-ID für top-files/report (Default: letzter Lauf)')
+    parser.add_argument('--limit', type=int, default=10,
+                       help='Anzahl Läufe bzw. Dateien')
+    parser.add_argument('--output', '-o', metavar='FILE',
+                       help='Ziel für report: *.md, *.json oder *.sarif (*.gz = gzip)')
+    args = parser.parse_args()
+
+    client_root = Path(args.client_root)
+    db_file = Path(args.db) if args.db else default_db_file(client_root)
+    if not db_file.exists():
+        print(f"❌ Findings-DB nicht gefunden: {db_file}")
+        exit(1)
+    db = FindingsDB(db_file)
+    scope = args.scope or (extraction_scope(args.since) if args.tool == EXTRACTOR else None)
+
+    print("🗃️ Weltenwind i18n Findings DB")
+    print("=" * 60)
+
+    if args.query == 'runs':
+        for run in db.runs(args.tool, scope, args.limit):
+            head = f" @ {run.git_head[:10]}" if run.git_head else ''
+            print(f"#{run.id} {run.started_at} [{run.scope}]{head}: {run.finding_count} Befunde")
+        return
+
+    if args.query in ('new', 'fixed'):
+        if scope is None:
+            print("❌ Für Validator-Läufe --scope angeben (Pfad der .arb-Datei)")
+            exit(1)
+        delta = db.delta(args.tool, scope)
+        if delta['run'] is None:
+            print(f"ℹ️ Noch kein abgeschlossener Lauf für {args.tool} [{scope}]")
+            return
+        previous = f"#{delta['previous'].id}" if delta['previous'] else 'keinem Vorlauf'
+        if args.query == 'new':
+            print(f"🆕 {len(delta['new'])} neue Befunde in #{delta['run'].id} gegenüber {previous}")
+            _print_findings(delta['new'], '+')
+        else:
+            print(f"✅ {len(delta['fixed'])} behobene Befunde in #{delta['run'].id} gegenüber {previous}")
+            _print_findings(delta['fixed'], '-')
+        return
+
+    if args.query == 'trend':
+        if scope is None:
+            print("❌ Für Validator-Läufe --scope angeben (Pfad der .arb-Datei)")
+            exit(1)
+        for run, counts in db.category_trend(args.tool, scope, args.limit):
+            parts = ', '.join(f"{category}: {count}" for category, count in sorted(counts.items()))
+            print(f"#{run.id} {run.started_at}: {run.finding_count} ({parts or '-'})")
+        return
+
+    if args.run is not None:
+        run = db.run(args.run)
+    else:
+        runs = db.runs(args.tool, scope, 1)
+        run = runs[0] if runs else None
+    if run is None:
+        print("❌ Kein passender abgeschlossener Lauf")
+        exit(1)
+
+    if args.query == 'top-files':
+        print(f"📁 Dateien mit den meisten Befunden in #{run.id}:")
+        for file, count in db.top_files(run.id, args.limit):
+            print(f"   {count:5d}  {file}")
+        return
+
+    if not args.output:
+        parser.error('report braucht --output')
+    try:
+        render_report(db, run, args.output, client_root)
+    except ValueError as e:
+        print(f"❌ {e}")
+        exit(1)
+    print(f"📄 Lauf #{run.id} gerendert: {args.output}")
+
+if __name__ == "__main__":
+    main()
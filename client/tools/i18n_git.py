@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Git Helpers
+Lokale git-Abfragen für diff-basierte Scans der i18n-Tools
+"""
+
+import re
+import bisect
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+LineRange = Tuple[int, int]
+
+# Markiert eine komplett neue Datei
+WHOLE_FILE: LineRange = (1, 0)
+
+# @@ -alt[,anzahl] +neu[,anzahl] @@
+_HUNK_HEADER = re.compile(r'^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+class GitError(RuntimeError):
+    pass
+
+def run_git(args: List[str], cwd: Path, input_data: Optional[bytes] = None) -> bytes:
+    """Führt git aus und liefert stdout (wirft GitError bei Fehlern)"""
+    try:
+        result = subprocess.run(
+            ['git', '-c', 'core.quotepath=off'] + args,
+            cwd=cwd,
+            input=input_data,
+            capture_output=True,
+            check=False
+        )
+    except FileNotFoundError:
+        raise GitError("git nicht im PATH gefunden")
+
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', errors='replace').strip()
+        raise GitError(f"git {' '.join(args)} fehlgeschlagen: {message}")
+    return result.stdout
+
+def merge_base(ref: str, cwd: Path) -> str:
+    """Gemeinsamer Vorfahre von ref und HEAD (Fallback: ref selbst)"""
+    try:
+        return run_git(['merge-base', ref, 'HEAD'], cwd).decode().strip()
+    except GitError:
+        # z.B. flacher Clone ohne gemeinsame Historie
+        return run_git(['rev-parse', '--verify', f'{ref}^{{commit}}'], cwd).decode().strip()
+
+def parse_unified_zero_diff(diff_text: str,
+                            blob_ids: Optional[Dict[str, str]] = None) -> Dict[str, List[LineRange]]:
+    """Parst 'git diff -U0' in {Pfad: [(erste, letzte) neue Zeile]}
+
+    Mit blob_ids werden zusätzlich die neuen Blob-IDs aus den 'index'-Zeilen
+    gesammelt (erfordert --full-index).
+    """
+    changed: Dict[str, List[LineRange]] = {}
+    current: Optional[List[LineRange]] = None
+    new_blob: Optional[str] = None
+    # Noch offene alte/neue Zeilen des aktuellen Hunks: solange sind '--- '/'+++ '
+    # Inhalt (z.B. eine hinzugefügte Zeile "++ x"), kein Datei-Header
+    old_left = new_left = 0
+    after_old_header = False
+
+    for line in diff_text.split('\n'):
+        if old_left > 0 or new_left > 0:
+            if line.startswith('-'):
+                old_left -= 1
+            elif line.startswith('+'):
+                new_left -= 1
+            elif line.startswith(' '):
+                old_left -= 1
+                new_left -= 1
+            # '\ No newline at end of file' zählt nicht mit
+            continue
+
+        if line.startswith('diff --git '):
+            current = None
+            new_blob = None
+        elif line.startswith('index '):
+            # index <alt>..<neu>[ <mode>]
+            new_blob = line[6:].split(' ')[0].split('..')[-1]
+        elif line.startswith('+++ ') and after_old_header:
+            target = line[4:]
+            if target == '/dev/null':
+                current = None
+            else:
+                path = target[2:] if target.startswith('b/') else target
+                current = changed.setdefault(path, [])
+                if blob_ids is not None and new_blob:
+                    blob_ids[path] = new_blob
+        elif line.startswith('@@'):
+            hunk = _HUNK_HEADER.match(line)
+            if hunk:
+                old_left = int(hunk.group(1)) if hunk.group(1) is not None else 1
+                start = int(hunk.group(2))
+                count = int(hunk.group(3)) if hunk.group(3) is not None else 1
+                new_left = count
+                # count == 0: reine Löschung, keine neuen Zeilen
+                if current is not None and count > 0:
+                    current.append((start, start + count - 1))
+        after_old_header = line.startswith('--- ')
+
+    return changed
+
+def changed_line_ranges(ref: str, cwd: Path, pathspec: str = '.',
+                        suffix: str = '.dart') -> Dict[str, List[LineRange]]:
+    """Geänderte Zeilenbereiche seit dem Merge-Base mit ref (inkl. Arbeitsverzeichnis)
+
+    Pfade sind relativ zu cwd. Nicht versionierte Dateien gelten als komplett geändert
+    (Bereich (1, 0) = ganze Datei).
+    """
+    base = merge_base(ref, cwd)
+    diff_text = run_git(
+        ['diff', '--unified=0', '--no-color', '--no-ext-diff', '--relative',
+         '--diff-filter=ACMR', base, '--', pathspec],
+        cwd
+    ).decode('utf-8', errors='replace')
+
+    changed = {path: ranges for path, ranges in parse_unified_zero_diff(diff_text).items()
+               if path.endswith(suffix) and ranges}
+
+    untracked = run_git(['ls-files', '--others', '--exclude-standard', '--', pathspec], cwd)
+    for path in untracked.decode('utf-8', errors='replace').splitlines():
+        if path.endswith(suffix):
+            changed[path] = [WHOLE_FILE]
+
+    return changed
+
+def staged_changes(cwd: Path, pathspec: str = '.',
+                   suffixes: Tuple[str, ...] = ('.dart', '.arb')) -> Dict[str, Tuple[str, List[LineRange]]]:
+    """Gestagte Dateien als {Pfad: (Blob-ID im Index, geänderte Zeilenbereiche)}
+
+    Ein einziger 'git diff --cached'-Aufruf liefert Pfade, Blob-IDs und Hunks.
+    """
+    diff_text = run_git(
+        ['diff', '--cached', '--unified=0', '--full-index', '--no-color', '--no-ext-diff',
+         '--relative', '--diff-filter=ACMR', '--', pathspec],
+        cwd
+    ).decode('utf-8', errors='replace')
+
+    blob_ids: Dict[str, str] = {}
+    changed = parse_unified_zero_diff(diff_text, blob_ids)
+    return {path: (blob_ids[path], ranges) for path, ranges in changed.items()
+            if path.endswith(suffixes) and path in blob_ids}
+
+def read_blobs(object_ids: List[str], cwd: Path) -> Dict[str, bytes]:
+    """Liest mehrere Blobs in einem einzigen 'git cat-file --batch'-Stream"""
+    if not object_ids:
+        return {}
+
+    output = run_git(['cat-file', '--batch'], cwd,
+                     input_data=('\n'.join(object_ids) + '\n').encode('ascii'))
+
+    blobs: Dict[str, bytes] = {}
+    pos = 0
+    for _ in object_ids:
+        header_end = output.index(b'\n', pos)
+        header = output[pos:header_end].decode('ascii').split(' ')
+        pos = header_end + 1
+        # "<oid> missing" bzw. "<oid> <typ> <größe>"
+        if len(header) < 3:
+            continue
+        size = int(header[2])
+        blobs[header[0]] = output[pos:pos + size]
+        pos += size + 1
+    return blobs
+
+def line_in_ranges(line: int, ranges: List[LineRange]) -> bool:
+    """Prüft ob eine Zeile in einem der (sortierten) Bereiche liegt"""
+    if ranges and ranges[0] == WHOLE_FILE:
+        return True
+    index = bisect.bisect_right(ranges, (line, float('inf'))) - 1
+    return index >= 0 and ranges[index][0] <= line <= ranges[index][1]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Key Allocator
+Vergibt .arb-Keys deterministisch und ohne stille Kollisionen
+
+Der Extractor leitet aus Text und Kategorie einen Basis-Key ab (erste drei
+Wörter). Verschiedene Texte können denselben Basis-Key ergeben. Der
+Allocator führt einen Index aller vergebenen Keys (aus der .arb-Datei und
+aus dem laufenden Lauf) mit dem jeweiligen Text:
+
+- gleicher Text, gleicher Basis-Key -> immer derselbe Key
+- Basis-Key frei oder schon mit demselben Text belegt -> Basis-Key
+- Basis-Key mit anderem Text belegt -> Basis-Key + Suffix aus dem Text-Hash
+
+Der Suffix hängt nur vom Text ab, nicht von der Reihenfolge oder vom
+Prozess. Jede Vergabe kostet erwartet O(1) Dict-Zugriffe. Keys aus der
+.arb-Datei sind fest. Zwei neue Texte mit gleichem Basis-Key: den Basis-Key
+bekommt das erste Vorkommen in Datei-Reihenfolge.
+"""
+
+import hashlib
+from typing import Dict, Optional, Tuple
+
+# Suffix-Längen (Hex-Zeichen) bei Kollisionen; längere nur, wenn auch der Suffix belegt ist
+SUFFIX_LENGTHS = (4, 8, 16)
+
+def text_digest(text: str) -> str:
+    """Prozess-unabhängiger Hash eines Textes (hash() ist pro Prozess zufällig)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+class KeyAllocator:
+    def __init__(self, existing: Optional[Dict[str, str]] = None):
+        # Key -> Text für alle belegten Keys (existing: Key -> Text aus der .arb-Datei)
+        self.owners: Dict[str, str] = dict(existing or {})
+        # (Basis-Key, Text) -> vergebener Key
+        self._allocated: Dict[Tuple[str, str], str] = {}
+        self.collisions = 0
+
+    def allocate(self, base_key: str, text: str) -> str:
+        """Key für text; derselbe (Basis-Key, Text) ergibt immer denselben Key"""
+        pair = (base_key, text)
+        key = self._allocated.get(pair)
+        if key is None:
+            key = self._claim(base_key, text)
+            self._allocated[pair] = key
+        return key
+
+    def _claim(self, base_key: str, text: str) -> str:
+        if self.owners.setdefault(base_key, text) == text:
+            return base_key
+
+        self.collisions += 1
+        digest = text_digest(text)
+        for length in SUFFIX_LENGTHS:
+            key = base_key + digest[:length]
+            if self.owners.setdefault(key, text) == text:
+                return key
+
+        # Praktisch unerreichbar: auch der volle Hash ist mit anderem Text belegt
+        counter = 2
+        while True:
+            key = f"{base_key}{digest}{counter}"
+            if self.owners.setdefault(key, text) == text:
+                return key
+            counter += 1
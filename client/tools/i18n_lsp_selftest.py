@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n LSP Self-Test
+Skriptgesteuerter LSP-Client für i18n_lsp_server.py
+
+Startet den Server als Unterprozess, spielt über stdin/stdout eine feste
+Sitzung ab (initialize, didOpen, didChange, kaputter ARB-Puffer, unbekannte
+Methode, shutdown/exit) und prüft die Antworten. Es werden nur Puffer
+geschickt, keine Dateien geschrieben.
+
+Usage: python client/tools/i18n_lsp_selftest.py [--client-root client]
+"""
+
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional
+
+SERVER = Path(__file__).resolve().parent / "i18n_lsp_server.py"
+
+# Text, den der Extractor als hardcoded String meldet
+DART_LITERAL = 'Du bist bereits Mitglied dieser Welt'
+
+DART_SOURCE = f"""import 'package:flutter/material.dart';
+
+class SelfTestWidget extends StatelessWidget {{
+  @override
+  Widget build(BuildContext context) {{
+    return const Text('{DART_LITERAL}');
+  }}
+}}
+"""
+
+# Gültiges JSON, aber kein gültiges ARB - so sehen Puffer beim Tippen aus
+MALFORMED_ARB_BUFFERS = ['{"a": null}', '{"a": {"b": 1}}', '{"a": "x {n}", "b": 3}', '[]', '"x"']
+
+class LspClient:
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+        self.next_id = 1
+        # Notifications, die beim Warten auf eine Antwort eingetroffen sind
+        self.notifications: List[Dict] = []
+
+    def send(self, message: Dict):
+        body = json.dumps({'jsonrpc': '2.0', **message}).encode('utf-8')
+        writer: BinaryIO = self.process.stdin
+        try:
+            writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+            writer.flush()
+        except BrokenPipeError:
+            # Server ist abgestürzt - read() liefert None, die Prüfungen schlagen fehl
+            pass
+
+    def read(self) -> Optional[Dict]:
+        reader: BinaryIO = self.process.stdout
+        length = None
+        while True:
+            line = reader.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode('ascii').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value.strip())
+        if length is None:
+            return None
+        return json.loads(reader.read(length).decode('utf-8'))
+
+    def request(self, method: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        request_id = self.next_id
+        self.next_id += 1
+        self.send({'id': request_id, 'method': method, 'params': params or {}})
+        while True:
+            message = self.read()
+            if message is None or message.get('id') == request_id:
+                return message
+            self.notifications.append(message)
+
+    def notify(self, method: str, params: Dict):
+        self.send({'method': method, 'params': params})
+
+    def wait_for(self, predicate: Callable[[Dict], bool]) -> Optional[Dict]:
+        for index, message in enumerate(self.notifications):
+            if predicate(message):
+                return self.notifications.pop(index)
+        while True:
+            message = self.read()
+            if message is None or predicate(message):
+                return message
+            self.notifications.append(message)
+
+    def diagnostics_for(self, uri: str) -> Optional[List[Dict]]:
+        message = self.wait_for(lambda m: m.get('method') == 'textDocument/publishDiagnostics'
+                                and m['params']['uri'] == uri)
+        return None if message is None else message['params']['diagnostics']
+
+class SelfTest:
+    def __init__(self, client_root: Path):
+        self.client_root = client_root.resolve()
+        self.failures = 0
+
+    def check(self, name: str, ok: bool, detail: str = ''):
+        if ok:
+            print(f"✅ {name}")
+        else:
+            self.failures += 1
+            print(f"❌ {name}{': ' + detail if detail else ''}")
+
+    def run(self) -> int:
+        process = subprocess.Popen(
+            [sys.executable, str(SERVER), '--client-root', str(self.client_root)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            cwd=str(self.client_root))
+        client = LspClient(process)
+        try:
+            self.session(client)
+            try:
+                exit_code = process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                exit_code = None
+            self.check('exit nach shutdown beendet den Server mit 0', exit_code == 0,
+                       f"Exit-Code {exit_code}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+        if self.failures:
+            print(f"\n❌ {self.failures} Prüfung(en) fehlgeschlagen")
+            return 1
+        print("\n🎉 Alle Prüfungen bestanden")
+        return 0
+
+    def session(self, client: LspClient):
+        response = client.request('initialize', {'processId': None, 'rootUri': self.client_root.as_uri(),
+                                                 'capabilities': {}})
+        self.check('initialize liefert capabilities',
+                   response is not None and 'capabilities' in response.get('result', {}))
+        client.notify('initialized', {})
+
+        dart_uri = (self.client_root / "lib" / "i18n_selftest.dart").as_uri()
+        client.notify('textDocument/didOpen', {'textDocument': {
+            'uri': dart_uri, 'languageId': 'dart', 'version': 1, 'text': DART_SOURCE}})
+        diagnostics = client.diagnostics_for(dart_uri) or []
+        self.check('didOpen meldet den hardcoded String',
+                   any(DART_LITERAL in d['message'] for d in diagnostics),
+                   f"{len(diagnostics)} Diagnostics")
+
+        fixed = DART_SOURCE.replace(f"const Text('{DART_LITERAL}')", 'Text(l10n.worldStatusOpen)')
+        client.notify('textDocument/didChange', {
+            'textDocument': {'uri': dart_uri, 'version': 2},
+            'contentChanges': [{'text': fixed}]})
+        diagnostics = client.diagnostics_for(dart_uri)
+        self.check('didChange ohne Literal leert die Diagnostics', diagnostics == [],
+                   f"{diagnostics}")
+
+        arb_uri = (self.client_root / "lib" / "l10n" / "app_selftest.arb").as_uri()
+        for version, text in enumerate(MALFORMED_ARB_BUFFERS, start=1):
+            method = 'textDocument/didOpen' if version == 1 else 'textDocument/didChange'
+            if version == 1:
+                params = {'textDocument': {'uri': arb_uri, 'languageId': 'json',
+                                           'version': version, 'text': text}}
+            else:
+                params = {'textDocument': {'uri': arb_uri, 'version': version},
+                          'contentChanges': [{'text': text}]}
+            client.notify(method, params)
+            diagnostics = client.diagnostics_for(arb_uri) or []
+            self.check(f"kaputter ARB-Puffer {text} wird als Fehler gemeldet",
+                       any(d['severity'] == 1 for d in diagnostics),
+                       f"{[d.get('code') for d in diagnostics]}")
+
+        response = client.request('weltenwind/unknown', {})
+        self.check('unbekannte Methode liefert MethodNotFound',
+                   response is not None and response.get('error', {}).get('code') == -32601,
+                   f"{response}")
+
+        client.notify('textDocument/didClose', {'textDocument': {'uri': arb_uri}})
+        client.notify('textDocument/didClose', {'textDocument': {'uri': dart_uri}})
+        response = client.request('shutdown')
+        self.check('shutdown wird beantwortet', response is not None and 'error' not in response,
+                   f"{response}")
+        client.notify('exit', {})
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n LSP Self-Test')
+    parser.add_argument('--client-root', default=str(Path(__file__).resolve().parent.parent),
+                       help='Pfad zum Client-Root-Verzeichnis')
+    args = parser.parse_args()
+
+    print("🧪 Starte LSP-Self-Test...")
+    sys.exit(SelfTest(Path(args.client_root)).run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Language Server
+Stdio-LSP-Server für hardcoded Strings (.dart) und ARB-Validierung (.arb)
+
+Prüft bei jeder Änderung nur den geänderten Editor-Puffer (ungespeicherter
+Text) und veröffentlicht die Treffer als Diagnostics.
+
+Usage: python client/tools/i18n_lsp_server.py [--client-root client]
+Self-Test: python client/tools/i18n_lsp_selftest.py
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+from typing import BinaryIO, Dict, List, Optional
+
+from i18n_string_extractor import I18nStringExtractor
+from i18n_source_walker import HEADER_BYTES, is_generated
+from i18n_key_allocator import KeyAllocator
+from arb_validator import ArbValidator
+
+# LSP DiagnosticSeverity
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+SEVERITY_INFORMATION = 3
+
+_SEVERITIES = {
+    'error': SEVERITY_ERROR,
+    'warning': SEVERITY_WARNING,
+    'info': SEVERITY_INFORMATION
+}
+
+# TextDocumentSyncKind.Full: der Client schickt immer den ganzen Puffer
+SYNC_FULL = 1
+
+# JSON-RPC Fehlercodes
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+# LSP MessageType für window/logMessage
+MESSAGE_TYPE_ERROR = 1
+
+# Keys stehen in Validator-Meldungen in Anführungszeichen ("authLoginButton")
+_QUOTED_KEY = re.compile(r'"([^"\s]+)"')
+
+def uri_to_path(uri: str) -> Path:
+    parsed = urlparse(uri)
+    path = unquote(parsed.path)
+    # file:///C:/... unter Windows
+    if re.match(r'^/[A-Za-z]:', path):
+        path = path[1:]
+    return Path(path)
+
+def utf16_column(line_text: str, column: int) -> int:
+    """Zeichen-Spalte (0-basiert) in LSP-Position (UTF-16 Code Units)"""
+    prefix = line_text[:column]
+    return column + sum(1 for char in prefix if ord(char) > 0xFFFF)
+
+class I18nLanguageServer:
+    def __init__(self, client_root: Path, reader: BinaryIO, writer: BinaryIO):
+        self.client_root = client_root.resolve()
+        self.reader = reader
+        self.writer = writer
+        self.extractor = I18nStringExtractor(str(self.client_root))
+        self.lib_dir = self.extractor.lib_dir.resolve()
+        self.l10n_dir = self.lib_dir / 'l10n'
+        self.existing_keys = self.extractor.load_existing_arb()
+        self.values = self.extractor.load_value_index()
+        self.documents: Dict[str, str] = {}
+        self.shutdown_requested = False
+
+    # --- Transport (Content-Length-Framing) ---
+
+    def read_message(self) -> Optional[Dict]:
+        headers = {}
+        while True:
+            line = self.reader.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode('ascii').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get('content-length', 0))
+        body = self.reader.read(length)
+        if len(body) < length:
+            return None
+        return json.loads(body.decode('utf-8'))
+
+    def send(self, message: Dict):
+        message['jsonrpc'] = '2.0'
+        body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+        self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+        self.writer.flush()
+
+    def respond(self, request_id, result=None, error: Optional[Dict] = None):
+        message = {'id': request_id}
+        if error is not None:
+            message['error'] = error
+        else:
+            message['result'] = result
+        self.send(message)
+
+    def notify(self, method: str, params: Dict):
+        self.send({'method': method, 'params': params})
+
+    # --- Protokoll ---
+
+    def run(self) -> int:
+        while True:
+            message = self.read_message()
+            if message is None:
+                return 0 if self.shutdown_requested else 1
+            if message.get('method') == 'exit':
+                return 0 if self.shutdown_requested else 1
+            self.dispatch(message)
+
+    def dispatch(self, message: Dict):
+        """handle() mit Fehlerbehandlung: ein kaputter Puffer darf den Server nicht beenden"""
+        try:
+            self.handle(message)
+        except Exception as e:
+            method = message.get('method')
+            text = f"Fehler bei {method}: {type(e).__name__}: {e}"
+            if message.get('id') is not None:
+                self.respond(message['id'], error={'code': INTERNAL_ERROR, 'message': text})
+            else:
+                self.notify('window/logMessage', {'type': MESSAGE_TYPE_ERROR, 'message': text})
+
+    def handle(self, message: Dict):
+        method = message.get('method')
+        request_id = message.get('id')
+        params = message.get('params') or {}
+
+        if method == 'initialize':
+            self.respond(request_id, {
+                'capabilities': {
+                    'textDocumentSync': {
+                        'openClose': True,
+                        'change': SYNC_FULL,
+                        'save': {'includeText': False}
+                    }
+                },
+                'serverInfo': {'name': 'weltenwind-i18n'}
+            })
+        elif method == 'shutdown':
+            self.shutdown_requested = True
+            self.respond(request_id, None)
+        elif method == 'textDocument/didOpen':
+            document = params['textDocument']
+            self.update_document(document['uri'], document['text'])
+        elif method == 'textDocument/didChange':
+            changes = params.get('contentChanges') or []
+            if changes:
+                self.update_document(params['textDocument']['uri'], changes[-1]['text'])
+        elif method == 'textDocument/didSave':
+            uri = params['textDocument']['uri']
+            path = uri_to_path(uri)
+            if path.suffix == '.arb' and path.parent.resolve() == self.l10n_dir:
+                # Neue Keys in app_de.arb: Dart-Puffer ohne die nun bekannten Keys neu melden
+                self.existing_keys = self.extractor.load_existing_arb()
+                self.values = self.extractor.load_value_index()
+                for open_uri in list(self.documents):
+                    if open_uri.endswith('.dart'):
+                        self.publish(open_uri)
+        elif method == 'textDocument/didClose':
+            uri = params['textDocument']['uri']
+            self.documents.pop(uri, None)
+            self.notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+        elif request_id is not None:
+            self.respond(request_id, error={'code': METHOD_NOT_FOUND,
+                                            'message': f"Unbekannte Methode: {method}"})
+
+    def update_document(self, uri: str, text: str):
+        self.documents[uri] = text
+        self.publish(uri)
+
+    def publish(self, uri: str):
+        text = self.documents.get(uri, '')
+        path = uri_to_path(uri)
+        if path.suffix == '.dart':
+            diagnostics = self.dart_diagnostics(path, text)
+        elif path.suffix == '.arb':
+            diagnostics = self.arb_diagnostics(path, text)
+        else:
+            diagnostics = []
+        self.notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': diagnostics})
+
+    # --- Diagnostics ---
+
+    def dart_diagnostics(self, path: Path, text: str) -> List[Dict]:
+        resolved = path.resolve()
+        if self.lib_dir not in resolved.parents:
+            return []
+        # Ignorierte und generierte Dateien wie im vollen Scan überspringen
+        if (self.extractor.walker.is_ignored(resolved)
+                or is_generated(resolved, text[:HEADER_BYTES].encode('utf-8', errors='replace'))):
+            return []
+
+        rel_path = str(resolved.relative_to(self.client_root))
+        lines = text.split('\n')
+        diagnostics = []
+        allocator = KeyAllocator(self.existing_keys)
+        for match in self.extractor.scan_content(text, rel_path):
+            key = self.extractor.assign_key(match, allocator, self.values)
+            if key in self.existing_keys and not match.localized_as:
+                continue
+            problem = self.extractor.problem_entry(match)
+            line_text = lines[match.line - 1]
+            start = match.column - 1
+            end = min(len(line_text), start + len(match.original) + 2)
+            diagnostics.append({
+                'range': {
+                    'start': {'line': match.line - 1, 'character': utf16_column(line_text, start)},
+                    'end': {'line': match.line - 1, 'character': utf16_column(line_text, end)}
+                },
+                'severity': _SEVERITIES[problem['severity']],
+                'code': problem['code'],
+                'source': problem['source'],
+                'message': f"{problem['message']} → {match.suggested_key}",
+                'data': problem['details']
+            })
+        return diagnostics
+
+    def arb_diagnostics(self, path: Path, text: str) -> List[Dict]:
+        validator = ArbValidator()
+        validator.validate_content(text, path.name)
+
+        lines = text.split('\n')
+        diagnostics = []
+        for error in validator.errors:
+            line = (error.line - 1) if error.line else self.locate_key(lines, error.message)
+            message = error.message
+            if error.suggestion:
+                message += f"\n💡 {error.suggestion}"
+            diagnostics.append({
+                'range': {
+                    'start': {'line': line, 'character': 0},
+                    'end': {'line': line, 'character': utf16_column(lines[line], len(lines[line]))
+                            if line < len(lines) else 0}
+                },
+                'severity': _SEVERITIES.get(error.severity, SEVERITY_INFORMATION),
+                'code': error.code,
+                'source': 'weltenwind-arb-validator',
+                'message': message
+            })
+        return diagnostics
+
+    def locate_key(self, lines: List[str], message: str) -> int:
+        """Zeile des in der Meldung genannten Keys (sonst Dateianfang)"""
+        for key in _QUOTED_KEY.findall(message):
+            needle = f'"{key}"'
+            for index, line_text in enumerate(lines):
+                if needle in line_text and ':' in line_text.split(needle, 1)[1]:
+                    return index
+        return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Language Server (stdio)')
+    parser.add_argument('--client-root', default=str(Path(__file__).resolve().parent.parent),
+                       help='Pfad zum Client-Root-Verzeichnis')
+    args = parser.parse_args()
+
+    # stdout gehört dem LSP-Protokoll, Tool-Ausgaben gehen nach stderr
+    reader = sys.stdin.buffer
+    writer = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    server = I18nLanguageServer(Path(args.client_root), reader, writer)
+    sys.exit(server.run())
+
+if __name__ == "__main__":
+    main()
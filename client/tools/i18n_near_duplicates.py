@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Near-Duplicate Clustering
+Findet fast gleiche Texte ("Bitte warten...", "Bitte warten…", "Bitte warten!")
+in Extractor-Treffern und .arb-Werten und schlägt pro Cluster einen Key vor
+
+Texte werden normalisiert (Groß-/Kleinschreibung, Leerraum, Satzzeichen am
+Ende); gleiche Normalform landet direkt im selben Cluster. Für die übrigen
+Normalformen bildet MinHash über Zeichen-3-Gramme eine Signatur, LSH
+(Bänder der Signatur als Bucket-Schlüssel) liefert Kandidatenpaare ohne
+paarweisen Vergleich. Kandidaten werden mit der exakten Jaccard-Ähnlichkeit
+bestätigt; Texte mit unterschiedlichen Platzhaltern oder Zahlen werden nie
+zusammengelegt.
+
+Kanonisch ist ein Key aus der .arb-Datei (schon übersetzt), sonst der
+häufigste Text im Code, dann der kürzere Text.
+
+Usage: python i18n_near_duplicates.py [--source report.json|report.jsonl|-] [--lang de] [--threshold 0.85]
+"""
+
+import re
+import json
+import zlib
+import random
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Signatur-Länge und Aufteilung in LSH-Bänder (BANDS * ROWS == NUM_PERM).
+# Mit 12 Bändern à 6 Zeilen wird ein Paar mit Jaccard 0.85 zu 99.7 %
+# Kandidat, eines mit 0.5 nur zu 17 % (und dann exakt verworfen).
+NUM_PERM = 72
+BANDS = 12
+ROWS = NUM_PERM // BANDS
+
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.85
+
+# Hash-Familie (a * x + b) mod p; p < 2^31 hält die Werte bei kleinen Ints.
+# Fester Seed: Signaturen sind über Läufe und Prozesse vergleichbar.
+_PRIME = (1 << 31) - 1
+_rng = random.Random(0x1D8)
+_COEFFICIENTS = [(_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(NUM_PERM)]
+
+_TRAILING = re.compile(r'[\s.…!?:;,]+$')
+_SPACES = re.compile(r'\s+')
+_FIXED_PARTS = re.compile(r'\{[^{}]*\}|\$\{[^}]*\}|\$\w+|\d+')
+
+@dataclass
+class ClusterMember:
+    key: str
+    text: str
+    source: str      # 'arb' oder 'code'
+    count: int = 1   # Vorkommen im Code
+
+@dataclass
+class NearDuplicateCluster:
+    canonical_key: str
+    canonical_text: str
+    members: List[ClusterMember] = field(default_factory=list)
+
+    @property
+    def reusable(self) -> bool:
+        """Kanonischer Key existiert schon in der .arb-Datei"""
+        return any(member.source == 'arb' and member.key == self.canonical_key for member in self.members)
+
+def normalize(text: str) -> str:
+    return _SPACES.sub(' ', _TRAILING.sub('', text.strip())).casefold()
+
+def fixed_parts(text: str) -> Tuple[str, ...]:
+    """Platzhalter und Zahlen: müssen für ein Cluster übereinstimmen"""
+    return tuple(sorted(_FIXED_PARTS.findall(text)))
+
+def shingles(normalized: str) -> Set[str]:
+    padded = f' {normalized} '
+    if len(padded) <= SHINGLE_SIZE:
+        return {padded}
+    return {padded[i:i + SHINGLE_SIZE] for i in range(len(padded) - SHINGLE_SIZE + 1)}
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+class MinHasher:
+    """MinHash-Signaturen; die Permutationswerte pro 3-Gramm werden einmal berechnet"""
+
+    def __init__(self):
+        self._rows: Dict[str, Tuple[int, ...]] = {}
+
+    def _row(self, shingle: str) -> Tuple[int, ...]:
+        row = self._rows.get(shingle)
+        if row is None:
+            x = zlib.crc32(shingle.encode('utf-8'))
+            row = self._rows[shingle] = tuple((a * x + b) % _PRIME for a, b in _COEFFICIENTS)
+        return row
+
+    def signature(self, shingle_set: Set[str]) -> Tuple[int, ...]:
+        # Spaltenweises Minimum über alle 3-Gramme (zip/min laufen in C)
+        return tuple(map(min, zip(*map(self._row, shingle_set))))
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, index: int) -> int:
+        parent = self.parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+def _canonical(members: List[ClusterMember]) -> ClusterMember:
+    return min(members, key=lambda m: (m.source != 'arb', -m.count, len(m.text), m.key))
+
+def cluster_strings(members: Iterable[ClusterMember],
+                    threshold: float = DEFAULT_THRESHOLD) -> Tuple[List[NearDuplicateCluster], Dict[str, int]]:
+    """Cluster mit mindestens zwei verschiedenen Keys, dazu Statistik
+
+    Die Reihenfolge der Cluster folgt dem ersten Mitglied in der Eingabe.
+    """
+    # Gleiche Normalform (und gleiche Platzhalter) ist immer ein Cluster
+    groups: Dict[Tuple[str, Tuple[str, ...]], List[ClusterMember]] = {}
+    for member in members:
+        groups.setdefault((normalize(member.text), fixed_parts(member.text)), []).append(member)
+    forms = list(groups)
+
+    hasher = MinHasher()
+    shingle_sets = [shingles(normalized) for normalized, _ in forms]
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for index, shingle_set in enumerate(shingle_sets):
+        signature = hasher.signature(shingle_set)
+        for band in range(BANDS):
+            buckets.setdefault((band, signature[band * ROWS:(band + 1) * ROWS]), []).append(index)
+
+    # Pro Bucket wird jede Normalform nur gegen einen Vertreter je bisherigem
+    # Cluster geprüft; große Buckets bleiben so linear in der Zahl der Cluster
+    union_find = _UnionFind(len(forms))
+    compared = 0
+    for bucket in buckets.values():
+        if len(bucket) < 2:
+            continue
+        representatives: Dict[int, int] = {union_find.find(bucket[0]): bucket[0]}
+        for index in bucket[1:]:
+            for root, other in list(representatives.items()):
+                if union_find.find(index) == union_find.find(root) or forms[index][1] != forms[other][1]:
+                    continue
+                compared += 1
+                if jaccard(shingle_sets[index], shingle_sets[other]) >= threshold:
+                    union_find.union(index, other)
+            representatives.setdefault(union_find.find(index), index)
+
+    by_root: Dict[int, List[ClusterMember]] = {}
+    for index, form in enumerate(forms):
+        by_root.setdefault(union_find.find(index), []).extend(groups[form])
+
+    clusters = []
+    for cluster_members in by_root.values():
+        if len({member.key for member in cluster_members}) < 2:
+            continue
+        canonical = _canonical(cluster_members)
+        clusters.append(NearDuplicateCluster(canonical.key, canonical.text, cluster_members))
+
+    stats = {'strings': sum(len(group) for group in groups.values()), 'forms': len(forms),
+             'compared': compared, 'clusters': len(clusters)}
+    return clusters, stats
+
+def arb_members(arb_data: Dict) -> List[ClusterMember]:
+    return [ClusterMember(key, value, 'arb') for key, value in arb_data.items()
+            if not key.startswith('@') and isinstance(value, str)]
+
+def extraction_members(extractions: Iterable[Dict]) -> List[ClusterMember]:
+    """Ein Mitglied pro Key, count = Zahl der Treffer"""
+    by_key: Dict[str, ClusterMember] = {}
+    for extraction in extractions:
+        key = extraction['suggested_key']
+        member = by_key.get(key)
+        if member is None:
+            by_key[key] = ClusterMember(key, extraction['original'], 'code')
+        else:
+            member.count += 1
+    return list(by_key.values())
+
+def canonical_keys(clusters: Iterable[NearDuplicateCluster]) -> Dict[str, NearDuplicateCluster]:
+    """Key -> Cluster für alle Keys, die auf einen anderen kanonischen Key zeigen"""
+    mapping = {}
+    for cluster in clusters:
+        for member in cluster.members:
+            if member.key != cluster.canonical_key:
+                mapping[member.key] = cluster
+    return mapping
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Near-Duplicate Clustering')
+    parser.add_argument('--source', '-s',
+                       help='JSON/JSONL-Report des String-Extractors ("-" = stdin); ohne: nur .arb-Werte')
+    parser.add_argument('--client-root', default=str(Path(__file__).resolve().parent.parent),
+                       help='Pfad zum Client-Root-Verzeichnis')
+    parser.add_argument('--lang', default='de',
+                       help='Sprache der .arb-Datei (app_<lang>.arb)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                       help='Minimale Jaccard-Ähnlichkeit der 3-Gramme (0.0-1.0)')
+    parser.add_argument('--json', metavar='FILE',
+                       help='Cluster zusätzlich als JSON speichern')
+    args = parser.parse_args()
+
+    from i18n_arb_converter import I18nArbConverter
+
+    print("🧩 Weltenwind i18n Near-Duplicate Clustering")
+    print("=" * 60)
+
+    converter = I18nArbConverter(args.client_root)
+    arb_data, _ = converter.load_existing_arb(args.lang)
+    members = arb_members(arb_data)
+    print(f"📋 {len(members)} Werte aus app_{args.lang}.arb")
+    if args.source:
+        code = extraction_members(converter.iter_extraction_report(args.source))
+        print(f"📊 {len(code)} Keys aus {args.source}")
+        members.extend(code)
+
+    clusters, stats = cluster_strings(members, args.threshold)
+    print(f"🔍 {stats['strings']} Strings, {stats['forms']} Normalformen, "
+          f"{stats['compared']} LSH-Kandidaten exakt geprüft")
+
+    saved = 0
+    for cluster in clusters:
+        saved += len({member.key for member in cluster.members}) - 1
+        marker = '♻️' if cluster.reusable else '🆕'
+        print(f"\n{marker} {cluster.canonical_key}: \"{cluster.canonical_text}\"")
+        for member in cluster.members:
+            if member.key != cluster.canonical_key:
+                usage = f", {member.count}× im Code" if member.source == 'code' else ''
+                print(f"   ← {member.key} ({member.source}{usage}): \"{member.text}\"")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'threshold': args.threshold, 'stats': stats,
+                       'clusters': [dict(asdict(cluster), reusable=cluster.reusable) for cluster in clusters]},
+                      f, indent=2, ensure_ascii=False)
+        print(f"\n📊 JSON-Daten gespeichert: {args.json}")
+
+    print()
+    if clusters:
+        print(f"🧩 {len(clusters)} Cluster - {saved} Keys könnten entfallen")
+    else:
+        print("✅ Keine fast gleichen Texte gefunden")
+
+if __name__ == "__main__":
+    main()
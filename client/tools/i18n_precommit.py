@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Pre-Commit Check
+Prüft die gestagten Versionen von .dart- und .arb-Dateien direkt aus dem git-Index
+
+Liest alle Blobs in einem 'git cat-file --batch'-Stream, ohne das
+Arbeitsverzeichnis anzufassen und ohne einen Prozess pro Datei.
+
+Usage: python client/tools/i18n_precommit.py [--warn-only] [--all-lines]
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+from i18n_git import GitError, staged_changes, read_blobs, line_in_ranges
+from i18n_string_extractor import I18nStringExtractor, decode_source
+from i18n_source_walker import is_generated
+from i18n_key_allocator import KeyAllocator
+from arb_validator import ArbValidator
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Pre-Commit Check')
+    parser.add_argument('--client-root', default=str(Path(__file__).resolve().parent.parent),
+                       help='Pfad zum Client-Root-Verzeichnis')
+    parser.add_argument('--all-lines', action='store_true',
+                       help='Treffer in der ganzen gestagten Datei melden, nicht nur in geänderten Zeilen')
+    parser.add_argument('--warn-only', action='store_true',
+                       help='Nur melden, Commit nie blockieren')
+    args = parser.parse_args()
+
+    client_root = Path(args.client_root)
+    try:
+        staged = staged_changes(client_root)
+        blobs = read_blobs(sorted({blob for blob, _ in staged.values()}), client_root)
+    except GitError as e:
+        print(f"❌ i18n Pre-Commit: {e}")
+        sys.exit(1)
+
+    dart_files = sorted(path for path in staged if path.endswith('.dart'))
+    arb_files = sorted(path for path in staged if path.endswith('.arb'))
+    if not dart_files and not arb_files:
+        sys.exit(0)
+
+    print(f"🌍 i18n Pre-Commit: {len(dart_files)} Dart-, {len(arb_files)} ARB-Dateien im Index")
+    findings = 0
+
+    if dart_files:
+        extractor = I18nStringExtractor(str(client_root))
+        lib_prefix = extractor.lib_dir.relative_to(extractor.client_root).as_posix() + '/'
+        # Ein Allocator für alle Dateien, mit den Keys aus app_de.arb wie im vollen Scan:
+        # kollidierende Texte zeigen unterschiedliche Keys, nie einen schon vergebenen
+        allocator = KeyAllocator(extractor.load_existing_arb())
+        # Schon übersetzte Texte zeigen den vorhandenen Key statt eines neuen
+        values = extractor.load_value_index()
+        for path in dart_files:
+            # Ignorierte und generierte Dateien wie im vollen Scan überspringen
+            if not path.startswith(lib_prefix) or extractor.walker.is_ignored(client_root / path):
+                continue
+            blob, ranges = staged[path]
+            data = blobs.get(blob, b'')
+            if is_generated(path, data):
+                continue
+            # Blobs ohne mögliches German-Literal gar nicht erst dekodieren
+            if not extractor.rules.prefilter.may_match(data):
+                continue
+            # Wie im vollen Scan: ungültiges UTF-8 überspringen, CRLF wie LF zählen
+            try:
+                content = decode_source(data)
+            except UnicodeDecodeError as e:
+                print(f"  ⚠️ Fehler beim Lesen von {path}: {e}")
+                continue
+            for match in extractor.scan_content(content, path):
+                if not args.all_lines and not line_in_ranges(match.line, ranges):
+                    continue
+                findings += 1
+                extractor.assign_key(match, allocator, values)
+                hint = " (bereits lokalisiert)" if match.localized_as else ""
+                print(f"  ❌ {path}:{match.line}:{match.column} Hardcoded deutscher Text: "
+                      f"{match.quote_type}{match.original}{match.quote_type} → {match.suggested_key}{hint}")
+
+    if arb_files:
+        validator = ArbValidator()
+        for path in arb_files:
+            blob, _ = staged[path]
+            try:
+                content = decode_source(blobs.get(blob, b''))
+            except UnicodeDecodeError as e:
+                validator.add_error('error', 'FILE_READ', f'Datei kann nicht gelesen werden: {e}',
+                                    file_path=path)
+                continue
+            validator.validate_content(content, path)
+        for error in validator.errors:
+            if error.severity != 'error':
+                continue
+            findings += 1
+            line_info = f":{error.line}" if error.line else ""
+            print(f"  ❌ {error.file_path}{line_info} [{error.code}] {error.message}")
+
+    if findings == 0:
+        print("✅ Keine i18n-Probleme in gestagten Änderungen")
+        sys.exit(0)
+
+    print(f"❌ {findings} i18n-Probleme in gestagten Änderungen")
+    if args.warn_only:
+        sys.exit(0)
+    print("💡 Lokalisieren oder mit 'git commit --no-verify' überspringen")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Scan Profiler
+Misst Kosten und Nutzen der einzelnen Extractor-Regeln und Scan-Stufen (--profile)
+
+Stufen-Zeiten messen den echten (kompilierten) Scan-Pfad. Die Regel-Zeiten
+stammen aus einer separaten Einzelauswertung jeder Regel auf denselben
+Eingaben und sind daher als relative Kosten zu lesen.
+"""
+
+import re
+import json
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Set, Tuple
+
+STAGES = ('read', 'lex', 'match', 'exclude', 'context', 'categorize', 'report')
+
+@dataclass
+class RuleProfile:
+    kind: str           # 'german', 'exclude' oder 'category'
+    rule: str           # Regel-ID wie im kompilierten Regelsatz (g0, x3, whitelist, Kategorie)
+    pattern: str
+    weight: float = 0.0  # Konfidenz bzw. Kategorie-Bonus
+    examined: int = 0   # geprüfte Eingaben
+    matched: int = 0    # Eingaben, auf die die Regel passt
+    decisive: int = 0   # Eingaben, deren Ergebnis diese Regel bestimmt hat
+    time_ns: int = 0
+
+@dataclass
+class FileProfile:
+    file: str
+    time_ns: int = 0
+    literals: int = 0
+    candidates: int = 0
+    matches: int = 0
+
+class ScanProfiler:
+    def __init__(self, german_patterns: List[Tuple[str, float]], exclude_patterns: List[str],
+                 whitelist: Set[str], category_patterns: Dict[str, Tuple[str, float]]):
+        self.stage_ns: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.files: Dict[str, FileProfile] = {}
+        self.rules: Dict[str, RuleProfile] = {}
+        self.whitelist = whitelist
+        # Literale/Kandidaten der gerade gescannten Datei (für add_file)
+        self._counts = (0, 0)
+
+        # German-Patterns wie im kompilierten Satz: innerer Teil, fullmatch, je Quote-Typ
+        self.german: Dict[str, List[Tuple[RuleProfile, re.Pattern]]] = {'"': [], "'": []}
+        for index, (pattern, confidence) in enumerate(german_patterns):
+            profile = self._add(RuleProfile('german', f'g{index}', pattern, confidence))
+            self.german.setdefault(pattern[0], []).append(
+                (profile, re.compile(pattern[1:-1], re.IGNORECASE)))
+
+        self.whitelist_profile = self._add(RuleProfile('exclude', 'whitelist', f'{len(whitelist)} Einträge'))
+        self.exclude = [(self._add(RuleProfile('exclude', f'x{index}', pattern)), re.compile(pattern))
+                        for index, pattern in enumerate(exclude_patterns)]
+        self.category = [(self._add(RuleProfile('category', category, pattern, boost)), re.compile(pattern))
+                         for category, (pattern, boost) in category_patterns.items()]
+
+    def _add(self, profile: RuleProfile) -> RuleProfile:
+        self.rules[f'{profile.kind}:{profile.rule}'] = profile
+        return profile
+
+    # --- Erfassung ---
+
+    def add_stage(self, stage: str, elapsed_ns: int):
+        self.stage_ns[stage] += elapsed_ns
+
+    def count_candidates(self, literals: int, candidates: int):
+        # Fensterweise gescannte Dateien melden mehrfach
+        self._counts = (self._counts[0] + literals, self._counts[1] + candidates)
+
+    def add_file(self, rel_path: str, elapsed_ns: int, matches: int):
+        literals, candidates = self._counts
+        self._counts = (0, 0)
+        self.files[rel_path] = FileProfile(rel_path, elapsed_ns, literals, candidates, matches)
+
+    def profile_literal(self, text: str, quote: str, decisive: Optional[str]):
+        """Wertet jedes German-Pattern des Quote-Typs einzeln auf einem Literal aus"""
+        clock = time.perf_counter_ns
+        for profile, pattern in self.german.get(quote, ()):
+            started = clock()
+            matched = pattern.fullmatch(text) is not None
+            profile.time_ns += clock() - started
+            profile.examined += 1
+            if matched:
+                profile.matched += 1
+                if profile.rule == decisive:
+                    profile.decisive += 1
+
+    def profile_exclude(self, text: str, decisive: Optional[str]):
+        clock = time.perf_counter_ns
+        started = clock()
+        in_whitelist = text in self.whitelist
+        self.whitelist_profile.time_ns += clock() - started
+        self.whitelist_profile.examined += 1
+        if in_whitelist:
+            self.whitelist_profile.matched += 1
+            if decisive == 'whitelist':
+                self.whitelist_profile.decisive += 1
+
+        for profile, pattern in self.exclude:
+            started = clock()
+            matched = pattern.match(text) is not None
+            profile.time_ns += clock() - started
+            profile.examined += 1
+            if matched:
+                profile.matched += 1
+                if profile.rule == decisive:
+                    profile.decisive += 1
+
+    def profile_category(self, context_lower: str, decisive: Optional[str]):
+        clock = time.perf_counter_ns
+        for profile, pattern in self.category:
+            started = clock()
+            matched = pattern.search(context_lower) is not None
+            profile.time_ns += clock() - started
+            profile.examined += 1
+            if matched:
+                profile.matched += 1
+                if profile.rule == decisive:
+                    profile.decisive += 1
+
+    # --- Ausgabe ---
+
+    def to_dict(self) -> Dict:
+        total_ns = sum(self.stage_ns.values())
+        return {
+            'stages': {stage: {'ms': round(ns / 1e6, 3),
+                               'share': round(ns / total_ns, 4) if total_ns else 0.0}
+                       for stage, ns in self.stage_ns.items()},
+            'total_ms': round(total_ns / 1e6, 3),
+            'rules': [dict(asdict(profile), time_ms=round(profile.time_ns / 1e6, 3))
+                      for profile in self.rules.values()],
+            'files': [dict(asdict(profile), time_ms=round(profile.time_ns / 1e6, 3))
+                      for profile in sorted(self.files.values(), key=lambda f: -f.time_ns)]
+        }
+
+    def save(self, output_file: str):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        print(f"⏱️ Profil gespeichert: {output_file}")
+
+    def print_table(self, top: int = 10):
+        total_ns = sum(self.stage_ns.values()) or 1
+        print()
+        print("=" * 60)
+        print("⏱️ PROFIL")
+        print("=" * 60)
+        print(f"{'Stufe':<12}{'Zeit (ms)':>12}{'Anteil':>10}")
+        for stage, ns in self.stage_ns.items():
+            print(f"{stage:<12}{ns / 1e6:>12.2f}{ns / total_ns:>10.1%}")
+        print(f"{'gesamt':<12}{total_ns / 1e6:>12.2f}")
+
+        titles = {'german': '🔎 German-Patterns', 'exclude': '🚫 Exclude-Patterns', 'category': '🏷️ Kategorie-Patterns'}
+        for kind, title in titles.items():
+            profiles = [p for p in self.rules.values() if p.kind == kind]
+            print(f"\n{title} (teuerste zuerst)")
+            print(f"{'Regel':<12}{'geprüft':>9}{'passt':>8}{'entsch.':>9}{'Zeit (ms)':>11}  Pattern")
+            for profile in sorted(profiles, key=lambda p: -p.time_ns)[:top]:
+                pattern = profile.pattern if len(profile.pattern) <= 40 else profile.pattern[:37] + '...'
+                print(f"{profile.rule:<12}{profile.examined:>9}{profile.matched:>8}"
+                      f"{profile.decisive:>9}{profile.time_ns / 1e6:>11.2f}  {pattern}")
+            unused = [p.rule for p in profiles if p.examined and not p.matched and p.rule != 'whitelist']
+            if unused:
+                print(f"⚠️ {len(unused)} Regeln ohne Treffer (Kandidaten zum Entfernen): {', '.join(unused)}")
+
+        if self.files:
+            print(f"\n📁 Langsamste Dateien")
+            print(f"{'Zeit (ms)':>10}{'Literale':>10}{'Kand.':>7}{'Treffer':>9}  Datei")
+            for profile in sorted(self.files.values(), key=lambda f: -f.time_ns)[:top]:
+                print(f"{profile.time_ns / 1e6:>10.2f}{profile.literals:>10}{profile.candidates:>7}"
+                      f"{profile.matches:>9}  {profile.file}")
@@ -27,6 +27,7 @@ echo   convert-all             - Alles: Konvertierung + Code-Updates
 echo   update                  - Update bestehender Übersetzungen
 echo   validate                - Nur .arb-Dateien validieren
 echo   check                   - Schnelle Prüfung für CI/CD
+echo   watch                   - Dauer-Scan: problems.json bei jeder Änderung aktualisieren
 echo   clean                   - Aufräumen von Reports/Backups
 echo.
 echo 🎯 Beispiele:
@@ -163,7 +164,14 @@ if "%~1"=="scan" (
     call :check_prerequisites
     if errorlevel 1 exit /b 1
     call :print_header "CI/CD-Modus: Schnelle Prüfung"
-    call :run_workflow "ci" "--fail-on-warnings"
+    call :run_workflow "ci" "--fail-on-warnings --jobs 0"
+    
+) else if "%~1"=="watch" (
+    call :check_prerequisites
+    if errorlevel 1 exit /b 1
+    call :print_header "Watch-Modus: Dauer-Scan von lib/"
+    if not exist "tools\workflow_reports" mkdir "tools\workflow_reports"
+    python tools\i18n_string_extractor.py --watch --output tools\workflow_reports\i18n_watch.md
     
 ) else if "%~1"=="clean" (
     call :print_header "Aufräumen"
@@ -187,6 +195,12 @@ if "%~1"=="scan" (
         rmdir /s /q "tools\code_backups"
     )
     
+    REM Scan-Cache
+    if exist "tools\.i18n_cache" (
+        echo 🗑️ Lösche Scan-Cache...
+        rmdir /s /q "tools\.i18n_cache"
+    )
+    
     call :print_success "Aufräumen abgeschlossen"
     
 ) else if "%~1"=="help" (
@@ -26,6 +26,7 @@ print_usage() {
     echo "  update                  - Update bestehender Übersetzungen"
     echo "  validate                - Nur .arb-Dateien validieren"
     echo "  check                   - Schnelle Prüfung für CI/CD"
+    echo "  watch                   - Dauer-Scan: problems.json bei jeder Änderung aktualisieren"
     echo "  clean                   - Aufräumen von Reports/Backups"
     echo ""
     echo "🎯 Beispiele:"
@@ -162,7 +163,14 @@ case "$1" in
     "check")
         check_prerequisites
         print_header "CI/CD-Modus: Schnelle Prüfung"
-        run_workflow "ci" "--fail-on-warnings"
+        run_workflow "ci" "--fail-on-warnings --jobs 0"
+        ;;
+    
+    "watch")
+        check_prerequisites
+        print_header "Watch-Modus: Dauer-Scan von lib/"
+        mkdir -p tools/workflow_reports
+        python tools/i18n_string_extractor.py --watch --output tools/workflow_reports/i18n_watch.md
         ;;
     
     "clean")
@@ -187,6 +195,12 @@ case "$1" in
             rm -rf tools/code_backups/
         fi
         
+        # Scan-Cache
+        if [[ -d "tools/.i18n_cache" ]]; then
+            echo "🗑️ Lösche Scan-Cache..."
+            rm -rf tools/.i18n_cache/
+        fi
+        
         print_success "Aufräumen abgeschlossen"
         ;;
     
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Regex Stress Test
+Prüft alle Regexes von I18nStringExtractor und ArbValidator mit
+pathologischen Eingaben auf katastrophales Backtracking
+
+Jede Regel wird mit generierten Eingaben (lange Quote-Läufe, viele Quotes,
+Umlaut-Ketten, Wiederholungen der Pattern-Wörter, jeweils mit und ohne
+scheiternden Abschluss) in zwei Längen geprüft. Gemessen wird der
+schlechteste Einzelaufruf; die Längen-Verdopplung zeigt superlineares
+Wachstum. Die Messung läuft in einem eigenen Prozess, der bei einer
+hängenden Regel abgebrochen wird.
+
+Usage: python client/tools/i18n_regex_stress.py [--length 1000] [--budget-ms 100]
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Iterator, List, Optional, Tuple
+
+# Füllmuster für generierte Eingaben (werden auf die Ziel-Länge wiederholt)
+BASE_FILLS = ('a', 'ä', 'ß', ' ', 'a ', 'Ab ', '"', "'", '"a', "'a", '\\', 'A_', 'a.',
+              'a=', 'a:', '{a,', '${', '{', '<', '()', '[', '!?')
+
+# Scheiternde Abschlüsse erzwingen vollständiges Backtracking
+SUFFIXES = ('', '\n', '"\x00')
+
+# Ab diesem Faktor bei doppelter Länge gilt eine Regel als superlinear (linear ≈ 2, quadratisch ≈ 4)
+SUPERLINEAR_GROWTH = 3.0
+
+_PATTERN_WORD = re.compile(r'(?<!\\)[A-Za-zÄÖÜäöüß]{2,}')
+
+@dataclass
+class RegexCase:
+    name: str      # z.B. 'exclude:x18' oder 'arb:key_naming'
+    pattern: str
+    mode: str      # 'match', 'fullmatch', 'search', 'findall' oder 'sub'
+    flags: int = 0
+
+@dataclass
+class StressResult:
+    name: str
+    pattern: str
+    worst_ms: float = 0.0
+    half_ms: float = 0.0
+    worst_input: str = ''
+    timed_out: bool = False
+
+    @property
+    def growth(self) -> Optional[float]:
+        # Unterhalb von 0.05 ms ist das Verhältnis nur Messrauschen
+        if self.timed_out or self.half_ms < 0.05:
+            return None
+        return self.worst_ms / self.half_ms
+
+def collect_cases(extractor, validator) -> List[RegexCase]:
+    """Alle Regexes beider Tools, so wie sie im Scan bzw. in der Validierung angewendet werden"""
+    cases = []
+    for index, (pattern, _) in enumerate(extractor.german_patterns):
+        # Der Lexer liefert Literale ohne Quotes, angewendet wird der innere Teil
+        cases.append(RegexCase(f'german:g{index}', pattern[1:-1], 'fullmatch', re.IGNORECASE))
+    for index, pattern in enumerate(extractor.exclude_patterns):
+        cases.append(RegexCase(f'exclude:x{index}', pattern, 'match'))
+    for category, (pattern, _) in extractor.category_patterns.items():
+        cases.append(RegexCase(f'category:{category}', pattern, 'search'))
+
+    # Kombinierte Matcher aus dem Regel-Compiler (das, was im Scan tatsächlich läuft)
+    rules = extractor.rules
+    compiled = [(f'compiled:literal{quote}', combined, 'fullmatch')
+                for quote, combined in rules.literal.by_quote.items()]
+    compiled.append(('compiled:exclude_anchored', rules.exclude.anchored, 'match'))
+    compiled.append(('compiled:exclude_floating', rules.exclude.floating, 'search'))
+    compiled.extend((f'compiled:exclude_x{index}', core, 'search')
+                    for _, core, index in rules.exclude.prefiltered)
+    compiled.append(('compiled:category', rules.category.combined, 'search'))
+    for name, regex, mode in compiled:
+        if regex is not None:
+            cases.append(RegexCase(name, regex.pattern, mode, regex.flags & ~re.UNICODE))
+
+    for index, pattern in enumerate(validator.placeholder_patterns):
+        cases.append(RegexCase(f'arb:placeholder{index}', pattern, 'findall'))
+    for index, (pattern, _) in enumerate(validator.forbidden_patterns):
+        cases.append(RegexCase(f'arb:forbidden{index}', pattern, 'search', re.IGNORECASE))
+    cases.append(RegexCase('arb:key_naming', validator.key_naming_pattern, 'match'))
+    cases.append(RegexCase('arb:key_suffix', validator.key_suffix_pattern, 'sub'))
+    cases.append(RegexCase('arb:placeholder_span', validator.placeholder_span_pattern, 'sub'))
+    return cases
+
+def adversarial_inputs(pattern: str, length: int) -> Iterator[Tuple[str, str]]:
+    """Liefert (Beschreibung, Eingabe) für generische und aus dem Pattern abgeleitete Füllmuster"""
+    words = list(dict.fromkeys(_PATTERN_WORD.findall(pattern)))[:6]
+    fills = list(BASE_FILLS)
+    for word in words:
+        fills.extend((word, word + ' ', word.lower() + 'ä'))
+
+    for fill in fills:
+        body = (fill * (length // len(fill) + 1))[:length]
+        for suffix in SUFFIXES:
+            yield f'{fill!r}×{length}{suffix!r}', body + suffix
+
+def stress_case(case: RegexCase, length: int) -> StressResult:
+    regex = re.compile(case.pattern, case.flags)
+    if case.mode == 'sub':
+        apply = lambda text: regex.sub('', text)
+    else:
+        apply = getattr(regex, case.mode)
+
+    clock = time.perf_counter_ns
+    result = StressResult(case.name, case.pattern)
+    half = max(1, length // 2)
+    for (label, text), (_, half_text) in zip(adversarial_inputs(case.pattern, length),
+                                             adversarial_inputs(case.pattern, half)):
+        started = clock()
+        apply(text)
+        elapsed_ms = (clock() - started) / 1e6
+        if elapsed_ms > result.worst_ms:
+            started = clock()
+            apply(half_text)
+            result.half_ms = (clock() - started) / 1e6
+            result.worst_ms = elapsed_ms
+            result.worst_input = label
+    return result
+
+def _stress_worker(cases: List[RegexCase], start: int, length: int, connection):
+    # Direkt über die Pipe senden: ein Queue-Feeder-Thread käme neben einer
+    # hängenden Regex (die den GIL hält) nicht mehr zum Zug
+    for index in range(start, len(cases)):
+        connection.send(stress_case(cases[index], length))
+
+def run_stress(cases: List[RegexCase], length: int, timeout: float) -> List[StressResult]:
+    """Misst alle Regeln in einem Hilfsprozess; hängt eine Regel länger als timeout
+    Sekunden, wird der Prozess beendet und ab der nächsten Regel neu gestartet."""
+    results: List[StressResult] = []
+    while len(results) < len(cases):
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        worker = multiprocessing.Process(target=_stress_worker,
+                                         args=(cases, len(results), length, sender),
+                                         daemon=True)
+        worker.start()
+        sender.close()
+        try:
+            while len(results) < len(cases):
+                if not receiver.poll(timeout):
+                    case = cases[len(results)]
+                    results.append(StressResult(case.name, case.pattern,
+                                                worst_ms=timeout * 1000, timed_out=True))
+                    break
+                results.append(receiver.recv())
+        finally:
+            worker.kill()
+            worker.join()
+            receiver.close()
+    return results
+
+def _shorten(pattern: str, limit: int = 80) -> str:
+    return pattern if len(pattern) <= limit else pattern[:limit - 3] + '...'
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Regex Stress Test')
+    parser.add_argument('--client-root', default=str(Path(__file__).resolve().parent.parent),
+                       help='Pfad zum Client-Root-Verzeichnis')
+    parser.add_argument('--length', type=int, default=1000,
+                       help='Länge der generierten Eingaben (zusätzlich halbe Länge für das Wachstum)')
+    parser.add_argument('--budget-ms', type=float, default=100.0,
+                       help='Maximale Zeit pro Einzelaufruf, sonst Exit-Code 1')
+    parser.add_argument('--timeout', type=float, default=30.0,
+                       help='Abbruch einer Regel nach so vielen Sekunden (gilt als Fehlschlag)')
+    parser.add_argument('--only', metavar='TEXT',
+                       help='Nur Regeln, deren Name TEXT enthält (z.B. "exclude:" oder "arb:")')
+    parser.add_argument('--top', type=int, default=15,
+                       help='Anzahl der langsamsten Regeln in der Tabelle')
+    parser.add_argument('--json', metavar='FILE',
+                       help='Ergebnisse zusätzlich als JSON speichern')
+    args = parser.parse_args()
+
+    from i18n_string_extractor import I18nStringExtractor
+    from arb_validator import ArbValidator
+
+    cases = collect_cases(I18nStringExtractor(args.client_root), ArbValidator())
+    if args.only:
+        cases = [case for case in cases if args.only in case.name]
+
+    print("🧨 Weltenwind i18n Regex Stress Test")
+    print("=" * 60)
+    print(f"📐 {len(cases)} Regeln, Eingaben mit {args.length} Zeichen, Budget {args.budget_ms:g} ms pro Aufruf")
+
+    started = time.perf_counter()
+    results = run_stress(cases, args.length, args.timeout)
+    elapsed = time.perf_counter() - started
+
+    results.sort(key=lambda result: -result.worst_ms)
+    failed = [result for result in results if result.timed_out or result.worst_ms > args.budget_ms]
+    superlinear = [result for result in results
+                   if result.growth is not None and result.growth >= SUPERLINEAR_GROWTH
+                   and result.worst_ms >= 1.0]
+
+    print(f"\n{'Regel':<28}{'max (ms)':>10}{'½ Länge':>10}{'Faktor':>8}  Eingabe")
+    shown = results[:args.top] + [result for result in failed if result not in results[:args.top]]
+    for result in shown:
+        growth = f"{result.growth:.1f}" if result.growth is not None else '-'
+        marker = '❌' if result in failed else ('⚠️' if result in superlinear else '  ')
+        worst = 'TIMEOUT' if result.timed_out else f"{result.worst_ms:.2f}"
+        print(f"{marker} {result.name:<25}{worst:>10}{result.half_ms:>10.2f}{growth:>8}  {result.worst_input}")
+
+    if superlinear:
+        print(f"\n⚠️ {len(superlinear)} Regeln wachsen superlinear (Faktor ≥ {SUPERLINEAR_GROWTH:g} bei doppelter Länge):")
+        for result in superlinear:
+            print(f"   {result.name}: {_shorten(result.pattern)}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'length': args.length,
+                'budget_ms': args.budget_ms,
+                'results': [dict(asdict(result), growth=result.growth) for result in results]
+            }, f, indent=2, ensure_ascii=False)
+        print(f"📊 JSON-Daten gespeichert: {args.json}")
+
+    print(f"\n⏱️ {len(results)} Regeln in {elapsed:.1f} s geprüft")
+    if failed:
+        print(f"❌ {len(failed)} Regeln überschreiten das Budget von {args.budget_ms:g} ms:")
+        for result in failed:
+            print(f"   {result.name}: {_shorten(result.pattern)}")
+        sys.exit(1)
+    print("✅ Alle Regeln innerhalb des Budgets")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Report Writers
+Streamende Ausgabe für Extractor und Validator: SARIF 2.1.0, JSON/JSON Lines
+und der Markdown-Report, jeweils optional gzip-komprimiert (Pfad auf .gz)
+
+Jeder Writer schreibt Einträge, sobald sie anfallen, in eine temporäre Datei
+neben dem Ziel und ersetzt das Ziel erst bei close() atomar. Sortierte
+Ausgaben (Markdown, JSON-Array) legen die fertig formatierten Einträge in
+einer Spool-Datei ab; im Speicher bleiben nur Sortierschlüssel, Offset und
+Länge pro Eintrag.
+"""
+
+import os
+import sys
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from i18n_source_walker import find_git_root
+
+GZIP_LEVEL = 6
+
+SARIF_VERSION = '2.1.0'
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+# SARIF-Level je Severity des Validators
+SARIF_LEVELS = {'error': 'error', 'warning': 'warning', 'info': 'note'}
+
+def _open_text(path: str, mode: str, compressed: bool) -> TextIO:
+    if compressed:
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=GZIP_LEVEL)
+    return open(path, mode, encoding='utf-8')
+
+def open_output(path: str) -> TextIO:
+    """Text-Stream zum Schreiben: "-" = stdout, *.gz gzip-komprimiert"""
+    if path == '-':
+        return sys.stdout
+    return _open_text(path, 'w', path.endswith('.gz'))
+
+def open_input(path: str) -> TextIO:
+    """Text-Stream zum Lesen, *.gz wird transparent entpackt"""
+    return _open_text(path, 'r', path.endswith('.gz'))
+
+class AtomicOutput:
+    """Schreibt nach <path>.tmp; commit() ersetzt path, discard() verwirft"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.stream = _open_text(self.tmp_path, 'w', path.endswith('.gz'))
+
+    def write(self, text: str):
+        self.stream.write(text)
+
+    def commit(self):
+        self.stream.close()
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self):
+        self.stream.close()
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+class SortedSpool:
+    """Einträge auf Platte, sortiert (stabil) wieder ausgelesen
+
+    Im Speicher steht pro Eintrag nur (Schlüssel, Offset, Länge).
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._index: List[Tuple[Any, int, int]] = []
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, key, record: str):
+        data = record.encode('utf-8')
+        self._file.write(data)
+        self._index.append((key, self._offset, len(data)))
+        self._offset += len(data)
+
+    def records(self) -> Iterator[Tuple[Any, str]]:
+        self._file.flush()
+        self._index.sort(key=lambda entry: entry[0])
+        for key, offset, length in self._index:
+            self._file.seek(offset)
+            yield key, self._file.read(length).decode('utf-8')
+
+    def close(self):
+        self._file.close()
+        self._index = []
+
+class JsonArrayWriter:
+    """JSON-Array mit indent=2 (wie json.dump), Elemente nach Schlüssel sortiert"""
+
+    def __init__(self, path: str):
+        self.output = AtomicOutput(path)
+        self.spool = SortedSpool()
+
+    def add(self, key, item: Dict):
+        text = json.dumps(item, indent=2, ensure_ascii=False)
+        self.spool.add(key, '  ' + text.replace('\n', '\n  '))
+
+    def close(self):
+        if not len(self.spool):
+            self.output.write('[]')
+        else:
+            self.output.write('[\n')
+            for index, (_, record) in enumerate(self.spool.records()):
+                if index:
+                    self.output.write(',\n')
+                self.output.write(record)
+            self.output.write('\n]')
+        self.spool.close()
+        self.output.commit()
+
+    def discard(self):
+        self.spool.close()
+        self.output.discard()
+
+class SarifWriter:
+    """SARIF 2.1.0 mit einem Run; Ergebnisse werden sofort geschrieben
+
+    Das tool-Objekt (mit allen benutzten Regeln) folgt nach den Ergebnissen,
+    die Reihenfolge der Schlüssel ist in JSON ohne Bedeutung.
+    """
+
+    def __init__(self, path: str, tool_name: str, information_uri: Optional[str] = None):
+        self.output = AtomicOutput(path)
+        self.tool_name = tool_name
+        self.information_uri = information_uri
+        self.rules: Dict[str, Dict] = {}
+        self.count = 0
+        self._uris: Dict[str, str] = {}
+        self.output.write(f'{{"$schema": "{SARIF_SCHEMA}", "version": "{SARIF_VERSION}", "runs": [{{\n'
+                          f'"columnKind": "unicodeCodePoints",\n"results": [')
+
+    def add_rule(self, rule_id: str, description: str, level: str = 'warning'):
+        self.rules.setdefault(rule_id, {
+            'id': rule_id,
+            'shortDescription': {'text': description},
+            'defaultConfiguration': {'level': level}
+        })
+
+    def artifact_uri(self, path) -> str:
+        """Pfad relativ zum Git-Root (Basis von %SRCROOT% im Code-Scanning)"""
+        uri = self._uris.get(str(path))
+        if uri is None:
+            resolved = Path(path).resolve()
+            root = find_git_root(resolved.parent)
+            uri = (resolved.relative_to(root) if root is not None else Path(path)).as_posix()
+            self._uris[str(path)] = uri
+        return uri
+
+    def add_result(self, rule_id: str, level: str, message: str, path: Optional[str],
+                   line: Optional[int] = None, column: Optional[int] = None,
+                   end_column: Optional[int] = None, properties: Optional[Dict] = None,
+                   fingerprint: Optional[str] = None):
+        if rule_id not in self.rules:
+            self.add_rule(rule_id, rule_id, level)
+        result: Dict[str, Any] = {'ruleId': rule_id, 'level': level, 'message': {'text': message}}
+        if path is not None:
+            location: Dict[str, Any] = {'artifactLocation': {'uri': self.artifact_uri(path), 'uriBaseId': '%SRCROOT%'}}
+            if line:
+                region = {'startLine': line}
+                if column:
+                    region['startColumn'] = column
+                if end_column:
+                    region['endColumn'] = end_column
+                location['region'] = region
+            result['locations'] = [{'physicalLocation': location}]
+        if fingerprint is not None:
+            result['partialFingerprints'] = {f'{rule_id}/v1': fingerprint}
+        if properties:
+            result['properties'] = properties
+        self.output.write((',\n' if self.count else '\n') + json.dumps(result, ensure_ascii=False))
+        self.count += 1
+
+    def close(self):
+        driver: Dict[str, Any] = {'name': self.tool_name}
+        if self.information_uri:
+            driver['informationUri'] = self.information_uri
+        driver['rules'] = list(self.rules.values())
+        self.output.write('\n],\n"tool": ' + json.dumps({'driver': driver}, ensure_ascii=False) + '\n}]}\n')
+        self.output.commit()
+
+    def discard(self):
+        self.output.discard()
+
+class MarkdownReportWriter:
+    """Markdown-Report des Extractors
+
+    Treffer werden sofort formatiert und gespoolt; Kopf und Statistik
+    entstehen bei close(). Reihenfolge wie bisher: Konfidenz absteigend,
+    dann Kategorie, dann Datei. Bereits lokalisierte Texte (add_localized)
+    folgen in einem eigenen Abschnitt in Fund-Reihenfolge.
+    """
+
+    def __init__(self, path: str):
+        self.output = AtomicOutput(path)
+        self.spool = SortedSpool()
+        self.categories: Dict[str, int] = {}
+        self.confidence_distribution = {'high': 0, 'medium': 0, 'low': 0}
+        # Quote-Typ -> (Zähler, erster Schlüssel in Report-Reihenfolge)
+        self.quote_types: Dict[str, List] = {}
+        self.localized = SortedSpool()
+
+    def add(self, key, match):
+        self.categories[match.category] = self.categories.get(match.category, 0) + 1
+        first = (key, len(self.spool))
+        quote = self.quote_types.setdefault(match.quote_type, [0, first])
+        quote[0] += 1
+        quote[1] = min(quote[1], first)
+
+        if match.confidence >= 0.8:
+            self.confidence_distribution['high'] += 1
+        elif match.confidence >= 0.6:
+            self.confidence_distribution['medium'] += 1
+        else:
+            self.confidence_distribution['low'] += 1
+
+        confidence_emoji = "🔥" if match.confidence >= 0.8 else "⚠️" if match.confidence >= 0.6 else "❓"
+        self.spool.add((key, match.category), (
+            f"**{match.suggested_key}** {confidence_emoji} (Confidence: {match.confidence:.1f})\n"
+            f"- 📁 `{match.file}:{match.line}:{match.column}`\n"
+            f"- 📝 Original: `{match.quote_type}{match.original}{match.quote_type}`\n"
+            f"- 🎯 Widget: {match.widget_context}\n"
+            f"- 🔧 Context:\n```dart\n{match.context}\n```\n\n"))
+
+    def add_localized(self, match):
+        """Text steht schon unter match.localized_as in einer .arb-Datei"""
+        self.localized.add(len(self.localized), (
+            f"- `{match.file}:{match.line}:{match.column}` "
+            f"`{match.quote_type}{match.original}{match.quote_type}` → **{match.localized_as}**\n"))
+
+    def close(self, total_matches: int, prefilter: Tuple[int, int] = (0, 0)):
+        f = self.output
+        new_strings = len(self.spool)
+        f.write("# 🌍 Weltenwind i18n String Extraction Report\n\n")
+        f.write(f"**Gesamt gefunden:** {total_matches} Strings\n")
+        f.write(f"**Neue Strings:** {new_strings} (noch nicht in .arb)\n")
+        f.write(f"**Bereits vorhanden:** {total_matches - new_strings}\n")
+        if len(self.localized):
+            f.write(f"**Bereits lokalisiert:** {len(self.localized)} (Text steht schon in .arb)\n")
+        skipped, checked = prefilter
+        if checked:
+            f.write(f"**Byte-Vorfilter:** {skipped} von {checked} gescannten Dateien "
+                    f"übersprungen ({skipped / checked:.0%})\n")
+        f.write("\n")
+
+        f.write("## 📊 Kategorien\n\n")
+        for category, count in sorted(self.categories.items()):
+            f.write(f"- **{category}**: {count} Strings\n")
+        f.write("\n")
+
+        distribution = self.confidence_distribution
+        f.write("## 🎯 Konfidenz-Verteilung\n\n")
+        f.write(f"- **Hoch (≥80%)**: {distribution['high']} Strings ✅\n")
+        f.write(f"- **Mittel (60-79%)**: {distribution['medium']} Strings ⚠️\n")
+        f.write(f"- **Niedrig (<60%)**: {distribution['low']} Strings ❓\n\n")
+
+        f.write("## 📝 Quote-Types\n\n")
+        for quote_type, (count, _) in sorted(self.quote_types.items(), key=lambda item: item[1][1]):
+            f.write(f"- **{quote_type}-Quotes**: {count} Strings\n")
+        f.write("\n")
+
+        f.write("## 🔍 Neue Strings (Priorität: Hoch → Niedrig)\n\n")
+        current_category = None
+        for (_, category), record in self.spool.records():
+            if category != current_category:
+                current_category = category
+                f.write(f"### 🏷️ {current_category.upper()}\n\n")
+            f.write(record)
+
+        if len(self.localized):
+            f.write("## ♻️ Bereits lokalisiert (vorhandenen Key verwenden)\n\n")
+            for _, record in self.localized.records():
+                f.write(record)
+            f.write("\n")
+
+        self.spool.close()
+        self.localized.close()
+        self.output.commit()
+
+    def discard(self):
+        self.spool.close()
+        self.localized.close()
+        self.output.discard()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Rule Analyzer
+Kosten/Nutzen der Extractor-Regeln auf einem gelabelten Korpus
+
+Der Korpus ist eine JSON-Lines-Datei mit einem String-Literal pro Zeile:
+
+    {"text": "Bitte warten", "quote": "'", "label": true, "file": "lib/...", "line": 12}
+
+label=true heißt: echter hardcoded UI-String, der lokalisiert werden muss.
+Mit --export wird ein Start-Korpus aus lib/ erzeugt (label = aktuelle
+Entscheidung des Extractors), der dann von Hand korrigiert wird.
+
+Für jede German- und Exclude-Regel werden CPU-Kosten, Treffer, eindeutige
+Beiträge (gehen beim Entfernen verloren) und die stärkste Überschneidung
+mit einer anderen Regel berichtet. Zusätzlich wird gierig ein kleinerer
+Regelsatz gesucht, der dieselben True- und False-Positives liefert.
+
+Usage: python client/tools/i18n_rule_analyzer.py corpus.jsonl [--json out.json]
+       python client/tools/i18n_rule_analyzer.py --export corpus.jsonl
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Set, Tuple
+
+@dataclass
+class LabelledLiteral:
+    text: str
+    quote: str
+    label: bool
+    file: str = ''
+    line: int = 0
+
+@dataclass
+class RuleAnalysis:
+    rule: str              # g<index>, x<index> oder whitelist
+    kind: str              # 'german' oder 'exclude'
+    pattern: str
+    cost_ms: float = 0.0
+    hits: int = 0
+    true_positives: int = 0    # german: gemeldete echte Strings / exclude: fälschlich ausgeschlossene
+    false_positives: int = 0   # german: gemeldete Nicht-UI-Strings / exclude: verhinderte Fehlalarme
+    unique_true: int = 0       # davon nur durch diese Regel
+    unique_false: int = 0
+    overlap_rule: str = ''     # Regel, die die meisten Treffer dieser Regel ebenfalls hat
+    overlap: float = 0.0       # Anteil der Treffer, den overlap_rule abdeckt
+    verdict: str = ''
+
+def load_corpus(path: str) -> List[LabelledLiteral]:
+    corpus = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+                corpus.append(LabelledLiteral(
+                    text=data['text'],
+                    quote=data.get('quote', "'"),
+                    label=bool(data['label']),
+                    file=data.get('file', ''),
+                    line=data.get('line', 0)
+                ))
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                print(f"⚠️ {path}:{line_number}: ungültiger Eintrag übersprungen ({e})")
+    return corpus
+
+def export_corpus(extractor, output_file: str) -> int:
+    """Schreibt alle Literale aus lib/, auf die eine German-Regel passt, als Start-Korpus"""
+    from i18n_dart_lexer import LineIndex, iter_string_literals
+
+    count = 0
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for source in extractor.walker.files():
+            if source.generated:
+                continue
+            dart_file = source.path
+            try:
+                content = dart_file.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            line_index = None
+            for literal in iter_string_literals(content):
+                text = literal.body(content)
+                if extractor.classify_literal(text, literal.quote) is None:
+                    continue
+                if line_index is None:
+                    line_index = LineIndex(content)
+                predicted = not extractor.should_exclude(text) and len(text.strip()) >= 3
+                f.write(json.dumps({
+                    'text': text,
+                    'quote': literal.quote,
+                    'label': predicted,
+                    'file': dart_file.relative_to(extractor.client_root).as_posix(),
+                    'line': line_index.position(literal.start)[0]
+                }, ensure_ascii=False) + '\n')
+                count += 1
+    return count
+
+class RuleAnalyzer:
+    def __init__(self, extractor, corpus: List[LabelledLiteral], repeat: int = 3):
+        self.extractor = extractor
+        self.corpus = corpus
+        self.positives = {index for index, sample in enumerate(corpus) if sample.label}
+        # Zu kurze Strings verwirft der Extractor unabhängig von den Regeln
+        self.too_short = {index for index, sample in enumerate(corpus) if len(sample.text.strip()) < 3}
+        self.patterns: Dict[str, Tuple[str, str]] = {}
+        self.hits: Dict[str, Set[int]] = {}
+        self.cost_ns: Dict[str, int] = {}
+        self._evaluate(repeat)
+
+    def _evaluate(self, repeat: int):
+        """Wertet jede Regel einzeln aus (wie reference_* im Regel-Compiler) und misst ihre Kosten"""
+        german = []
+        for index, (pattern, _) in enumerate(self.extractor.german_patterns):
+            rule = f'g{index}'
+            self.patterns[rule] = ('german', pattern)
+            german.append((rule, pattern[0], re.compile(pattern[1:-1], re.IGNORECASE)))
+
+        for rule, quote, regex in german:
+            samples = [(index, sample.text) for index, sample in enumerate(self.corpus)
+                       if sample.quote == quote]
+            self.hits[rule] = {index for index, text in samples if regex.fullmatch(text)}
+            self.cost_ns[rule] = min(self._time(regex.fullmatch, samples) for _ in range(repeat))
+
+        # Exclude-Regeln sieht im Scan nur, was eine German-Regel erkannt hat
+        candidates = set().union(*(self.hits[rule] for rule, _, _ in german)) if german else set()
+        stripped = [(index, self.corpus[index].text.strip()) for index in sorted(candidates)]
+
+        whitelist = self.extractor.whitelist_strings
+        self.patterns['whitelist'] = ('exclude', f'{len(whitelist)} Einträge')
+        self.hits['whitelist'] = {index for index, text in stripped if text in whitelist}
+        self.cost_ns['whitelist'] = min(self._time(whitelist.__contains__, stripped) for _ in range(repeat))
+
+        for index, pattern in enumerate(self.extractor.exclude_patterns):
+            rule = f'x{index}'
+            regex = re.compile(pattern)
+            self.patterns[rule] = ('exclude', pattern)
+            self.hits[rule] = {sample for sample, text in stripped if regex.match(text)}
+            self.cost_ns[rule] = min(self._time(regex.match, stripped) for _ in range(repeat))
+
+    @staticmethod
+    def _time(function, samples: List[Tuple[int, str]]) -> int:
+        clock = time.perf_counter_ns
+        started = clock()
+        for _, text in samples:
+            function(text)
+        return clock() - started
+
+    def rules(self, kind: str) -> List[str]:
+        return [rule for rule, (rule_kind, _) in self.patterns.items() if rule_kind == kind]
+
+    def reported(self, active: Set[str]) -> Set[int]:
+        """Indizes, die der Extractor mit den aktiven Regeln melden würde"""
+        detected = set().union(*(self.hits[rule] for rule in self.rules('german') if rule in active))
+        excluded = set().union(*(self.hits[rule] for rule in self.rules('exclude') if rule in active))
+        return detected - excluded - self.too_short
+
+    def analyze(self) -> List[RuleAnalysis]:
+        all_rules = set(self.patterns)
+        reported = self.reported(all_rules)
+        analyses = []
+        for kind in ('german', 'exclude'):
+            rules = self.rules(kind)
+            hit_counts: Dict[int, int] = {}
+            for rule in rules:
+                for index in self.hits[rule]:
+                    hit_counts[index] = hit_counts.get(index, 0) + 1
+
+            for rule in rules:
+                hits = self.hits[rule]
+                unique = {index for index in hits if hit_counts[index] == 1}
+                if kind == 'german':
+                    own = hits & reported
+                    true_hits, false_hits = own & self.positives, own - self.positives
+                else:
+                    true_hits, false_hits = hits & self.positives, hits - self.positives
+                analysis = RuleAnalysis(
+                    rule=rule,
+                    kind=kind,
+                    pattern=self.patterns[rule][1],
+                    cost_ms=round(self.cost_ns[rule] / 1e6, 3),
+                    hits=len(hits),
+                    true_positives=len(true_hits),
+                    false_positives=len(false_hits),
+                    unique_true=len(true_hits & unique),
+                    unique_false=len(false_hits & unique)
+                )
+                if hits:
+                    partner, shared = max(((other, len(hits & self.hits[other])) for other in rules
+                                           if other != rule), key=lambda item: item[1], default=('', 0))
+                    if shared:
+                        analysis.overlap_rule = partner
+                        analysis.overlap = round(shared / len(hits), 3)
+                analysis.verdict = self._verdict(analysis)
+                analyses.append(analysis)
+        return analyses
+
+    @staticmethod
+    def _verdict(analysis: RuleAnalysis) -> str:
+        if analysis.hits == 0:
+            return 'ohne Treffer'
+        if analysis.kind == 'german':
+            if analysis.unique_true == 0:
+                return 'entbehrlich' if analysis.overlap < 1.0 else f'in {analysis.overlap_rule} enthalten'
+            if analysis.false_positives > analysis.true_positives:
+                return 'mehr Fehlalarme als Treffer'
+            return 'nötig'
+        if analysis.unique_true:
+            return 'schadet Recall'
+        if analysis.unique_false == 0:
+            return 'entbehrlich' if analysis.overlap < 1.0 else f'in {analysis.overlap_rule} enthalten'
+        return 'nötig'
+
+    def minimal_rule_set(self) -> Tuple[Set[str], List[str]]:
+        """Entfernt gierig (teuerste zuerst) jede Regel, ohne die sich die Meldungen nicht ändern"""
+        active = set(self.patterns)
+        target = self.reported(active)
+        removed = []
+        for rule in sorted(self.patterns, key=lambda rule: -self.cost_ns[rule]):
+            if rule == 'whitelist':
+                continue
+            active.discard(rule)
+            if self.reported(active) == target:
+                removed.append(rule)
+            else:
+                active.add(rule)
+        return active, removed
+
+def _shorten(pattern: str, limit: int = 48) -> str:
+    return pattern if len(pattern) <= limit else pattern[:limit - 3] + '...'
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Rule Analyzer')
+    parser.add_argument('corpus', help='Gelabelter Korpus (JSON Lines)')
+    parser.add_argument('--client-root', default=str(Path(__file__).resolve().parent.parent),
+                       help='Pfad zum Client-Root-Verzeichnis')
+    parser.add_argument('--export', action='store_true',
+                       help='Start-Korpus aus lib/ nach CORPUS schreiben statt zu analysieren')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Messwiederholungen pro Regel (Minimum zählt)')
+    parser.add_argument('--top', type=int, default=30,
+                       help='Maximal so viele entfernbare Regeln auflisten (JSON enthält alle)')
+    parser.add_argument('--json', metavar='FILE',
+                       help='Analyse zusätzlich als JSON speichern')
+    args = parser.parse_args()
+
+    from i18n_string_extractor import I18nStringExtractor
+    extractor = I18nStringExtractor(args.client_root)
+
+    print("🔬 Weltenwind i18n Rule Analyzer")
+    print("=" * 60)
+
+    if args.export:
+        count = export_corpus(extractor, args.corpus)
+        print(f"📝 {count} Literale nach {args.corpus} exportiert")
+        print("💡 'label' enthält die aktuelle Entscheidung des Extractors - bitte prüfen und korrigieren")
+        return
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"❌ Keine gelabelten Literale in {args.corpus}")
+        sys.exit(1)
+
+    analyzer = RuleAnalyzer(extractor, corpus, repeat=max(1, args.repeat))
+    analyses = analyzer.analyze()
+    reported = analyzer.reported(set(analyzer.patterns))
+    true_positives = len(reported & analyzer.positives)
+    precision = true_positives / len(reported) if reported else 0.0
+    recall = true_positives / len(analyzer.positives) if analyzer.positives else 0.0
+    print(f"📚 {len(corpus)} Literale, {len(analyzer.positives)} echte UI-Strings")
+    print(f"🎯 Aktueller Regelsatz: {len(reported)} gemeldet, Präzision {precision:.1%}, Recall {recall:.1%}")
+
+    columns = {'german': ('echt', 'falsch', 'nur echt'), 'exclude': ('echt weg', 'FP weg', 'nur FP weg')}
+    for kind, title in (('german', '🔎 German-Regeln'), ('exclude', '🚫 Exclude-Regeln')):
+        true_title, false_title, unique_title = columns[kind]
+        print(f"\n{title} (teuerste zuerst)")
+        print(f"{'Regel':<10}{'ms':>8}{'Treffer':>9}{true_title:>10}{false_title:>9}{unique_title:>11}"
+              f"  {'Überschneidung':<18}Bewertung")
+        rows = sorted((a for a in analyses if a.kind == kind), key=lambda a: -a.cost_ms)
+        for analysis in rows:
+            unique = analysis.unique_true if kind == 'german' else analysis.unique_false
+            overlap = f"{analysis.overlap:.0%} {analysis.overlap_rule}" if analysis.overlap_rule else '-'
+            print(f"{analysis.rule:<10}{analysis.cost_ms:>8.2f}{analysis.hits:>9}{analysis.true_positives:>10}"
+                  f"{analysis.false_positives:>9}{unique:>11}  {overlap:<18}{analysis.verdict}")
+
+    active, removed = analyzer.minimal_rule_set()
+    total_cost = sum(analyzer.cost_ns.values())
+    saved_cost = sum(analyzer.cost_ns[rule] for rule in removed)
+    print(f"\n✂️ Vorschlag: {len(removed)} von {len(analyzer.patterns)} Regeln entfernen "
+          f"(-{saved_cost / total_cost:.0%} Regel-Kosten), gleiche Meldungen auf dem Korpus")
+    for rule in removed[:args.top]:
+        print(f"   {rule:<10}{_shorten(analyzer.patterns[rule][1])}")
+    if len(removed) > args.top:
+        print(f"   ... und {len(removed) - args.top} weitere")
+    if removed:
+        print("💡 Regeln ohne Treffer nur streichen, wenn der Korpus repräsentativ ist")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'corpus': args.corpus,
+                'samples': len(corpus),
+                'positives': len(analyzer.positives),
+                'precision': round(precision, 4),
+                'recall': round(recall, 4),
+                'rules': [asdict(analysis) for analysis in analyses],
+                'removable': removed
+            }, f, indent=2, ensure_ascii=False)
+        print(f"📊 JSON-Daten gespeichert: {args.json}")
+
+if __name__ == "__main__":
+    main()
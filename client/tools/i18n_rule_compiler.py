@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Rule Compiler
+Kompiliert german_patterns, exclude_patterns und category_patterns des
+String-Extractors einmalig in einen optimierten Matcher-Satz
+
+Usage: python i18n_rule_compiler.py --verify [--client-root .]
+"""
+
+import re
+import sys
+import argparse
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_QUANTIFIER_START = '*+?{'
+
+def _class_end(pattern: str, pos: int) -> int:
+    """Index hinter der Zeichenklasse, die bei pos ('[') beginnt"""
+    i = pos + 1
+    if i < len(pattern) and pattern[i] == '^':
+        i += 1
+    if i < len(pattern) and pattern[i] == ']':
+        i += 1
+    while i < len(pattern) and pattern[i] != ']':
+        i += 2 if pattern[i] == '\\' else 1
+    return i + 1
+
+def _group_end(pattern: str, pos: int) -> int:
+    """Index hinter der Gruppe, die bei pos ('(') beginnt"""
+    depth = 0
+    i = pos
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '[':
+            i = _class_end(pattern, i)
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+def _skip_quantifier(pattern: str, pos: int) -> Tuple[int, bool]:
+    """Überspringt einen Quantor ab pos; liefert (neue Position, Minimum ist 0)"""
+    if pos >= len(pattern) or pattern[pos] not in _QUANTIFIER_START:
+        return pos, False
+
+    char = pattern[pos]
+    if char == '{':
+        quantifier = re.match(r'\{(\d*)(,\d*)?\}', pattern[pos:])
+        if quantifier is None:
+            # Kein gültiger Quantor: '{' ist ein Literal
+            return pos, False
+        optional = quantifier.group(1) in ('', '0')
+        pos += quantifier.end()
+    else:
+        optional = char in '*?'
+        pos += 1
+
+    # Lazy-/Possessive-Suffix
+    if pos < len(pattern) and pattern[pos] in '?+':
+        pos += 1
+    return pos, optional
+
+def has_top_level_alternation(pattern: str) -> bool:
+    """Prüft ob ein Pattern auf oberster Ebene ein '|' enthält"""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+        elif char == '[':
+            i = _class_end(pattern, i)
+        elif char == '(':
+            i = _group_end(pattern, i)
+        elif char == '|':
+            return True
+        else:
+            i += 1
+    return False
+
+def required_literal(pattern: str) -> str:
+    """Längster Text, der in jedem Treffer des Patterns wörtlich vorkommen muss
+
+    Konservativ: Gruppen, Zeichenklassen und optionale Zeichen beenden einen
+    Abschnitt. Liefert '' wenn kein Pflicht-Literal bestimmbar ist.
+    """
+    if has_top_level_alternation(pattern):
+        return ''
+
+    best = ''
+    run: List[str] = []
+
+    def flush():
+        nonlocal best
+        candidate = ''.join(run)
+        if len(candidate) > len(best):
+            best = candidate
+        run.clear()
+
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escaped = pattern[i + 1] if i + 1 < len(pattern) else ''
+            i += 2
+            if not escaped or escaped.isalnum():
+                # \w, \s, \d, \b, Backreferences ... sind keine Literale
+                flush()
+                i, _ = _skip_quantifier(pattern, i)
+                continue
+            literal = escaped
+        elif char == '[':
+            flush()
+            i, _ = _skip_quantifier(pattern, _class_end(pattern, i))
+            continue
+        elif char == '(':
+            flush()
+            i, _ = _skip_quantifier(pattern, _group_end(pattern, i))
+            continue
+        elif char in '.^$':
+            flush()
+            i, _ = _skip_quantifier(pattern, i + 1)
+            continue
+        else:
+            literal = char
+            i += 1
+
+        after, optional = _skip_quantifier(pattern, i)
+        if after == i:
+            run.append(literal)
+        else:
+            if not optional:
+                run.append(literal)
+            flush()
+            i = after
+
+    flush()
+    return best
+
+def pure_literal(pattern: str) -> Optional[str]:
+    """Gibt den Text zurück, falls das Pattern nur aus Literalen besteht"""
+    chars = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escaped = pattern[i + 1] if i + 1 < len(pattern) else ''
+            if not escaped or escaped.isalnum():
+                return None
+            chars.append(escaped)
+            i += 2
+        elif char in '.^$*+?{}[]|()':
+            return None
+        else:
+            chars.append(char)
+            i += 1
+    return ''.join(chars)
+
+def floating_core(pattern: str) -> Optional[str]:
+    """Kern eines '.*X.*'-Patterns (für re.match) oder None
+
+    re.match('.*X', text) ist gleichbedeutend mit einem Treffer von X, der in
+    der ersten Zeile beginnt ('.' matcht kein '\\n'). Ein abschließendes '.*'
+    matcht immer und entfällt.
+    """
+    if not pattern.startswith('.*') or has_top_level_alternation(pattern):
+        return None
+    core = pattern[2:]
+    if core.startswith(('*', '?', '+')):
+        return None
+    if core.endswith('.*') and not core.endswith('\\.*'):
+        core = core[:-2]
+    return core or None
+
+def _combine(named_patterns: Iterable[Tuple[str, str]]) -> Optional[re.Pattern]:
+    parts = [f'(?P<{name}>{pattern})' for name, pattern in named_patterns]
+    if not parts:
+        return None
+    return re.compile('|'.join(parts))
+
+@dataclass
+class CompiledExcludeRules:
+    """Ausschlussregeln: entscheidet wie any(re.match(p, text) for p in exclude_patterns)"""
+    whitelist: Set[str]
+    anchored: Optional[re.Pattern]                        # per match() an Position 0
+    literals: List[Tuple[str, int]]                       # '.*Text.*' -> Substring der ersten Zeile
+    prefiltered: List[Tuple[str, re.Pattern, int]]        # Pflicht-Literal + eigener Kern
+    floating: Optional[re.Pattern]                        # restliche Kerne, ein search()
+
+    @classmethod
+    def compile(cls, exclude_patterns: List[str], whitelist: Set[str]) -> 'CompiledExcludeRules':
+        anchored = []
+        literals = []
+        prefiltered = []
+        floating = []
+
+        for index, pattern in enumerate(exclude_patterns):
+            core = floating_core(pattern)
+            if core is None:
+                anchored.append((f'x{index}', pattern))
+                continue
+
+            text = pure_literal(core)
+            if text:
+                literals.append((text, index))
+                continue
+
+            needle = required_literal(core)
+            if needle:
+                prefiltered.append((needle, re.compile(core), index))
+            else:
+                floating.append((f'x{index}', core))
+
+        return cls(
+            whitelist=set(whitelist),
+            anchored=_combine(anchored),
+            literals=literals,
+            prefiltered=prefiltered,
+            floating=_combine(floating)
+        )
+
+    def first_match(self, text: str) -> Optional[str]:
+        """Liefert die ID einer passenden Regel ('whitelist', 'x<index>') oder None"""
+        if text in self.whitelist:
+            return 'whitelist'
+
+        if self.anchored is not None:
+            match = self.anchored.match(text)
+            if match:
+                return match.lastgroup
+
+        newline = text.find('\n')
+        first_line = text if newline < 0 else text[:newline]
+        first_line_end = len(first_line)
+
+        for literal, index in self.literals:
+            if literal in first_line:
+                return f'x{index}'
+
+        for needle, core, index in self.prefiltered:
+            if needle in text:
+                match = core.search(text)
+                if match and match.start() <= first_line_end:
+                    return f'x{index}'
+
+        if self.floating is not None:
+            match = self.floating.search(text)
+            if match and match.start() <= first_line_end:
+                return match.lastgroup
+
+        return None
+
+    def matches(self, text: str) -> bool:
+        return self.first_match(text) is not None
+
+@dataclass
+class CompiledCategoryRules:
+    """Kategorie-Regeln: erste Kategorie (in Listen-Reihenfolge), deren Pattern irgendwo passt"""
+    order: List[str]
+    patterns: Dict[str, re.Pattern]
+    combined: Optional[re.Pattern]
+
+    @classmethod
+    def compile(cls, category_patterns: Dict[str, Tuple[str, float]]) -> 'CompiledCategoryRules':
+        order = list(category_patterns.keys())
+        patterns = {name: re.compile(pattern) for name, (pattern, _) in category_patterns.items()}
+        combined = _combine((name, pattern) for name, (pattern, _) in category_patterns.items())
+        return cls(order=order, patterns=patterns, combined=combined)
+
+    def first_match(self, text: str) -> Optional[str]:
+        """Ein kombinierter Suchlauf liefert die früheste Position; nur höher
+        priorisierte Kategorien werden danach noch einzeln geprüft."""
+        if self.combined is None:
+            return None
+
+        match = self.combined.search(text)
+        if match is None:
+            return None
+
+        # An derselben Position hätte die Alternation bereits die höher priorisierte gewählt
+        best = match.lastgroup
+        for name in self.order:
+            if name == best:
+                break
+            if self.patterns[name].search(text, match.start() + 1):
+                return name
+        return best
+
+@dataclass
+class CompiledLiteralRules:
+    """German-Patterns als fullmatch-Regeln auf dem Inhalt eines String-Literals"""
+    by_quote: Dict[str, Optional[re.Pattern]]
+    confidences: Dict[str, float]
+
+    @classmethod
+    def compile(cls, german_patterns: List[Tuple[str, float]]) -> 'CompiledLiteralRules':
+        """Zerlegt Patterns der Form '"(...)"' in ihren inneren Teil
+
+        Der Lexer liefert Literale bereits ohne Quotes. Die Regeln eines
+        Quote-Typs werden nach Konfidenz (absteigend, stabil) in einer
+        Alternation kombiniert: die erste vollständig passende gewinnt.
+        """
+        grouped: Dict[str, List[Tuple[int, str, float]]] = {'"': [], "'": []}
+        confidences: Dict[str, float] = {}
+
+        for index, (pattern, base_confidence) in enumerate(german_patterns):
+            quote = pattern[0]
+            if quote not in grouped or len(pattern) < 2 or not pattern.endswith(quote):
+                raise ValueError(f"German-Pattern ohne umschließende Quotes: {pattern}")
+            grouped[quote].append((index, pattern[1:-1], base_confidence))
+            confidences[f'g{index}'] = base_confidence
+
+        by_quote = {}
+        for quote, rules in grouped.items():
+            rules.sort(key=lambda rule: -rule[2])
+            parts = [f'(?P<g{index}>{inner})' for index, inner, _ in rules]
+            by_quote[quote] = re.compile('|'.join(parts), re.IGNORECASE) if parts else None
+
+        return cls(by_quote=by_quote, confidences=confidences)
+
+    def first_match(self, text: str, quote: str) -> Optional[str]:
+        combined = self.by_quote.get(quote)
+        if combined is None:
+            return None
+        match = combined.fullmatch(text)
+        return match.lastgroup if match else None
+
+    def classify(self, text: str, quote: str) -> Optional[float]:
+        rule = self.first_match(text, quote)
+        return self.confidences[rule] if rule else None
+
+# Bytes, bei denen sich str- und Bytes-Regex unterscheiden können (Umlaute,
+# Unicode-Case-Folding, \x1c-\x1f zählen in str als \s): immer voll scannen
+_UNSAFE_BYTES = re.compile(rb'[\x1c-\x1f\x80-\xff]')
+
+@dataclass
+class BytePrefilter:
+    """Notwendige Bedingung auf Rohbytes: kann eine Datei ein German-Literal enthalten?
+
+    Reine ASCII-Dateien werden mit den German-Patterns samt öffnendem Quote
+    als Bytes-Regex durchsucht (Ende: Quote, Zeilenende oder Dateiende wie bei
+    nicht abgeschlossenen Literalen). Auf ASCII-Text entscheidet die
+    Bytes-Regex wie die str-Regex, jedes meldbare Literal wird also gefunden.
+    Dateien mit Nicht-ASCII-Bytes gehen immer in den vollen Scan.
+    """
+    combined: Optional[re.Pattern]
+
+    @classmethod
+    def compile(cls, german_patterns: List[Tuple[str, float]]) -> 'BytePrefilter':
+        parts = []
+        for pattern, _ in german_patterns:
+            quote = pattern[0]
+            # Nicht-ASCII-Zeichen außerhalb von Latin-1 könnten per Case-Folding ASCII treffen
+            if any(ord(char) > 0xFF for char in pattern):
+                return cls(combined=None)
+            parts.append(f'{quote}(?:{pattern[1:-1]})(?:{quote}|\r|\n|\Z)')
+        try:
+            combined = re.compile('|'.join(parts).encode('utf-8'), re.IGNORECASE) if parts else None
+        except re.error:
+            # z.B. \u-Escapes, die es in Bytes-Regexes nicht gibt: Vorfilter aus
+            combined = None
+        return cls(combined=combined)
+
+    def may_match(self, data) -> bool:
+        """False nur, wenn die Datei sicher kein German-Literal enthält (bytes oder mmap)"""
+        if self.combined is None or _UNSAFE_BYTES.search(data):
+            return True
+        return self.combined.search(data) is not None
+
+@dataclass
+class CompiledRuleSet:
+    literal: CompiledLiteralRules
+    exclude: CompiledExcludeRules
+    category: CompiledCategoryRules
+    prefilter: BytePrefilter
+
+def compile_rules(german_patterns: List[Tuple[str, float]],
+                  exclude_patterns: List[str],
+                  whitelist: Set[str],
+                  category_patterns: Dict[str, Tuple[str, float]]) -> CompiledRuleSet:
+    """Kompiliert alle Regel-Listen des Extractors (einmal beim Start)"""
+    return CompiledRuleSet(
+        literal=CompiledLiteralRules.compile(german_patterns),
+        exclude=CompiledExcludeRules.compile(exclude_patterns, whitelist),
+        category=CompiledCategoryRules.compile(category_patterns),
+        prefilter=BytePrefilter.compile(german_patterns)
+    )
+
+# --- Referenz-Implementierungen (ursprüngliche Listen-Auswertung) ---
+
+def reference_exclude(exclude_patterns: List[str], whitelist: Set[str], text: str) -> bool:
+    if text in whitelist:
+        return True
+    return any(re.match(pattern, text) for pattern in exclude_patterns)
+
+def reference_category(category_patterns: Dict[str, Tuple[str, float]], text: str) -> Optional[str]:
+    for category, (pattern, _) in category_patterns.items():
+        if re.search(pattern, text):
+            return category
+    return None
+
+def reference_literal(german_patterns: List[Tuple[str, float]], text: str, quote: str) -> Optional[float]:
+    """Höchste Konfidenz eines Patterns, das das Literal quote+text+quote erfasst"""
+    literal = f'{quote}{text}{quote}'
+    confidences = [base_confidence for pattern, base_confidence in german_patterns
+                   if re.fullmatch(pattern, literal, re.IGNORECASE)]
+    return max(confidences) if confidences else None
+
+def _edge_case_samples() -> List[str]:
+    """Handverlesene Grenzfälle für Anker, Zeilenumbrüche und Alternationen"""
+    return [
+        '', ' ', 'DEBUG', 'API_KEY', 'User.fromJson', '12345', 'logo.png', 'config.yaml',
+        'https://weltenwind.de', 'a@b.de', 'camelCase', 'PascalCase', '_private',
+        '|| Welt', 'Welt ||', 'a && b', '++i', 'i++', 'x--', '--x',
+        'Scaffold', 'Ein Scaffold.', 'Zeile eins\nScaffold', 'Zeile\nclass Foo', 'class Foo\nbar',
+        'Wert: ${wert}', 'Bitte {warten}', 'Fehler: 1.5', '0xFF', 'a < b', 'a >= b',
+        'Das ist ein Satz.', 'Die Welt ist schön!', 'Möchten Sie fortfahren?', 'Bitte warten…',
+        'Spieler beitreten', 'Welcher Spieler ist da?', 'Speichern;', 'Laden (',
+        'return value', 'Text(\n"x")', 'x = 1', 'Navigator.push', 'foo?.bar', 'a ?? b',
+        'der Spieler hat', 'eine Einladung senden', 'Ungültige Eingabe', 'Zurück zur Übersicht',
+        '[DEBUG] Start', 'style: bold', 'child:\nText', 'Deutsch', 'DE', 'Flutter',
+        'text button error', 'ein alert dialog', 'route to login', 'form field', 'welt spieler',
+        'invite token', 'build widget', 'nothing here', 'showdialog\nerror',
+    ]
+
+def collect_verification_samples(lib_dir: Path) -> List[Tuple[str, str]]:
+    """Sammelt (quote, text) aller String-Literale unter lib_dir plus Grenzfälle"""
+    from i18n_dart_lexer import iter_string_literals
+    from i18n_source_walker import SourceWalker
+
+    samples = [(quote, text) for text in _edge_case_samples() for quote in ('"', "'")]
+    for source in SourceWalker(lib_dir).files():
+        try:
+            content = source.path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+        for literal in iter_string_literals(content):
+            samples.append((literal.quote, literal.body(content)))
+    return samples
+
+def verify_equivalence(extractor, samples: List[Tuple[str, str]],
+                       contexts: Iterable[str] = ()) -> List[str]:
+    """Vergleicht kompilierte Regeln mit der ursprünglichen Listen-Auswertung
+
+    Liefert eine Liste von Abweichungen (leer = äquivalent).
+    """
+    rules = extractor.rules
+    mismatches = []
+
+    for quote, text in samples:
+        expected = reference_literal(extractor.german_patterns, text, quote)
+        actual = rules.literal.classify(text, quote)
+        if expected != actual:
+            mismatches.append(f"german {quote}{text!r}: erwartet {expected}, erhalten {actual}")
+
+        clean_text = text.strip()
+        expected_exclude = reference_exclude(extractor.exclude_patterns, extractor.whitelist_strings, clean_text)
+        actual_exclude = rules.exclude.matches(clean_text)
+        if expected_exclude != actual_exclude:
+            mismatches.append(f"exclude {clean_text!r}: erwartet {expected_exclude}, erhalten {actual_exclude}")
+
+    for context in list(contexts) + [text.lower() for _, text in samples]:
+        expected_category = reference_category(extractor.category_patterns, context)
+        actual_category = rules.category.first_match(context)
+        if expected_category != actual_category:
+            mismatches.append(f"category {context[:60]!r}: erwartet {expected_category}, erhalten {actual_category}")
+
+    return mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Rule Compiler')
+    parser.add_argument('--verify', action='store_true',
+                       help='Prüft kompilierte Regeln gegen die ursprünglichen Pattern-Listen')
+    parser.add_argument('--client-root', default='.',
+                       help='Pfad zum Client-Root-Verzeichnis')
+    args = parser.parse_args()
+
+    from i18n_string_extractor import I18nStringExtractor
+
+    extractor = I18nStringExtractor(args.client_root)
+    rules = extractor.rules
+    print("🧩 Weltenwind i18n Rule Compiler")
+    print("=" * 50)
+    print(f"📐 Exclude: {len(rules.exclude.literals)} Literal-, "
+          f"{len(rules.exclude.prefiltered)} vorgefilterte, "
+          f"{len(extractor.exclude_patterns) - len(rules.exclude.literals) - len(rules.exclude.prefiltered)} kombinierte Regeln")
+
+    if not args.verify:
+        return
+
+    samples = collect_verification_samples(extractor.lib_dir)
+    contexts = []
+    for source in extractor.walker.files():
+        try:
+            lines = source.path.read_text(encoding='utf-8').split('\n')
+        except (OSError, UnicodeDecodeError):
+            continue
+        contexts.extend(extractor.get_context(lines, index).lower() for index in range(0, len(lines), 3))
+
+    mismatches = verify_equivalence(extractor, samples, contexts)
+    print(f"🔍 {len(samples)} Literale und {len(contexts)} Kontexte geprüft")
+    if mismatches:
+        for mismatch in mismatches[:50]:
+            print(f"   ❌ {mismatch}")
+        print(f"❌ {len(mismatches)} Abweichungen gefunden")
+        sys.exit(1)
+    print("✅ Kompilierte Regeln entscheiden identisch zu den Pattern-Listen")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Scan Cache
+Persistenter, inkrementeller Cache für die Scan-Ergebnisse des String-Extractors
+
+Ein Eintrag gilt, solange Pfad, Größe und mtime (oder bei abweichender mtime
+der Content-Hash) sowie der Fingerprint des aktiven Pattern-Satzes passen.
+"""
+
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SCAN_CACHE_VERSION = 3
+
+# Dateien, die kurz vor dem Speichern geändert wurden, werden beim nächsten
+# Lauf per Hash geprüft (mtime-Auflösung des Dateisystems)
+RACY_WINDOW_NS = 2_000_000_000
+
+@dataclass
+class FileState:
+    size: int
+    mtime_ns: int
+    sha1: str
+
+def file_digest(path: Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def rule_fingerprint(*parts, sources: Iterable[Path] = ()) -> str:
+    """Fingerprint über Pattern-Listen und Quelltext der Scan-Module"""
+    digest = hashlib.sha256()
+    digest.update(str(SCAN_CACHE_VERSION).encode())
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=sorted).encode('utf-8'))
+    for source in sources:
+        try:
+            digest.update(Path(source).read_bytes())
+        except OSError:
+            digest.update(str(source).encode('utf-8'))
+    return digest.hexdigest()
+
+class ScanCache:
+    def __init__(self, cache_file: Path, fingerprint: str):
+        self.cache_file = Path(cache_file)
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+        self.load()
+
+    def load(self):
+        """Lädt den Cache; bei anderer Version oder anderem Fingerprint bleibt er leer"""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Scan-Cache nicht lesbar, wird neu aufgebaut: {e}")
+            return
+
+        if data.get('version') != SCAN_CACHE_VERSION or data.get('fingerprint') != self.fingerprint:
+            print("♻️ Pattern-Satz geändert - Scan-Cache wird neu aufgebaut")
+            self.changed = True
+            return
+        self.entries = data.get('files', {})
+
+    def lookup(self, rel_path: str, path: Path,
+               stat: Optional[Tuple[int, int]] = None) -> Tuple[Optional[List[Dict]], Optional[FileState]]:
+        """Liefert (gecachte Treffer, None) oder (None, aktueller Dateizustand)
+
+        stat: (Größe, mtime_ns) aus dem Verzeichnis-Durchlauf, sonst per stat() ermittelt.
+        """
+        if stat is None:
+            try:
+                result = path.stat()
+            except OSError:
+                self.misses += 1
+                return None, None
+            stat = (result.st_size, result.st_mtime_ns)
+        size, mtime_ns = stat
+
+        entry = self.entries.get(rel_path)
+        if entry and entry['size'] == size and entry['mtime_ns'] == mtime_ns:
+            self.hits += 1
+            return entry['matches'], None
+
+        try:
+            digest = file_digest(path)
+        except OSError:
+            self.misses += 1
+            return None, None
+
+        if entry and entry['sha1'] == digest:
+            # Nur Zeitstempel geändert (z.B. git checkout): Treffer bleiben gültig
+            self._update_stat(entry, size, mtime_ns)
+            self.hits += 1
+            return entry['matches'], None
+
+        self.misses += 1
+        return None, FileState(size, mtime_ns, digest)
+
+    def store(self, rel_path: str, state: Optional[FileState], matches: List[Dict],
+              prefilter: Optional[Dict[str, int]] = None):
+        if state is None:
+            return
+        entry = {'sha1': state.sha1, 'matches': matches, 'prefilter': prefilter or {}}
+        self._update_stat(entry, state.size, state.mtime_ns)
+        self.entries[rel_path] = entry
+        self.changed = True
+
+    def prefilter(self, rel_path: str) -> Dict[str, int]:
+        """Vorfilter-Zähler ({'checked', 'skipped'}) aus dem Scan, der den Eintrag erzeugt hat"""
+        entry = self.entries.get(rel_path)
+        return dict(entry.get('prefilter', {})) if entry else {}
+
+    def prune(self, keep: Set[str]) -> int:
+        """Entfernt Einträge gelöschter bzw. nicht mehr gescannter Dateien"""
+        stale = [rel_path for rel_path in self.entries if rel_path not in keep]
+        for rel_path in stale:
+            del self.entries[rel_path]
+        if stale:
+            self.changed = True
+        return len(stale)
+
+    def save(self):
+        """Schreibt den Cache atomar (nur wenn sich etwas geändert hat)"""
+        if not self.changed:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        data = {
+            'version': SCAN_CACHE_VERSION,
+            'fingerprint': self.fingerprint,
+            'files': self.entries
+        }
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_file, self.cache_file)
+        self.changed = False
+
+    def _update_stat(self, entry: Dict, size: int, mtime_ns: int):
+        entry['size'] = size
+        # "Racy" Einträge erzwingen beim nächsten Lauf eine Hash-Prüfung
+        entry['mtime_ns'] = -1 if time.time_ns() - mtime_ns < RACY_WINDOW_NS else mtime_ns
+        self.changed = True
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Source Walker
+Gemeinsamer Datei-Durchlauf der i18n-Tools (os.scandir, ein Durchlauf pro Lauf)
+
+Liest .gitignore und .i18nignore vom Git-Root bis in die Unterverzeichnisse
+und überspringt ignorierte Verzeichnisse, bevor sie betreten werden.
+Generierte Dateien (*.g.dart, *.freezed.dart, gen-l10n-Ausgabe,
+"// GENERATED CODE"-Kopf) werden markiert, nicht verworfen - so zählen sie
+weiter zu den gefundenen Dateien. Größe und mtime kommen aus dem Durchlauf,
+Scan-Cache und Arbeitspakete brauchen keinen eigenen stat-Aufruf.
+"""
+
+import os
+import re
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Pro Verzeichnis in dieser Reihenfolge gelesen (spätere Regeln haben Vorrang)
+IGNORE_FILES = ('.gitignore', '.i18nignore')
+
+GENERATED_SUFFIXES = ('.g.dart', '.freezed.dart')
+
+# So viele Bytes vom Dateianfang werden auf einen Generator-Kopf geprüft
+HEADER_BYTES = 512
+
+_GENERATED_HEADER = re.compile(rb'^[ \t]*//+[ \t]*(?:GENERATED CODE|Generated file\b)', re.MULTILINE)
+
+@dataclass
+class SourceFile:
+    path: Path
+    size: int
+    mtime_ns: int
+    generated: bool = False
+
+def is_generated(path, head: bytes = b'') -> bool:
+    """Generierte Datei nach Name oder Dateikopf (head: die ersten HEADER_BYTES Bytes)"""
+    name = os.path.basename(path)
+    if name.endswith(GENERATED_SUFFIXES):
+        return True
+    # gen-l10n-Ausgabe (app_localizations*.dart unter l10n/)
+    if 'app_localizations' in name and 'l10n' in str(path):
+        return True
+    return _GENERATED_HEADER.search(head[:HEADER_BYTES]) is not None
+
+def _read_head(path: str) -> bytes:
+    # os.open statt open(): kein Datei-Objekt mit Puffer, das zählt bei vielen Dateien
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return b''
+    try:
+        return os.read(fd, HEADER_BYTES)
+    except OSError:
+        return b''
+    finally:
+        os.close(fd)
+
+def _translate_glob(pattern: str) -> str:
+    """gitignore-Glob in eine Regex für Pfade relativ zum Verzeichnis der Ignore-Datei"""
+    parts = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        at_segment_start = index == 0 or pattern[index - 1] == '/'
+        if pattern.startswith('**/', index) and at_segment_start:
+            parts.append('(?:.*/)?')
+            index += 3
+            continue
+        if pattern.startswith('**', index) and at_segment_start and index + 2 == length:
+            parts.append('.*')
+            index += 2
+            continue
+        if char == '*':
+            parts.append('[^/]*')
+            while index + 1 < length and pattern[index + 1] == '*':
+                index += 1
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            # "]" direkt hinter "[" bzw. "[!" gehört zur Klasse
+            end = index + 1
+            if end < length and pattern[end] in '!^':
+                end += 1
+            if end < length and pattern[end] == ']':
+                end += 1
+            end = pattern.find(']', end)
+            if end < 0:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[index + 1:end].replace('\\', '\\\\')
+                if body[:1] in ('!', '^'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                index = end
+        elif char == '\\' and index + 1 < length:
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return ''.join(parts)
+
+def _parse_rule(line: str) -> Optional[Tuple[str, bool, bool]]:
+    """(Regex, negiert, nur Verzeichnisse) für eine Zeile, None für Leerzeilen/Kommentare"""
+    line = line.rstrip('\r\n')
+    stripped = line.rstrip(' ')
+    # "\ " am Ende: das Leerzeichen gehört zum Muster
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        stripped += ' '
+    line = stripped
+    if not line or line.startswith('#'):
+        return None
+
+    negate = line.startswith('!')
+    if negate:
+        line = line[1:]
+    elif line.startswith(('\\!', '\\#')):
+        line = line[1:]
+
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+    # Ein "/" am Anfang oder in der Mitte verankert das Muster am Verzeichnis der Datei
+    anchored = '/' in line
+    regex = _translate_glob(line.lstrip('/'))
+    if not anchored:
+        regex = '(?:.*/)?' + regex
+    return regex, negate, dir_only
+
+class IgnoreFile:
+    """Regeln einer .gitignore bzw. .i18nignore
+
+    Alle Regeln stehen in einer kombinierten Regex (letzte Regel zuerst),
+    die passende Gruppe sagt, ob ausgeschlossen oder wieder aufgenommen wird.
+    """
+
+    def __init__(self, base: str, lines: List[str]):
+        self.base = base  # Verzeichnis der Datei relativ zum Anker, mit "/" am Ende oder ''
+        rules = [rule for rule in map(_parse_rule, lines) if rule is not None]
+        self.negated: Dict[str, bool] = {}
+        file_parts, dir_parts = [], []
+        for index in reversed(range(len(rules))):
+            regex, negate, dir_only = rules[index]
+            group = f'r{index}'
+            self.negated[group] = negate
+            dir_parts.append(f'(?P<{group}>{regex})')
+            if not dir_only:
+                file_parts.append(f'(?P<{group}>{regex})')
+        self.file_pattern = re.compile('|'.join(file_parts)) if file_parts else None
+        self.dir_pattern = re.compile('|'.join(dir_parts)) if dir_parts else None
+
+    @classmethod
+    def load(cls, path: str, base: str) -> Optional['IgnoreFile']:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                ignore = cls(base, f.readlines())
+        except OSError:
+            return None
+        return ignore if ignore.dir_pattern is not None else None
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """True = ausgeschlossen, False = per "!" wieder aufgenommen, None = keine Regel"""
+        pattern = self.dir_pattern if is_dir else self.file_pattern
+        if pattern is None:
+            return None
+        found = pattern.fullmatch(rel_path[len(self.base):])
+        if found is None:
+            return None
+        return not self.negated[found.lastgroup]
+
+def _ignored(rules: List[IgnoreFile], rel_path: str, is_dir: bool) -> bool:
+    # Tiefere Dateien und spätere Regeln haben Vorrang
+    for ignore in reversed(rules):
+        result = ignore.match(rel_path, is_dir)
+        if result is not None:
+            return result
+    return False
+
+def find_git_root(path: Path) -> Optional[Path]:
+    for directory in (path, *path.parents):
+        if (directory / '.git').exists():
+            return directory
+    return None
+
+class SourceWalker:
+    """Ignore-bewusster Durchlauf unter root; files() zählt nur einmal auf (refresh für neu)"""
+
+    def __init__(self, root: Path, suffixes: Tuple[str, ...] = ('.dart',), detect_generated: bool = True):
+        self.root = Path(root)
+        self.suffixes = suffixes
+        self.detect_generated = detect_generated
+        resolved = self.root.resolve()
+        # Ignore-Dateien gelten ab dem Git-Root (ohne Git: ab root)
+        self.anchor = find_git_root(resolved) or resolved
+        root_rel = resolved.relative_to(self.anchor).as_posix()
+        self.root_rel = '' if root_rel == '.' else root_rel + '/'
+        self.pruned_dirs = 0
+        self.ignored_files = 0
+        self._files: Optional[List[SourceFile]] = None
+        self._dir_rules: Dict[str, List[IgnoreFile]] = {}
+
+    def files(self) -> List[SourceFile]:
+        if self._files is None:
+            self.pruned_dirs = self.ignored_files = 0
+            files: List[SourceFile] = []
+            self._walk(str(self.root), self.root_rel, self._rules_above_root(), files)
+            self._files = files
+        return self._files
+
+    def refresh(self):
+        """Nächstes files() zählt neu auf und liest die Ignore-Dateien neu"""
+        self._files = None
+        self._dir_rules.clear()
+
+    def _rules_in(self, directory: str, rel: str, names=None) -> List[IgnoreFile]:
+        rules = self._dir_rules.get(directory)
+        if rules is None:
+            rules = []
+            for name in IGNORE_FILES:
+                if names is None or name in names:
+                    ignore = IgnoreFile.load(os.path.join(directory, name), rel)
+                    if ignore is not None:
+                        rules.append(ignore)
+            self._dir_rules[directory] = rules
+        return rules
+
+    def _rules_above_root(self) -> List[IgnoreFile]:
+        """Regeln aus dem Anker und allen Verzeichnissen bis einschließlich root"""
+        rules = []
+        directory = self.anchor
+        rel = ''
+        rules.extend(self._rules_in(str(directory), rel))
+        for part in Path(self.root_rel).parts:
+            directory = directory / part
+            rel += part + '/'
+            rules.extend(self._rules_in(str(directory), rel))
+        return rules
+
+    def _walk(self, directory: str, rel: str, rules: List[IgnoreFile], files: List[SourceFile]):
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except OSError:
+            return
+
+        if rel != self.root_rel:
+            local = self._rules_in(directory, rel, {entry.name for entry in entries})
+            if local:
+                rules = rules + local
+
+        # Verzeichnisse mit "/" sortieren: Dateien kommen so in Pfad-Reihenfolge
+        # (wie sorted() über die relativen Pfade), die Key-Vergabe hängt davon ab
+        kinds = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            kinds.append((entry.name + '/' if is_dir else entry.name, is_dir, entry))
+        kinds.sort(key=lambda kind: kind[0])
+
+        for _, is_dir, entry in kinds:
+            name = entry.name
+            if is_dir:
+                if name == '.git' or _ignored(rules, rel + name, True):
+                    self.pruned_dirs += 1
+                else:
+                    self._walk(entry.path, rel + name + '/', rules, files)
+            elif name.endswith(self.suffixes):
+                if _ignored(rules, rel + name, False):
+                    self.ignored_files += 1
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                generated = self.detect_generated and is_generated(entry.path, _read_head(entry.path))
+                files.append(SourceFile(Path(entry.path), stat.st_size, stat.st_mtime_ns, generated))
+
+    def is_ignored(self, path: Path) -> bool:
+        """Wie im Durchlauf: liegt path in einem ausgeschlossenen Verzeichnis unter root
+        oder ist selbst ausgeschlossen? Pfade außerhalb von root gelten als ausgeschlossen."""
+        try:
+            rel_parts = Path(path).resolve().relative_to(self.anchor.joinpath(self.root_rel)).parts
+        except ValueError:
+            return True
+        rules = self._rules_above_root()
+        directory = str(self.anchor / self.root_rel)
+        rel = self.root_rel
+        for part in rel_parts[:-1]:
+            if part == '.git' or _ignored(rules, rel + part, True):
+                return True
+            directory = os.path.join(directory, part)
+            rel += part + '/'
+            rules = rules + self._rules_in(directory, rel)
+        return bool(rel_parts) and _ignored(rules, rel + rel_parts[-1], False)
+
+    def source_file(self, path: Path) -> Optional[SourceFile]:
+        """Einzelne Datei wie im Durchlauf bewerten (None: fehlt, falsche Endung oder ignoriert)"""
+        path = Path(path)
+        if not path.name.endswith(self.suffixes) or self.is_ignored(path):
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        generated = self.detect_generated and is_generated(path, _read_head(str(path)))
+        return SourceFile(path, stat.st_size, stat.st_mtime_ns, generated)
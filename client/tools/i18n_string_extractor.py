@@ -3,35 +3,269 @@
 Weltenwind i18n String Extractor
 Automatische Erkennung von hardcoded deutschen Strings im Flutter Code
 
-Usage: python i18n_string_extractor.py [--fix] [--fail-on-find] [--strict]
+Usage: python i18n_string_extractor.py [--fix] [--fail-on-find] [--strict] [--db] [--budget 2s]
 """
 
 import os
 import re
+import mmap
+import sys
 import json
+import time
 import argparse
+import datetime
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Iterable, Iterator, TextIO, Tuple, Optional
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+from i18n_dart_lexer import (EnclosingCallIndex, LineIndex, backward_read_floor, build_call_index,
+                             iter_string_literals, lex_window)
+from i18n_rule_compiler import compile_rules
+from i18n_scan_cache import ScanCache, rule_fingerprint
+from i18n_git import GitError, changed_line_ranges, line_in_ranges
+from i18n_file_watcher import create_watcher
+from i18n_profiler import ScanProfiler
+from i18n_source_walker import SourceFile, SourceWalker, is_generated
+from i18n_key_allocator import KeyAllocator, text_digest
+from i18n_report_writers import (SARIF_LEVELS, JsonArrayWriter, MarkdownReportWriter, SarifWriter,
+                                 open_output)
+from i18n_findings_db import EXTRACTOR, FindingsDB, FindingsRun, default_db_file, extraction_scope
+from i18n_value_index import ValueIndex
+
+class SourceText:
+    """Quelltext einer gescannten Datei, geteilt von allen ihren Treffern
+
+    Hält den Text im Speicher oder liest ihn erst beim ersten Zugriff von
+    Platte (z.B. für Cache-Treffer oder Ergebnisse aus Worker-Prozessen).
+    """
+
+    __slots__ = ('path', '_text')
+
+    def __init__(self, path: Optional[Path] = None, text: Optional[str] = None):
+        self.path = path
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            try:
+                self._text = self.path.read_text(encoding='utf-8') if self.path else ''
+            except (OSError, ValueError):
+                self._text = ''
+        return self._text
+
+    def release(self):
+        """Gibt den Text frei, wenn er später von Platte gelesen werden kann"""
+        if self.path is not None:
+            self._text = None
 
-@dataclass
 class StringMatch:
-    file: str
-    line: int
-    column: int
-    original: str
-    suggested_key: str
-    context: str
-    category: str
-    confidence: float
-    widget_context: str = ""
-    quote_type: str = ""
+    """Ein Treffer; der Kontext-Text wird erst beim Rendern aus dem Quelltext geschnitten"""
+
+    __slots__ = ('file', 'line', 'column', 'original', 'suggested_key', 'category',
+                 'confidence', 'widget_context', 'quote_type', 'localized_as',
+                 'context_start', 'context_end', 'source', '_context')
+
+    # Felder in JSON, JSONL und Scan-Cache (ohne Kontext-Text)
+    FIELDS = ('file', 'line', 'column', 'original', 'suggested_key', 'category',
+              'confidence', 'widget_context', 'quote_type')
+
+    def __init__(self, file: str, line: int, column: int, original: str, suggested_key: str,
+                 category: str, confidence: float, widget_context: str = "", quote_type: str = "",
+                 context: Optional[str] = None, context_start: int = 0, context_end: int = 0,
+                 source: Optional[SourceText] = None, localized_as: str = ""):
+        # Pfade, Kategorien und Widget-Kontexte wiederholen sich: nur einmal im Speicher
+        self.file = sys.intern(file)
+        self.line = line
+        self.column = column
+        self.original = original
+        self.suggested_key = suggested_key
+        self.category = sys.intern(category)
+        self.confidence = confidence
+        self.widget_context = sys.intern(widget_context)
+        self.quote_type = quote_type
+        # Key, unter dem der Text schon in einer .arb-Datei steht (siehe assign_key)
+        self.localized_as = localized_as
+        self.context_start = context_start
+        self.context_end = context_end
+        self.source = source
+        self._context = context
+
+    @property
+    def context(self) -> str:
+        """±3 Zeilen um den Treffer (wird bei jedem Zugriff aus dem Quelltext geschnitten)"""
+        if self._context is not None:
+            return self._context
+        if self.source is None:
+            return ""
+        return self.source.text[self.context_start:self.context_end].strip()
+
+    def to_dict(self, with_span: bool = False) -> Dict:
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        if self.localized_as:
+            data['localized_as'] = self.localized_as
+        if with_span:
+            data['context_span'] = [self.context_start, self.context_end]
+            # Treffer aus fensterweise gescannten Dateien tragen ihren Kontext selbst
+            if self._context is not None:
+                data['context'] = self._context
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict, source: Optional[SourceText] = None) -> 'StringMatch':
+        """Gegenstück zu to_dict (akzeptiert auch ältere Einträge mit 'context'-Text)"""
+        context_start, context_end = data.get('context_span', (0, 0))
+        return cls(**{field: data[field] for field in cls.FIELDS if field in data},
+                   context=data.get('context'),
+                   context_start=context_start,
+                   context_end=context_end,
+                   source=source,
+                   localized_as=data.get('localized_as', ''))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, StringMatch):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return (f"StringMatch({self.file}:{self.line}:{self.column} "
+                f"{self.suggested_key!r} {self.category} {self.confidence:.2f})")
+
+# Mindestgröße eines Arbeitspakets im Parallel-Scan (kleine Dateien werden gebündelt)
+MIN_BATCH_BYTES = 64 * 1024
+
+# Ab dieser Größe wird eine Datei für den Byte-Vorfilter gemappt statt gelesen
+MMAP_MIN_BYTES = 64 * 1024
+
+# Ab dieser Größe wird eine Datei fensterweise gescannt (z.B. generierte oder vendorte Dateien)
+CHUNKED_SCAN_MIN_BYTES = 8 * 1024 * 1024
+
+# Zeichen pro Scan-Fenster (plus Überlappung)
+SCAN_WINDOW_CHARS = 1 << 20
+
+# Obergrenze der scan-weiten Memo-Tabellen (eindeutige Literal-Texte bzw. Text/Kategorie-Paare)
+LITERAL_MEMO_SIZE = 1 << 16
+
+# Budget-Scan: ohne früheren vollen Lauf gelten Änderungen der letzten 24 h als "kürzlich"
+RECENT_WINDOW_NS = 24 * 3600 * 1_000_000_000
+
+def decode_source(data: bytes) -> str:
+    """Dekodiert Dart-Quelltext wie open(..., 'r'): strikt UTF-8, Zeilenenden vereinheitlicht
+
+    Gemeinsam für Dateien (read_candidate_source) und Index-Blobs (Pre-Commit),
+    damit beide dieselben Zeilen und Spalten sehen.
+    """
+    content = data.decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+_DURATION = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*(ms|s|m)?\s*$')
+
+def parse_duration(value: str) -> float:
+    """Dauer in Sekunden aus "2s", "500ms", "1.5m" oder "2" (Sekunden)"""
+    found = _DURATION.match(value)
+    if found is None:
+        raise argparse.ArgumentTypeError(f"ungültige Dauer: {value!r} (z.B. 2s, 500ms, 1m)")
+    amount = float(found.group(1))
+    unit = found.group(2) or 's'
+    return amount / 1000 if unit == 'ms' else amount * 60 if unit == 'm' else amount
+
+def prioritize_files(sources: List[SourceFile], client_root: Path, hit_counts: Dict[str, int],
+                     recent_ns: int) -> List[SourceFile]:
+    """Reihenfolge für den Budget-Scan
+
+    Zuerst seit recent_ns geänderte Dateien (neueste zuerst), dann nach
+    bisheriger Trefferdichte (Treffer pro KiB, höchste zuerst), dann kleine
+    vor großen Dateien - so deckt das Budget möglichst viele Dateien ab.
+    """
+    def priority(item: Tuple[int, SourceFile]):
+        index, source = item
+        if source.mtime_ns >= recent_ns:
+            return (0, -source.mtime_ns, 0, index)
+        hits = hit_counts.get(source.path.relative_to(client_root).as_posix(), 0)
+        density = hits * 1024 / max(source.size, 1)
+        return (1, -density, source.size, index)
+
+    return [source for _, source in sorted(enumerate(sources), key=priority)]
+
+def _window_stop(window: str) -> Optional[int]:
+    """Frühestes Ende eines Fensters: vor den letzten 4 Zeilenumbrüchen (Kontextzeilen
+    und genug Abstand, damit kein Token am Fensterende abgeschnitten ist)"""
+    stop = len(window)
+    for _ in range(4):
+        stop = window.rfind('\n', 0, stop)
+        if stop < 0:
+            return None
+    return stop
+
+def plan_scan_batches(files: List[Path], workers: int,
+                      sizes: Optional[List[int]] = None) -> List[List[Tuple[int, str, int]]]:
+    """Verteilt Dateien nach Größe auf Arbeitspakete (größte zuerst)
+
+    Große Dateien bilden ein eigenes Paket, kleine werden bis zur Zielgröße
+    gebündelt. So blockiert eine einzelne große Datei nicht das Ende des Laufs.
+    Größen aus dem Verzeichnis-Durchlauf sparen den stat-Aufruf.
+    """
+    sized = []
+    for index, path in enumerate(files):
+        if sizes is not None:
+            size = sizes[index]
+        else:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                size = 0
+        sized.append((size, index, str(path)))
+
+    # ~4 Pakete pro Prozess, damit ungleich schnelle Pakete sich ausgleichen
+    total_bytes = sum(size for size, _, _ in sized)
+    target = max(total_bytes // (workers * 4), MIN_BATCH_BYTES)
+    sized.sort(key=lambda item: (-item[0], item[1]))
+
+    batches = []
+    current: List[Tuple[int, str, int]] = []
+    current_bytes = 0
+    for size, index, path in sized:
+        if size >= target:
+            batches.append([(index, path, size)])
+            continue
+        current.append((index, path, size))
+        current_bytes += size
+        if current_bytes >= target:
+            batches.append(current)
+            current = []
+            current_bytes = 0
+    if current:
+        batches.append(current)
+    return batches
+
+# Pro Worker-Prozess einmal erzeugter Extractor (Patterns nur einmal kompilieren)
+_worker_extractor = None
+
+def _init_scan_worker(client_root: str, lib_dir: str):
+    global _worker_extractor
+    _worker_extractor = I18nStringExtractor(client_root, lib_dir)
+
+def _scan_batch(batch: List[Tuple[int, str, int]]) -> List[Tuple[int, List[StringMatch], Dict[str, int]]]:
+    """Worker: liest die Dateien selbst, zurück gehen nur die Treffer (und die Vorfilter-Zähler pro Datei)"""
+    results = []
+    for index, path, size in batch:
+        matches, prefilter = _worker_extractor.scan_file_counted(Path(path), size)
+        # Quelltext nicht zurückschicken, der Hauptprozess liest ihn bei Bedarf selbst
+        for match in matches:
+            match.source.release()
+        results.append((index, matches, prefilter))
+    return results
 
 class I18nStringExtractor:
     def __init__(self, client_root: str = ".", lib_dir: str = "lib"):
         self.client_root = Path(client_root)
         self.lib_dir = self.client_root / lib_dir
         self.l10n_dir = self.client_root / lib_dir / "l10n"
+        # Ein Durchlauf pro Lauf, .gitignore/.i18nignore-Verzeichnisse werden gar nicht betreten
+        self.walker = SourceWalker(self.lib_dir)
         
         # ✅ 1. ULTRA-RESTRIKTIVE deutsche String-Patterns - NUR echte UI-Strings!
         self.german_patterns = [
@@ -230,57 +464,102 @@ class I18nStringExtractor:
             r'.*\]\s*$',  # Schließende eckige Klammer am Ende
         ]
 
-    def should_exclude(self, text: str) -> bool:
-        """✅ 2. Erweiterte Ausschlussprüfung mit Whitelisting"""
-        clean_text = text.strip()
-        
-        # Whitelist check
-        if clean_text in self.whitelist_strings:
-            return True
-        
-        # Pattern-basierte Ausschlüsse
-        for pattern in self.exclude_patterns:
-            if re.match(pattern, clean_text):
-                return True
-        return False
-
-    def detect_widget_context(self, lines: List[str], line_idx: int) -> str:
-        """✅ 3. Erweiterte Widget-Kontext-Erkennung"""
-        
-        # Suche rückwärts nach Widget-Definitionen
-        widget_patterns = [
-            r'(ElevatedButton|TextButton|OutlinedButton)',
-            r'(Text|RichText)',
-            r'(AppBar|Scaffold)',
-            r'(AlertDialog|SimpleDialog)',
-            r'(TextField|TextFormField)',
-            r'(ListTile|Card)',
-            r'(SnackBar|Tooltip)',
-        ]
+        # Regel-Listen einmalig in optimierte Matcher übersetzen
+        self.rules = compile_rules(
+            self.german_patterns,
+            self.exclude_patterns,
+            self.whitelist_strings,
+            self.category_patterns
+        )
+
+        # Scan-weite Memo-Tabellen: kontextunabhängige Entscheidungen einmal pro eindeutigem Text
+        self.decide_literal = lru_cache(maxsize=LITERAL_MEMO_SIZE)(self._decide_literal)
+        self._key_memo = lru_cache(maxsize=LITERAL_MEMO_SIZE)(self._generate_key)
+
+        # Optionaler persistenter Scan-Cache (siehe use_scan_cache)
+        self.scan_cache: Optional[ScanCache] = None
+        self.last_scan_stats: Dict[str, int] = {}
         
-        context_lines = []
-        search_range = min(10, line_idx)  # Suche max. 10 Zeilen zurück
+        # Byte-Vorfilter: geprüfte und ohne Dekodierung übersprungene Dateien
+        self.prefilter_stats = {'checked': 0, 'skipped': 0}
         
-        for i in range(line_idx - search_range, line_idx + 1):
-            if 0 <= i < len(lines):
-                line = lines[i].strip()
-                context_lines.append(line)
-                
-                # Prüfe Widget-Pattern
-                for pattern in widget_patterns:
-                    if re.search(pattern, line):
-                        return f"Widget: {re.search(pattern, line).group(1)}"
-        
-        # Fallback: Suche nach häufigen Flutter-Patterns
-        context_text = '\n'.join(context_lines)
-        if 'child:' in context_text:
-            return "Widget: child property"
-        elif 'title:' in context_text:
-            return "Widget: title property"
-        elif 'content:' in context_text:
-            return "Widget: content property"
-        
-        return "Widget: unknown"
+        # Optionales Regel- und Stufen-Profiling (siehe enable_profiling)
+        self.profiler: Optional[ScanProfiler] = None
+
+    def rule_fingerprint(self) -> str:
+        """Fingerprint des aktiven Pattern-Satzes inkl. Scan-Logik"""
+        tools_dir = Path(__file__).resolve().parent
+        return rule_fingerprint(
+            self.german_patterns,
+            self.exclude_patterns,
+            self.whitelist_strings,
+            self.category_patterns,
+            sources=[tools_dir / name for name in
+                     ('i18n_string_extractor.py', 'i18n_dart_lexer.py', 'i18n_rule_compiler.py')]
+        )
+
+    def use_scan_cache(self, cache_file: Optional[Path] = None) -> ScanCache:
+        """Aktiviert den inkrementellen Scan-Cache für scan_all_files"""
+        if cache_file is None:
+            cache_file = self.client_root / "tools" / ".i18n_cache" / "scan_cache.json"
+        self.scan_cache = ScanCache(cache_file, self.rule_fingerprint())
+        return self.scan_cache
+
+    def enable_profiling(self) -> ScanProfiler:
+        """Misst ab jetzt Stufen-Zeiten pro Datei und Kosten/Treffer pro Regel (nur seriell)"""
+        self.profiler = ScanProfiler(
+            self.german_patterns,
+            self.exclude_patterns,
+            self.whitelist_strings,
+            self.category_patterns
+        )
+        return self.profiler
+
+    def classify_literal(self, text: str, quote: str) -> Optional[float]:
+        """Gibt die Basis-Konfidenz der besten passenden German-Regel zurück (oder None)"""
+        return self.rules.literal.classify(text, quote)
+
+    def should_exclude(self, text: str) -> bool:
+        """✅ 2. Erweiterte Ausschlussprüfung mit Whitelisting"""
+        # Whitelist + alle exclude_patterns in einem kompilierten Matcher
+        return self.rules.exclude.matches(text.strip())
+
+    def _decide_literal(self, text: str, quote: str) -> Optional[Tuple[str, float]]:
+        """Kandidaten-Entscheidung für einen Literal-Text, unabhängig vom Fundort
+
+        Liefert (Text, Basis-Konfidenz) oder None. Über decide_literal memoisiert;
+        der Text ist das zuerst gesehene Objekt, alle Vorkommen teilen sich ihn.
+        """
+        base_confidence = self.classify_literal(text, quote)
+        if base_confidence is None:
+            return None
+
+        # Ausschlusskriterien prüfen
+        if self.should_exclude(text) or len(text.strip()) < 3:
+            return None
+        return text, base_confidence
+
+    def memo_stats(self) -> Dict[str, Dict[str, float]]:
+        """Treffer/Fehlschläge der Memo-Tabellen dieses Prozesses"""
+        stats = {}
+        for name, memo in (('literal', self.decide_literal), ('key', self._key_memo)):
+            info = memo.cache_info()
+            lookups = info.hits + info.misses
+            stats[name] = {
+                'hits': info.hits,
+                'misses': info.misses,
+                'size': info.currsize,
+                'hit_rate': info.hits / lookups if lookups else 0.0
+            }
+        return stats
+
+    def detect_widget_context(self, call_index: EnclosingCallIndex, offset: int) -> str:
+        """✅ 3. Widget-Kontext aus dem Klammer-Index der Datei
+
+        Liefert die umschließenden Konstruktor-Aufrufe samt benanntem Argument,
+        z.B. "Widget: AlertDialog.title > Text" - unabhängig vom Zeilenabstand.
+        """
+        return call_index.widget_context(offset)
 
     def detect_category(self, context: str, file_path: str, widget_context: str = "") -> Tuple[str, float]:
         """✅ 6. Kategorien gezielt gewichtbar gemacht"""
@@ -305,11 +584,10 @@ class I18nStringExtractor:
             base_confidence += 0.1
         
         # Kontext-basierte Kategorisierung mit Gewichtung
-        for category, (pattern, confidence_boost) in self.category_patterns.items():
-            if re.search(pattern, context_lower):
-                detected_category = category
-                base_confidence += confidence_boost
-                break
+        category = self.rules.category.first_match(context_lower)
+        if category is not None:
+            detected_category = category
+            base_confidence += self.category_patterns[category][1]
         
         # Widget-Kontext-spezifische Gewichtung
         if 'dialog' in widget_context.lower():
@@ -322,7 +600,10 @@ class I18nStringExtractor:
         return detected_category, base_confidence
 
     def generate_key(self, text: str, category: str) -> str:
-        """Generiert einen .arb-Key basierend auf Text und Kategorie"""
+        """Generiert den Basis-Key aus Text und Kategorie (memoisiert, siehe assign_keys)"""
+        return self._key_memo(text, category)
+
+    def _generate_key(self, text: str, category: str) -> str:
         # Text säubern und normalisieren
         clean_text = re.sub(r'[^\w\s]', '', text)
         clean_text = re.sub(r'\s+', ' ', clean_text).strip()
@@ -333,7 +614,7 @@ class I18nStringExtractor:
         
         # Fallback wenn kein sinnvoller Key
         if not key_base or len(key_base) < 3:
-            key_base = f"Text{abs(hash(text)) % 1000:03d}"
+            key_base = f"Text{int(text_digest(text), 16) % 1000:03d}"
         
         return f"{category}{key_base}"
 
@@ -343,201 +624,830 @@ class I18nStringExtractor:
         end = min(len(lines), line_idx + context_size + 1)
         return '\n'.join(lines[start:end])
 
-    def scan_file(self, file_path: Path) -> List[StringMatch]:
-        """Scannt eine Dart-Datei nach deutschen Strings"""
-        matches = []
-        
+    def scan_file(self, file_path: Path, size: Optional[int] = None) -> List[StringMatch]:
+        """Scannt eine Dart-Datei nach deutschen Strings (size z.B. aus dem Verzeichnis-Durchlauf)"""
+        profiler = self.profiler
+        if profiler is not None:
+            started = time.perf_counter_ns()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            if size is None:
+                size = file_path.stat().st_size
+            if size >= CHUNKED_SCAN_MIN_BYTES:
+                # Sehr große Dateien fensterweise, der Speicher bleibt begrenzt
+                matches = self.scan_file_chunked(file_path)
+                if profiler is not None:
+                    profiler.add_file(str(file_path.relative_to(self.client_root)),
+                                      time.perf_counter_ns() - started, len(matches))
+                return matches
+            content = self.read_candidate_source(file_path)
         except Exception as e:
             print(f"⚠️ Fehler beim Lesen von {file_path}: {e}")
-            return matches
+            return []
+        if content is None:
+            if profiler is not None:
+                profiler.add_stage('read', time.perf_counter_ns() - started)
+            return []
 
         # Relative Pfad für bessere Lesbarkeit
         rel_path = str(file_path.relative_to(self.client_root))
+        if profiler is None:
+            return self.scan_content(content, rel_path, SourceText(file_path, content))
+
+        profiler.add_stage('read', time.perf_counter_ns() - started)
+        matches = self.scan_content(content, rel_path, SourceText(file_path, content))
+        profiler.add_file(rel_path, time.perf_counter_ns() - started, len(matches))
+        return matches
+
+    def scan_file_counted(self, file_path: Path, size: Optional[int] = None) -> Tuple[List[StringMatch], Dict[str, int]]:
+        """scan_file plus die Vorfilter-Zähler dieser Datei (landen mit im Scan-Cache)"""
+        before = dict(self.prefilter_stats)
+        matches = self.scan_file(file_path, size)
+        return matches, {name: count - before[name] for name, count in self.prefilter_stats.items()}
+
+    def read_candidate_source(self, file_path: Path) -> Optional[str]:
+        """Liest eine Dart-Datei, sofern der Byte-Vorfilter einen Treffer nicht ausschließt
+
+        Der Vorfilter läuft auf den Rohbytes (große Dateien gemappt), Dateien ohne
+        mögliches German-Literal werden nie dekodiert und liefern None.
+        """
+        self.prefilter_stats['checked'] += 1
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if not self.rules.prefilter.may_match(mapped):
+                        self.prefilter_stats['skipped'] += 1
+                        return None
+                    data = mapped[:]
+            else:
+                data = f.read()
+                if not self.rules.prefilter.may_match(data):
+                    self.prefilter_stats['skipped'] += 1
+                    return None
+
+        return decode_source(data)
+
+    def scan_file_chunked(self, file_path: Path) -> List[StringMatch]:
+        """Scannt eine große Datei fensterweise, mit denselben Treffern wie scan_content
+
+        Jedes Fenster wird bis zu einer sicheren Stelle des Lexers verarbeitet
+        (kein offener String, Kommentar oder Interpolation, dahinter noch die
+        Kontextzeilen). Das nächste Fenster beginnt mit den Kontextzeilen davor
+        als Überlappung und übernimmt die offenen Klammern für den
+        Widget-Kontext. Ein String, der nicht in ein Fenster passt, vergrößert
+        es, bis er vollständig darin liegt.
+        """
+        self.prefilter_stats['checked'] += 1
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if not self.rules.prefilter.may_match(mapped):
+                self.prefilter_stats['skipped'] += 1
+                return []
+
+        rel_path = str(file_path.relative_to(self.client_root))
+        # Kontext steckt in den Treffern, die Datei wird nie ganz geladen
+        source = SourceText(file_path)
+        matches: List[StringMatch] = []
+        window = ''
+        offset = 0          # Datei-Offset von window[0] (immer ein Zeilenanfang)
+        first_line = 1      # Zeile von window[0]
+        start = 0           # sichere Stelle im Fenster, ab der gelext wird
+        carry = None
+        # newline=None wie open(..., 'r') bzw. read_candidate_source: gleiche Offsets wie im Ganzen
+        with open(file_path, 'r', encoding='utf-8', newline=None) as f:
+            while True:
+                # Reicht ein Fenster nicht, wird es verdoppelt (lineare Gesamtkosten)
+                chunk = f.read(max(SCAN_WINDOW_CHARS, len(window)))
+                window += chunk
+                at_eof = not chunk
+                if at_eof:
+                    literals, safe = lex_window(window, start)
+                else:
+                    stop = _window_stop(window)
+                    if stop is None or stop <= start:
+                        continue
+                    literals, safe = lex_window(window, start, stop)
+                    # Treffer-Zeile + 3 Kontextzeilen müssen hinter jedem Literal im Fenster liegen
+                    if safe is None or window.count('\n', safe) < 4:
+                        continue
+
+                candidates = self._select_candidates(window, literals)
+                if at_eof and not candidates:
+                    break
+                line_index = LineIndex(window)
+                call_index = build_call_index(window, literals,
+                                              end=candidates[-1][0].start + 1 if at_eof else safe,
+                                              start=start, carry=carry)
+                if candidates:
+                    matches.extend(self._build_matches(window, rel_path, source, candidates,
+                                                       line_index, call_index, offset=offset,
+                                                       first_line=first_line, keep_context=True))
+                if at_eof:
+                    break
+
+                # Neues Fenster ab den Kontextzeilen vor safe und ab allem, was die
+                # Namensauflösung vor "(" bzw. ":" rückwärts lesen kann
+                keep_line = min(line_index.line_of(safe) - 3, line_index.line_of(backward_read_floor(window, safe)))
+                keep_line = max(1, keep_line)
+                shift = line_index.line_starts[keep_line - 1]
+                carry = call_index.carry(shift)
+                window = window[shift:]
+                offset += shift
+                first_line += keep_line - 1
+                start = safe - shift
+        return matches
+
+    def scan_content(self, content: str, rel_path: str,
+                     source: Optional[SourceText] = None) -> List[StringMatch]:
+        """Scannt Dart-Quelltext aus dem Speicher (z.B. Staging-Blob oder Editor-Puffer)"""
+        profiler = self.profiler
+        clock = time.perf_counter_ns
         
-        for pattern, base_confidence in self.german_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
-                text = match.group(1)
-                
-                # Bestimme Quote-Type
-                quote_type = '"' if pattern.startswith(r'"') else "'"
-                
-                # Ausschlusskriterien prüfen
-                if self.should_exclude(text) or len(text.strip()) < 3:
-                    continue
-                
-                # Position bestimmen
-                line_start = content.rfind('\n', 0, match.start()) + 1
-                line_num = content.count('\n', 0, match.start()) + 1
-                column = match.start() - line_start + 1
-                
-                # Erweiterten Kontext extrahieren
-                context = self.get_context(lines, line_num - 1)
-                widget_context = self.detect_widget_context(lines, line_num - 1)
-                
-                # Kategorie mit Gewichtung bestimmen
-                category, confidence_boost = self.detect_category(context, rel_path, widget_context)
-                final_confidence = min(1.0, base_confidence + confidence_boost)
-                
-                suggested_key = self.generate_key(text, category)
-                
-                matches.append(StringMatch(
-                    file=rel_path,
-                    line=line_num,
-                    column=column,
-                    original=text,
-                    suggested_key=suggested_key,
-                    context=context.strip(),
-                    category=category,
-                    confidence=final_confidence,
-                    widget_context=widget_context,
-                    quote_type=quote_type
-                ))
+        # Ein Lexer-Durchlauf pro Datei, Regeln nur auf echte String-Literale
+        if profiler is not None:
+            started = clock()
+        literals = iter_string_literals(content)
+        if profiler is not None:
+            profiler.add_stage('lex', clock() - started)
+        candidates = self._select_candidates(content, literals)
+        if not candidates:
+            return []
         
-        return matches
+        if profiler is not None:
+            started = clock()
+        if source is None:
+            source = SourceText(text=content)
+        # Zeilenanfänge und Klammer-Index einmal pro Datei, Klammer-Index nur bis zum letzten Treffer
+        line_index = LineIndex(content)
+        call_index = build_call_index(content, literals, end=candidates[-1][0].start + 1)
+        if profiler is not None:
+            profiler.add_stage('context', clock() - started)
+        return self._build_matches(content, rel_path, source, candidates, line_index, call_index)
 
-    def scan_all_files(self) -> List[StringMatch]:
-        """Scannt alle Dart-Dateien im lib-Verzeichnis"""
-        all_matches = []
+    def _select_candidates(self, content: str, literals: list) -> list:
+        """(Literal, Text, Basis-Konfidenz) für alle Literale, die als deutscher UI-String gelten"""
+        profiler = self.profiler
+        if profiler is not None:
+            candidates = self._profiled_candidates(profiler, content, literals)
+            profiler.count_candidates(len(literals), len(candidates))
+            return candidates
+
+        # Wiederkehrendes UI-Vokabular wird nur beim ersten Vorkommen geprüft
+        candidates = []
+        decide = self.decide_literal
+        for literal in literals:
+            decision = decide(literal.body(content), literal.quote)
+            if decision is not None:
+                candidates.append((literal, *decision))
+        return candidates
+
+    def _build_matches(self, content: str, rel_path: str, source: SourceText, candidates: list,
+                       line_index: LineIndex, call_index: EnclosingCallIndex, offset: int = 0,
+                       first_line: int = 1, keep_context: bool = False) -> List[StringMatch]:
+        """Treffer für die Kandidaten; offset/first_line verschieben Fenster-Positionen auf die Datei
+
+        Mit keep_context tragen die Treffer ihren Kontext-Text selbst (für Dateien,
+        die nicht im Speicher bleiben sollen).
+        """
+        matches = []
+        profiler = self.profiler
+        clock = time.perf_counter_ns
+        if profiler is not None:
+            started = clock()
+        rel_path = sys.intern(rel_path)
+        for literal, text, base_confidence in candidates:
+            quote_type = literal.quote
+
+            # Position bestimmen
+            line_num, column = line_index.position(literal.start)
+
+            # Erweiterter Kontext (±3 Zeilen) nur als Offsets, Text nur für die Kategorie
+            context_start, context_end = line_index.line_span(line_num - 3, line_num + 3)
+            context = content[context_start:context_end]
+            widget_context = self.detect_widget_context(call_index, literal.start)
+            
+            if profiler is not None:
+                profiler.add_stage('context', clock() - started)
+                started = clock()
+
+            # Kategorie mit Gewichtung bestimmen
+            category, confidence_boost = self.detect_category(context, rel_path, widget_context)
+            final_confidence = min(1.0, base_confidence + confidence_boost)
+            
+            suggested_key = self.generate_key(text, category)
+            
+            if profiler is not None:
+                profiler.add_stage('categorize', clock() - started)
+                context_lower = context.lower()
+                profiler.profile_category(context_lower, self.rules.category.first_match(context_lower))
+                started = clock()
+            
+            matches.append(StringMatch(
+                file=rel_path,
+                line=line_num + first_line - 1,
+                column=column,
+                original=text,
+                suggested_key=suggested_key,
+                category=category,
+                confidence=final_confidence,
+                widget_context=widget_context,
+                quote_type=quote_type,
+                context=context.strip() if keep_context else None,
+                context_start=context_start + offset,
+                context_end=context_end + offset,
+                source=source
+            ))
         
+        if profiler is not None:
+            profiler.add_stage('context', clock() - started)
+        return matches
+
+    def _profiled_candidates(self, profiler: ScanProfiler, content: str, literals: list) -> list:
+        """Kandidaten-Auswahl wie in scan_content, mit Zeitmessung und Einzelauswertung der Regeln
+
+        Ohne Literal-Memo, damit jede Regel jedes Vorkommen sieht. Die
+        Einzelauswertung läuft außerhalb der gemessenen Stufen-Zeiten.
+        """
+        clock = time.perf_counter_ns
+        candidates = []
+        for literal in literals:
+            text = literal.body(content)
+            started = clock()
+            rule = self.rules.literal.first_match(text, literal.quote)
+            profiler.add_stage('match', clock() - started)
+            profiler.profile_literal(text, literal.quote, rule)
+            if rule is None:
+                continue
+
+            stripped = text.strip()
+            started = clock()
+            excluded = self.rules.exclude.first_match(stripped)
+            profiler.add_stage('exclude', clock() - started)
+            profiler.profile_exclude(stripped, excluded)
+            if excluded is not None or len(stripped) < 3:
+                continue
+            candidates.append((literal, text, self.rules.literal.confidences[rule]))
+        return candidates
+
+    def scan_all_files(self, jobs: int = 1, files: Optional[List[Path]] = None) -> List[StringMatch]:
+        """Scannt alle Dart-Dateien im lib-Verzeichnis (jobs > 1: parallel, 0: alle Kerne)
+
+        Mit files wird nur diese Teilmenge gescannt (z.B. für --since).
+        """
+        return list(self.iter_matches(jobs=jobs, files=files))
+
+    def iter_matches(self, jobs: int = 1, files: Optional[List[Path]] = None) -> Iterator[StringMatch]:
+        """Wie scan_all_files, liefert Treffer aber sofort pro Datei (Streaming)"""
+        for _, matches in self.iter_scan_results(jobs=jobs, files=files):
+            yield from matches
+
+    def iter_scan_results(self, jobs: int = 1,
+                          files: Optional[List[Path]] = None) -> Iterator[Tuple[Path, List[StringMatch]]]:
+        """Liefert (Datei, Treffer) in Datei-Reihenfolge, sobald eine Datei fertig ist
+
+        Cache-Treffer kommen ohne Scan, geänderte Dateien werden seriell oder
+        parallel gescannt. Statistik und Cache werden nach der letzten Datei
+        geschrieben.
+        """
         if not self.lib_dir.exists():
             print(f"❌ lib-Verzeichnis nicht gefunden: {self.lib_dir}")
-            return all_matches
+            return
         
-        dart_files = list(self.lib_dir.rglob("*.dart"))
-        total_files = len(dart_files)
+        if files is None:
+            sources = self.walker.files()
+        else:
+            # Explizite Dateien (z.B. --since) wie im Durchlauf bewerten
+            sources = [source for source in map(self.walker.source_file, files) if source is not None]
+        total_files = len(sources)
         print(f"🔍 Scanne {total_files} Dart-Dateien...")
+        if files is None and (self.walker.pruned_dirs or self.walker.ignored_files):
+            print(f"🙈 Ignoriert (.gitignore/.i18nignore): {self.walker.pruned_dirs} Verzeichnisse, "
+                  f"{self.walker.ignored_files} Dateien")
         
-        scanned_files = 0
-        files_with_matches = 0
+        # Generierte Dateien überspringen
+        scan_sources = [source for source in sources if not source.generated]
+        scan_files = [source.path for source in scan_sources]
         
-        for dart_file in dart_files:
-            # l10n-generierte Dateien überspringen
-            if 'l10n' in str(dart_file) and 'app_localizations' in str(dart_file):
-                continue
-                
-            matches = self.scan_file(dart_file)
-            all_matches.extend(matches)
-            scanned_files += 1
+        cached_results: Dict[int, List[StringMatch]] = {}
+        cached_prefilter: Dict[int, Dict[str, int]] = {}
+        dirty = list(range(len(scan_files)))
+        states = {}
+        cache = self.scan_cache
+        if cache is not None:
+            dirty = []
+            for index, source in enumerate(scan_sources):
+                dart_file = source.path
+                rel_path = str(dart_file.relative_to(self.client_root))
+                cached, state = cache.lookup(rel_path, dart_file, (source.size, source.mtime_ns))
+                if cached is not None:
+                    source = SourceText(dart_file)
+                    cached_results[index] = [StringMatch.from_dict(match, source) for match in cached]
+                    cached_prefilter[index] = cache.prefilter(rel_path)
+                else:
+                    dirty.append(index)
+                    states[index] = state
+        
+        dirty_files = [scan_files[index] for index in dirty]
+        dirty_sizes = [scan_sources[index].size for index in dirty]
+        self.prefilter_stats = {'checked': 0, 'skipped': 0}
+        if jobs != 1 and len(dirty_files) > 1:
+            scanned = self.scan_files_parallel(dirty_files, jobs, dirty_sizes)
+        else:
+            scanned = (self.scan_file_counted(dart_file, size) for dart_file, size in zip(dirty_files, dirty_sizes))
+        scanned_by_index = zip(dirty, scanned)
+        
+        files_with_matches = 0
+        for index, dart_file in enumerate(scan_files):
+            if index in cached_results:
+                matches = cached_results.pop(index)
+                # Vorfilter-Ergebnis aus dem Cache: Report gleich wie bei einem vollen Scan
+                for name, count in cached_prefilter.pop(index).items():
+                    self.prefilter_stats[name] += count
+            else:
+                _, (matches, prefilter) = next(scanned_by_index)
+                if cache is not None:
+                    rel_path = str(dart_file.relative_to(self.client_root))
+                    cache.store(rel_path, states[index], [match.to_dict(with_span=True) for match in matches],
+                                prefilter)
             
             if matches:
                 files_with_matches += 1
                 print(f"  📝 {len(matches)} Strings in {dart_file.name}")
+            yield dart_file, matches
+        
+        if cache is not None:
+            if files is None:
+                cache.prune({str(f.relative_to(self.client_root)) for f in scan_files})
+            cache.save()
+            print(f"♻️ Scan-Cache: {cache.hits} Dateien unverändert, {len(dirty_files)} neu gescannt")
         
-        print(f"📊 Scan-Statistik: {scanned_files} Dateien durchsucht, {files_with_matches} mit Treffern")
-        return all_matches
+        print(f"📊 Scan-Statistik: {len(scan_files)} Dateien durchsucht, {files_with_matches} mit Treffern")
+        prefilter = self.prefilter_stats
+        if prefilter['checked']:
+            print(f"⏭️ Byte-Vorfilter: {prefilter['skipped']} von {prefilter['checked']} Dateien "
+                  f"({prefilter['skipped'] / prefilter['checked']:.0%}) ohne Dekodierung übersprungen")
+        memo = self.memo_stats()
+        if memo['literal']['hits'] + memo['literal']['misses']:
+            # Nur serielle Scans: Worker-Prozesse führen eigene Tabellen
+            print(f"🧠 Literal-Memo: {memo['literal']['hit_rate']:.0%} Treffer "
+                  f"({memo['literal']['size']} eindeutige Literale), "
+                  f"Key-Memo: {memo['key']['hit_rate']:.0%} Treffer")
+        self.last_scan_stats = {
+            'files_total': total_files,
+            'files_scanned': len(scan_files),
+            'files_with_matches': files_with_matches,
+            'files_prefiltered': prefilter['skipped'],
+            'files_prefilter_checked': prefilter['checked']
+        }
+
+    def scan_since(self, ref: str, jobs: int = 1) -> List[StringMatch]:
+        """Scannt nur seit ref geänderte Dart-Dateien und meldet nur Treffer in geänderten Hunks"""
+        return list(self.iter_since(ref, jobs=jobs))
+
+    def iter_since(self, ref: str, jobs: int = 1) -> Iterator[StringMatch]:
+        """Streaming-Variante von scan_since (GitError wird vor dem ersten Treffer geworfen)"""
+        lib_rel = str(self.lib_dir.relative_to(self.client_root))
+        changed = changed_line_ranges(ref, self.client_root, lib_rel)
+        print(f"🔀 Diff-Modus: {len(changed)} geänderte Dart-Dateien seit {ref}")
+        return self._filter_to_hunks(changed, jobs)
+
+    def _filter_to_hunks(self, changed: Dict[str, List[Tuple[int, int]]], jobs: int) -> Iterator[StringMatch]:
+        files = [self.client_root / rel_path for rel_path in sorted(changed)]
+        total = in_hunks = 0
+        for match in self.iter_matches(jobs=jobs, files=files):
+            total += 1
+            if line_in_ranges(match.line, changed.get(Path(match.file).as_posix(), [])):
+                in_hunks += 1
+                yield match
+        print(f"🔀 {in_hunks} von {total} Treffern liegen in geänderten Zeilen")
+
+    def hit_history(self) -> Tuple[Dict[str, int], Optional[int]]:
+        """Bisherige Treffer pro Datei und Start des letzten vollen Laufs (ns, sonst None)
+
+        Quelle ist der letzte volle Lauf in der Findings-DB, ohne DB der Scan-Cache.
+        """
+        db_file = default_db_file(self.client_root)
+        if db_file.exists():
+            db = FindingsDB(db_file)
+            try:
+                runs = db.runs(EXTRACTOR, extraction_scope(), limit=1)
+                if runs:
+                    started = datetime.datetime.fromisoformat(runs[0].started_at).timestamp()
+                    return db.file_counts(runs[0].id), int(started * 1_000_000_000)
+            finally:
+                db.close()
+        if self.scan_cache is not None:
+            return {Path(rel_path).as_posix(): len(entry.get('matches', ()))
+                    for rel_path, entry in self.scan_cache.entries.items()}, None
+        return {}, None
 
-    def load_existing_arb(self, lang: str = 'de') -> Set[str]:
-        """Lädt existierende .arb-Keys"""
+    def iter_budget(self, budget: float) -> Iterator[StringMatch]:
+        """Scannt in Prioritäts-Reihenfolge (siehe prioritize_files), bis budget Sekunden um sind
+
+        Seriell; Cache-Treffer zählen als geprüft. Das Budget läuft ab dem
+        ersten Treffer-Abruf und schließt Durchlauf und Report-Ausgabe ein.
+        Nicht mehr erreichte Dateien werden in der Abdeckung ausgewiesen.
+        """
+        deadline = time.perf_counter() + budget
+        if not self.lib_dir.exists():
+            print(f"❌ lib-Verzeichnis nicht gefunden: {self.lib_dir}")
+            return
+        
+        all_sources = self.walker.files()
+        sources = [source for source in all_sources if not source.generated]
+        hit_counts, last_full_ns = self.hit_history()
+        recent_ns = last_full_ns if last_full_ns is not None else time.time_ns() - RECENT_WINDOW_NS
+        ordered = prioritize_files(sources, self.client_root, hit_counts, recent_ns)
+        recent = sum(1 for source in sources if source.mtime_ns >= recent_ns)
+        print(f"⏱️ Budget-Scan: {budget:g}s für {len(ordered)} Dart-Dateien, {recent} kürzlich geändert")
+        
+        cache = self.scan_cache
+        self.prefilter_stats = {'checked': 0, 'skipped': 0}
+        covered = covered_bytes = files_with_matches = 0
+        for source in ordered:
+            if time.perf_counter() >= deadline:
+                break
+            rel_path = str(source.path.relative_to(self.client_root))
+            matches = None
+            if cache is not None:
+                cached, state = cache.lookup(rel_path, source.path, (source.size, source.mtime_ns))
+                if cached is not None:
+                    text = SourceText(source.path)
+                    matches = [StringMatch.from_dict(match, text) for match in cached]
+                    for name, count in cache.prefilter(rel_path).items():
+                        self.prefilter_stats[name] += count
+            if matches is None:
+                matches, prefilter = self.scan_file_counted(source.path, source.size)
+                if cache is not None:
+                    cache.store(rel_path, state, [match.to_dict(with_span=True) for match in matches],
+                                prefilter)
+            covered += 1
+            covered_bytes += source.size
+            if matches:
+                files_with_matches += 1
+                print(f"  📝 {len(matches)} Strings in {source.path.name}")
+            yield from matches
+        
+        if cache is not None:
+            # Kein prune: nicht erreichte Dateien behalten ihre Einträge
+            cache.save()
+        
+        total_bytes = sum(source.size for source in ordered)
+        skipped = len(ordered) - covered
+        print(f"⏱️ Abdeckung: {covered} von {len(ordered)} Dateien "
+              f"({covered / max(len(ordered), 1):.0%}, {covered_bytes / max(total_bytes, 1):.0%} der Bytes), "
+              f"{files_with_matches} mit Treffern")
+        if covered < recent:
+            print(f"⚠️ Nur {covered} von {recent} kürzlich geänderten Dateien im Budget geprüft")
+        if skipped:
+            print(f"⏭️ {skipped} Dateien aus Zeitgründen nicht geprüft - voller Scan ohne --budget")
+        self.last_scan_stats = {
+            'files_total': len(all_sources),
+            'files_scanned': covered,
+            'files_with_matches': files_with_matches,
+            'files_budget_skipped': skipped,
+            'bytes_covered': covered_bytes,
+            'bytes_total': total_bytes,
+            'files_prefiltered': self.prefilter_stats['skipped'],
+            'files_prefilter_checked': self.prefilter_stats['checked']
+        }
+
+    def scan_files_parallel(self, files: List[Path], jobs: int,
+                            sizes: Optional[List[int]] = None) -> Iterator[Tuple[List[StringMatch], Dict[str, int]]]:
+        """Scannt Dateien in einem Prozess-Pool; (Treffer, Vorfilter-Zähler) in Eingabe-Reihenfolge
+
+        Fertige Pakete werden sofort weitergereicht; nur vorgezogene Ergebnisse
+        (Pakete sind nach Größe sortiert) werden bis zu ihrer Position gepuffert.
+        """
+        workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+        batches = plan_scan_batches(files, workers, sizes)
+        print(f"⚙️ Parallel-Scan: {workers} Prozesse, {len(batches)} Arbeitspakete")
+        
+        pending: Dict[int, Tuple[List[StringMatch], Dict[str, int]]] = {}
+        next_index = 0
+        lib_dir = str(self.lib_dir.relative_to(self.client_root))
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_scan_worker,
+                                 initargs=(str(self.client_root), lib_dir)) as pool:
+            for batch_results in pool.map(_scan_batch, batches):
+                for index, matches, prefilter in batch_results:
+                    for name, count in prefilter.items():
+                        self.prefilter_stats[name] += count
+                    pending[index] = (matches, prefilter)
+                while next_index in pending:
+                    yield pending.pop(next_index)
+                    next_index += 1
+
+    def watch(self, problems_file: str, jobs: int = 1, interval: float = 0.5, polling: bool = False):
+        """Watch-Modus: hält Treffer pro Datei im Speicher und scannt nur geänderte Dateien neu
+
+        Nach jeder Änderung wird problems_file atomar neu geschrieben. Läuft bis Ctrl+C.
+        """
+        results: Dict[str, List[StringMatch]] = {}
+        
+        def full_scan():
+            results.clear()
+            self.walker.refresh()
+            for dart_file, matches in self.iter_scan_results(jobs=jobs):
+                results[str(dart_file.relative_to(self.client_root))] = matches
+        
+        def write_problems(existing_keys: Dict[str, str], values: ValueIndex) -> int:
+            all_matches = [match for rel_path in sorted(results) for match in results[rel_path]]
+            new_matches = self.select_new_matches(all_matches, existing_keys, values)
+            self.generate_problems_json(new_matches, problems_file, quiet=True)
+            return len(new_matches)
+        
+        # Watcher vor dem ersten Scan starten, damit keine Änderung verloren geht
+        watcher = create_watcher(self.lib_dir, ('.dart', '.arb'), interval=interval, polling=polling)
+        full_scan()
+        existing_keys = self.load_existing_arb()
+        values = self.load_value_index()
+        count = write_problems(existing_keys, values)
+        print(f"👀 Watch-Modus ({watcher.backend}): {count} Probleme in {problems_file} - Ctrl+C zum Beenden")
+        
+        try:
+            while True:
+                changed = watcher.wait()
+                started = time.perf_counter()
+                
+                if changed is None:
+                    print("♻️ Änderungen nicht eindeutig - kompletter Neu-Scan")
+                    full_scan()
+                    existing_keys = self.load_existing_arb()
+                    values = self.load_value_index()
+                    rescanned = len(results)
+                else:
+                    rescanned = 0
+                    for path in sorted(changed):
+                        if path.suffix == '.arb':
+                            if path.parent == self.l10n_dir:
+                                existing_keys = self.load_existing_arb()
+                                values = self.load_value_index()
+                            continue
+                        rel_path = str(path.relative_to(self.client_root))
+                        # Ignorierte und generierte Dateien wie im vollen Scan überspringen
+                        source = self.walker.source_file(path)
+                        if source is not None and not source.generated:
+                            results[rel_path] = self.scan_file(path, source.size)
+                            rescanned += 1
+                        else:
+                            results.pop(rel_path, None)
+                
+                count = write_problems(existing_keys, values)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                print(f"🔁 {time.strftime('%H:%M:%S')} {rescanned} Dateien neu gescannt "
+                      f"in {elapsed_ms:.1f} ms - {count} Probleme")
+        except KeyboardInterrupt:
+            print("\n👋 Watch-Modus beendet")
+        finally:
+            watcher.close()
+
+    def load_existing_arb(self, lang: str = 'de') -> Dict[str, str]:
+        """Lädt existierende .arb-Keys mit ihrem Text"""
         arb_file = self.l10n_dir / f"app_{lang}.arb"
-        existing_keys = set()
+        existing_keys = {}
         
         if arb_file.exists():
             try:
                 with open(arb_file, 'r', encoding='utf-8') as f:
                     arb_data = json.load(f)
-                    existing_keys = {k for k in arb_data.keys() if not k.startswith('@@') and not k.startswith('@')}
+                    existing_keys = {k: v for k, v in arb_data.items() if not k.startswith('@')}
                 print(f"📋 {len(existing_keys)} existierende Keys in {arb_file.name}")
             except Exception as e:
                 print(f"⚠️ Fehler beim Lesen von {arb_file}: {e}")
         
         return existing_keys
 
-    def generate_problems_json(self, matches: List[StringMatch], output_file: str = "problems.json"):
-        """✅ 7. Editor-Integration: VS Code Problems Format"""
-        problems = []
+    def load_value_index(self) -> ValueIndex:
+        """Umgekehrter Index Text -> Key über alle .arb-Dateien (siehe i18n_value_index)"""
+        return ValueIndex.load(self.l10n_dir)
+
+    def write_jsonl(self, matches: Iterable[StringMatch], stream: TextIO,
+                    findings: Optional[FindingsRun] = None) -> Dict[str, int]:
+        """Schreibt neue Treffer als JSON Lines, sobald sie anfallen
+
+        Jede Zeile wird sofort geflusht, damit ein nachgelagerter Converter
+        (z.B. per Pipe) schon während des Scans weiterarbeiten kann.
+        """
+        existing_keys = self.load_existing_arb()
+        values = self.load_value_index()
+        allocator = KeyAllocator(existing_keys)
+        stats = {'total': 0, 'new': 0, 'high_confidence': 0, 'localized': 0}
         
         for match in matches:
-            problems.append({
-                "file": match.file,
-                "line": match.line,
-                "column": match.column,
-                "message": f"Hardcoded deutscher Text gefunden: \"{match.original[:50]}{'...' if len(match.original) > 50 else ''}\"",
-                "severity": "warning" if match.confidence > 0.7 else "info",
-                "code": "i18n-hardcoded-string",
-                "source": "weltenwind-i18n-extractor",
-                "details": {
-                    "suggested_key": match.suggested_key,
-                    "category": match.category,
-                    "confidence": match.confidence,
-                    "widget_context": match.widget_context,
-                    "quote_type": match.quote_type
-                }
-            })
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(problems, f, indent=2, ensure_ascii=False)
-        
-        print(f"🔧 Editor-Integration: {output_file}")
-
-    def generate_report(self, matches: List[StringMatch], output_file: str = "i18n_extraction_report.md"):
-        """Generiert einen erweiterten Markdown-Report"""
-        existing_keys = self.load_existing_arb()
+            stats['total'] += 1
+            self.assign_key(match, allocator, values)
+            if match.localized_as:
+                # Mit im Stream: der Converter ersetzt den Text durch den vorhandenen Key
+                stats['localized'] += 1
+            elif match.suggested_key in existing_keys:
+                continue
+            stream.write(json.dumps(match.to_dict(), ensure_ascii=False) + '\n')
+            stream.flush()
+            if findings is not None:
+                self.record_finding(findings, match, self.problem_entry(match))
+            if match.localized_as:
+                continue
+            stats['new'] += 1
+            if match.confidence >= 0.8:
+                stats['high_confidence'] += 1
+        
+        return stats
+
+    def problem_entry(self, match: StringMatch) -> Dict:
+        """Ein Treffer im Problems-Format (problems.json und Language Server)"""
+        excerpt = f"{match.original[:50]}{'...' if len(match.original) > 50 else ''}"
+        if match.localized_as:
+            message = f"Text bereits lokalisiert, vorhandenen Key verwenden: \"{excerpt}\""
+            severity, code = "info", "i18n-already-localized"
+        else:
+            message = f"Hardcoded deutscher Text gefunden: \"{excerpt}\""
+            severity, code = ("warning" if match.confidence > 0.7 else "info"), "i18n-hardcoded-string"
+        return {
+            "file": match.file,
+            "line": match.line,
+            "column": match.column,
+            "message": message,
+            "severity": severity,
+            "code": code,
+            "source": "weltenwind-i18n-extractor",
+            "details": {
+                "suggested_key": match.suggested_key,
+                "category": match.category,
+                "confidence": match.confidence,
+                "widget_context": match.widget_context,
+                "quote_type": match.quote_type
+            }
+        }
+
+    def record_finding(self, findings: FindingsRun, match: StringMatch, problem: Dict) -> str:
+        """Schreibt einen neuen Treffer in die Findings-DB (mit Kontext, für Reports ohne Scan)"""
+        return findings.add(problem['code'], match.file, match.original, match.line, match.column,
+                            match.confidence, problem['severity'], problem['message'],
+                            category=match.category, key=match.suggested_key,
+                            data=dict(match.to_dict(), context=match.context))
+
+    def generate_problems_json(self, matches: List[StringMatch], output_file: str = "problems.json",
+                               quiet: bool = False):
+        """✅ 7. Editor-Integration: VS Code Problems Format"""
+        # Atomar ersetzen, damit Editoren nie eine halb geschriebene Datei lesen
+        writer = JsonArrayWriter(output_file)
+        for order, match in enumerate(matches):
+            writer.add(order, self.problem_entry(match))
+        writer.close()
         
-        # Matches filtern und sortieren
-        new_matches = [m for m in matches if m.suggested_key not in existing_keys]
+        if not quiet:
+            print(f"🔧 Editor-Integration: {output_file}")
+
+    def assign_key(self, match: StringMatch, allocator: KeyAllocator,
+                   values: Optional[ValueIndex] = None) -> str:
+        """Setzt den endgültigen Key eines Treffers (kollisionsfrei, siehe i18n_key_allocator)
+
+        Steht der Text schon in einer .arb-Datei (values), ist das sein Key und
+        der Treffer wird als localized_as markiert. Sonst wird der Basis-Key aus
+        Text und Kategorie neu abgeleitet, damit wiederholte Vergaben
+        (Watch-Modus) nicht auf einem schon vergebenen Key aufsetzen.
+        """
+        match.localized_as = (values.lookup(match.original) if values is not None else None) or ""
+        if match.localized_as:
+            match.suggested_key = match.localized_as
+            return match.suggested_key
+        base_key = self.generate_key(match.original, match.category)
+        match.suggested_key = allocator.allocate(base_key, match.original)
+        return match.suggested_key
+
+    def select_new_matches(self, matches: Iterable[StringMatch], existing_keys: Dict[str, str],
+                           values: Optional[ValueIndex] = None) -> List[StringMatch]:
+        """Vergibt Keys in Datei-Reihenfolge; Treffer ohne existierenden .arb-Key, nach Priorität sortiert
+
+        Ein Key gilt nur als existierend, wenn er in der .arb-Datei denselben Text trägt.
+        Bereits lokalisierte Texte (values) bleiben mit ihrem Key in der Liste.
+        """
+        allocator = KeyAllocator(existing_keys)
+        new_matches = [m for m in matches
+                       if self.assign_key(m, allocator, values) not in existing_keys or m.localized_as]
         new_matches.sort(key=lambda x: (-x.confidence, x.category, x.file))
+        return new_matches
+
+    def priority_key(self, match: StringMatch) -> Tuple[float, str, str]:
+        """Report-Reihenfolge: Konfidenz absteigend, dann Kategorie und Datei"""
+        return (-match.confidence, match.category, match.file)
+
+    def write_reports(self, matches: Iterable[StringMatch], output_file: str = "i18n_extraction_report.md",
+                      json_file: Optional[str] = None, problems_file: Optional[str] = None,
+                      sarif_file: Optional[str] = None, findings: Optional[FindingsRun] = None) -> Dict[str, int]:
+        """Schreibt Markdown-Report und optional JSON, problems.json und SARIF in einem Durchlauf
+
+        Neue Treffer gehen sofort an alle Writer (siehe i18n_report_writers)
+        und an die Findings-DB, die Treffer selbst werden nicht gesammelt.
+        Ohne Treffer wird keine Datei angelegt. Pfade auf .gz werden
+        gzip-komprimiert geschrieben.
+        """
+        existing_keys = self.load_existing_arb()
+        values = self.load_value_index()
+        allocator = KeyAllocator(existing_keys)
+        stats = {'total': 0, 'new': 0, 'high_confidence': 0, 'localized': 0}
         
-        # Statistiken
-        total_matches = len(matches)
-        new_strings = len(new_matches)
-        categories = {}
-        confidence_distribution = {'high': 0, 'medium': 0, 'low': 0}
-        quote_types = {}
+        markdown = MarkdownReportWriter(output_file)
+        json_writer = JsonArrayWriter(json_file) if json_file else None
+        problems = JsonArrayWriter(problems_file) if problems_file else None
+        sarif = None
+        if sarif_file:
+            sarif = SarifWriter(sarif_file, 'weltenwind-i18n-extractor')
+            sarif.add_rule('i18n-hardcoded-string', 'Hardcoded deutscher Text statt AppLocalizations')
+            sarif.add_rule('i18n-already-localized', 'Text steht schon in der .arb-Datei, vorhandenen Key verwenden',
+                           'note')
+        writers = [writer for writer in (markdown, json_writer, problems, sarif) if writer is not None]
         
-        for match in new_matches:
-            categories[match.category] = categories.get(match.category, 0) + 1
-            quote_types[match.quote_type] = quote_types.get(match.quote_type, 0) + 1
-            
-            if match.confidence >= 0.8:
-                confidence_distribution['high'] += 1
-            elif match.confidence >= 0.6:
-                confidence_distribution['medium'] += 1
-            else:
-                confidence_distribution['low'] += 1
-        
-        # Report schreiben
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# 🌍 Weltenwind i18n String Extraction Report\n\n")
-            f.write(f"**Gesamt gefunden:** {total_matches} Strings\n")
-            f.write(f"**Neue Strings:** {new_strings} (noch nicht in .arb)\n")
-            f.write(f"**Bereits vorhanden:** {total_matches - new_strings}\n\n")
-            
-            f.write("## 📊 Kategorien\n\n")
-            for category, count in sorted(categories.items()):
-                f.write(f"- **{category}**: {count} Strings\n")
-            f.write("\n")
-            
-            f.write("## 🎯 Konfidenz-Verteilung\n\n")
-            f.write(f"- **Hoch (≥80%)**: {confidence_distribution['high']} Strings ✅\n")
-            f.write(f"- **Mittel (60-79%)**: {confidence_distribution['medium']} Strings ⚠️\n")
-            f.write(f"- **Niedrig (<60%)**: {confidence_distribution['low']} Strings ❓\n\n")
-            
-            f.write("## 📝 Quote-Types\n\n")
-            for quote_type, count in quote_types.items():
-                f.write(f"- **{quote_type}-Quotes**: {count} Strings\n")
-            f.write("\n")
-            
-            f.write("## 🔍 Neue Strings (Priorität: Hoch → Niedrig)\n\n")
-            
-            current_category = None
-            for match in new_matches:
-                if match.category != current_category:
-                    current_category = match.category
-                    f.write(f"### 🏷️ {current_category.upper()}\n\n")
-                
-                confidence_emoji = "🔥" if match.confidence >= 0.8 else "⚠️" if match.confidence >= 0.6 else "❓"
-                f.write(f"**{match.suggested_key}** {confidence_emoji} (Confidence: {match.confidence:.1f})\n")
-                f.write(f"- 📁 `{match.file}:{match.line}:{match.column}`\n")
-                f.write(f"- 📝 Original: `{match.quote_type}{match.original}{match.quote_type}`\n")
-                f.write(f"- 🎯 Widget: {match.widget_context}\n")
-                f.write(f"- 🔧 Context:\n```dart\n{match.context}\n```\n\n")
+        profiler = self.profiler
+        clock = time.perf_counter_ns
+        report_ns = 0
+        try:
+            for match in matches:
+                stats['total'] += 1
+                if self.assign_key(match, allocator, values) in existing_keys and not match.localized_as:
+                    continue
+                if profiler is not None:
+                    started = clock()
+                key = self.priority_key(match)
+                if match.localized_as:
+                    stats['localized'] += 1
+                    markdown.add_localized(match)
+                else:
+                    stats['new'] += 1
+                    if match.confidence >= 0.8:
+                        stats['high_confidence'] += 1
+                    markdown.add(key, match)
+                if json_writer is not None:
+                    json_writer.add(key, match.to_dict())
+                if problems is not None or sarif is not None or findings is not None:
+                    problem = self.problem_entry(match)
+                    if problems is not None:
+                        problems.add(key, problem)
+                    if sarif is not None:
+                        sarif.add_result(problem['code'], SARIF_LEVELS[problem['severity']],
+                                         f"{problem['message']} → {match.suggested_key}",
+                                         self.client_root / match.file, match.line, match.column,
+                                         match.column + len(match.original) + 2,
+                                         properties=problem['details'], fingerprint=text_digest(match.original))
+                    if findings is not None:
+                        self.record_finding(findings, match, problem)
+                if profiler is not None:
+                    report_ns += clock() - started
+        except BaseException:
+            for writer in writers:
+                writer.discard()
+            raise
+        
+        if not stats['total']:
+            for writer in writers:
+                writer.discard()
+            return stats
         
+        if profiler is not None:
+            started = clock()
+        markdown.close(stats['total'], (self.last_scan_stats.get('files_prefiltered', 0),
+                                        self.last_scan_stats.get('files_prefilter_checked', 0)))
         print(f"📄 Report gespeichert: {output_file}")
-        return new_matches
+        if json_writer is not None:
+            json_writer.close()
+            print(f"📊 JSON-Daten gespeichert: {json_file}")
+        if problems is not None:
+            problems.close()
+            print(f"🔧 Editor-Integration: {problems_file}")
+        if sarif is not None:
+            sarif.close()
+            print(f"🛡️ SARIF gespeichert: {sarif_file}")
+        if profiler is not None:
+            profiler.add_stage('report', report_ns + clock() - started)
+        return stats
+
+def output_sibling(output: str, suffix: str) -> str:
+    """Pfad neben dem Report: report.md -> report<suffix>, auch ohne .md-Endung nie der Report selbst"""
+    path = Path(output)
+    sibling = path.with_name(path.stem + suffix)
+    if sibling == path:
+        # -o report.json --json: Endung anhängen statt den Report zu überschreiben
+        sibling = path.with_name(path.name + suffix)
+    return str(sibling)
+
+def print_scan_summary(extractor: 'I18nStringExtractor'):
+    stats = extractor.last_scan_stats
+    if 'files_budget_skipped' in stats:
+        print(f"⏱️ Budget-Scan: {stats['files_scanned']} von {stats['files_scanned'] + stats['files_budget_skipped']} "
+              f"Dateien geprüft ({stats['bytes_covered'] / max(stats['bytes_total'], 1):.0%} der Bytes)")
+    else:
+        print(f"✅ Scan abgeschlossen: {stats.get('files_total', 0)} Dateien durchsucht")
+
+def finish_findings_run(findings_db: FindingsDB, findings: FindingsRun, scope: str, stats: Dict):
+    """Schließt den DB-Lauf ab und zeigt neu/behoben gegenüber dem vorigen Lauf gleichen Scopes"""
+    findings.finish(stats)
+    delta = findings_db.delta(EXTRACTOR, scope)
+    if delta['previous'] is None:
+        print(f"🗃️ Findings-DB: Lauf #{findings.id} gespeichert (erster Lauf für [{scope}])")
+    else:
+        print(f"🗃️ Findings-DB: Lauf #{findings.id} - {len(delta['new'])} neu, "
+              f"{len(delta['fixed'])} behoben seit Lauf #{delta['previous'].id}")
+    findings_db.close()
 
 def main():
     parser = argparse.ArgumentParser(description='Weltenwind i18n String Extractor (Enhanced)')
@@ -545,6 +1455,10 @@ def main():
                        help='Output-Datei für den Report')
     parser.add_argument('--json', action='store_true', 
                        help='Zusätzliche JSON-Ausgabe')
+    parser.add_argument('--jsonl', metavar='FILE',
+                       help='Neue Treffer als JSON Lines streamen statt Report ("-" = stdout, *.gz = gzip)')
+    parser.add_argument('--sarif', metavar='FILE',
+                       help='Neue Treffer zusätzlich als SARIF 2.1.0 (Code-Scanning, *.gz = gzip)')
     parser.add_argument('--problems', action='store_true',
                        help='Generiere problems.json für Editor-Integration')
     parser.add_argument('--client-root', default='.', 
@@ -553,58 +1467,156 @@ def main():
                        help='✅ 4. Gibt Fehlercode zurück, wenn Strings gefunden wurden (CI/CD)')
     parser.add_argument('--strict', action='store_true',
                        help='Strenge Validierung mit niedrigerer Konfidenz-Schwelle')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Anzahl paralleler Scan-Prozesse (0 = alle CPU-Kerne)')
+    parser.add_argument('--since', metavar='REF',
+                       help='Nur seit REF (Merge-Base) geänderte Dateien und Zeilen prüfen (PR-CI)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Inkrementellen Scan-Cache nicht verwenden (voller Scan)')
+    parser.add_argument('--watch', action='store_true',
+                       help='Dauerhaft laufen und problems.json bei jeder Änderung in lib/ aktualisieren')
+    parser.add_argument('--poll', action='store_true',
+                       help='Im Watch-Modus Polling statt inotify verwenden')
+    parser.add_argument('--cache-file',
+                       help='Pfad zur Scan-Cache-Datei (Default: tools/.i18n_cache/scan_cache.json)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Zeiten pro Stufe, Regel und Datei messen (seriell, ohne Cache)')
+    parser.add_argument('--db', nargs='?', const='', metavar='FILE',
+                       help='Neue Treffer in die Findings-DB schreiben und mit dem letzten Lauf vergleichen '
+                            '(Default: tools/.i18n_history/findings.db)')
+    parser.add_argument('--budget', type=parse_duration, metavar='DAUER',
+                       help='Zeitbudget (z.B. 2s, 500ms): kürzlich geänderte und trefferreiche Dateien zuerst, '
+                            'Scan endet nach Ablauf (Pre-Push)')
     
     args = parser.parse_args()
+    if args.profile and (args.jsonl or args.watch):
+        parser.error('--profile ist mit --jsonl/--watch nicht kombinierbar')
+    if args.sarif and (args.jsonl or args.watch):
+        parser.error('--sarif ist mit --jsonl/--watch nicht kombinierbar')
+    if args.db is not None and args.watch:
+        parser.error('--db ist mit --watch nicht kombinierbar')
+    if args.budget is not None and (args.since or args.watch or args.profile or args.db is not None):
+        parser.error('--budget ist mit --since/--watch/--profile/--db nicht kombinierbar')
+    
+    jsonl_stream = None
+    if args.jsonl == '-':
+        # stdout gehört dem JSONL-Stream, Fortschritt geht nach stderr
+        jsonl_stream = sys.stdout
+        sys.stdout = sys.stderr
     
     # ✅ 8. CLI-Summary-Header
     print("🚀 Weltenwind i18n String Extractor (Enhanced)")
     print("=" * 60)
     
     extractor = I18nStringExtractor(args.client_root)
-    matches = extractor.scan_all_files()
+    profiler = None
+    if args.profile:
+        # Gemessen wird jede Datei im eigenen Prozess; Cache-Treffer würden Zeiten verfälschen
+        profiler = extractor.enable_profiling()
+        args.jobs = 1
+        print("⏱️ Profiling aktiv: serieller Scan ohne Cache")
+    elif not args.no_cache:
+        extractor.use_scan_cache(Path(args.cache_file) if args.cache_file else None)
+    if args.watch:
+        extractor.watch(output_sibling(args.output, '_problems.json'), jobs=args.jobs, polling=args.poll)
+        return
+    if args.budget is not None:
+        if args.jobs != 1:
+            print("ℹ️ Budget-Scan läuft seriell (--jobs wird ignoriert)")
+        matches = extractor.iter_budget(args.budget)
+    elif args.since:
+        try:
+            matches = extractor.iter_since(args.since, jobs=args.jobs)
+        except GitError as e:
+            print(f"❌ Diff-Modus nicht möglich: {e}")
+            exit(1)
+    else:
+        matches = extractor.iter_matches(jobs=args.jobs)
+    
+    findings = None
+    if args.db is not None:
+        findings_db = FindingsDB(Path(args.db) if args.db else default_db_file(extractor.client_root))
+        scope = extraction_scope(args.since)
+        findings = findings_db.start_run(EXTRACTOR, scope, cwd=extractor.client_root)
     
-    if not matches:
-        print("✅ Keine hardcoded deutschen Strings gefunden!")
+    if args.jsonl:
+        try:
+            if jsonl_stream is not None:
+                stats = extractor.write_jsonl(matches, jsonl_stream, findings)
+            else:
+                with open_output(args.jsonl) as f:
+                    stats = extractor.write_jsonl(matches, f, findings)
+        except BaseException:
+            if findings is not None:
+                findings.abort()
+            raise
+        if findings is not None:
+            finish_findings_run(findings_db, findings, scope, dict(stats, **extractor.last_scan_stats))
+        
+        print()
+        print("=" * 60)
+        print("📋 ZUSAMMENFASSUNG")
+        print("=" * 60)
+        print_scan_summary(extractor)
+        print(f"🔍 {stats['new']} neue von {stats['total']} deutschen Strings")
+        print(f"📊 JSON Lines: {args.jsonl}")
+        if stats['localized']:
+            print(f"♻️ {stats['localized']} Strings bereits lokalisiert - vorhandenen Key verwenden")
+        if stats['high_confidence'] > 0:
+            print(f"🔥 {stats['high_confidence']} Strings mit hoher Konfidenz (≥80%) - Priorität!")
+        if args.fail_on_find and stats['new']:
+            print(f"❌ CI/CD: {stats['new']} hardcoded Strings gefunden - Build fehlgeschlagen!")
+            exit(1)
         return
     
-    # Report generieren
-    new_matches = extractor.generate_report(matches, args.output)
+    # Report und optionale Ausgaben in einem Durchlauf, während gescannt wird
+    json_file = output_sibling(args.output, '.json') if args.json else None
+    problems_file = output_sibling(args.output, '_problems.json') if args.problems else None
+    try:
+        stats = extractor.write_reports(matches, args.output, json_file=json_file, problems_file=problems_file,
+                                        sarif_file=args.sarif, findings=findings)
+    except BaseException:
+        if findings is not None:
+            findings.abort()
+        raise
+    if findings is not None:
+        finish_findings_run(findings_db, findings, scope, dict(stats, **extractor.last_scan_stats))
     
-    # Optional: JSON-Output
-    if args.json:
-        json_file = args.output.replace('.md', '.json')
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump([asdict(match) for match in new_matches], f, 
-                     indent=2, ensure_ascii=False)
-        print(f"📊 JSON-Daten gespeichert: {json_file}")
+    if profiler is not None:
+        profiler.print_table()
+        profiler.save(output_sibling(args.output, '_profile.json'))
     
-    # Optional: Problems JSON für Editor
-    if args.problems:
-        problems_file = args.output.replace('.md', '_problems.json')
-        extractor.generate_problems_json(new_matches, problems_file)
+    if not stats['total']:
+        if extractor.last_scan_stats.get('files_budget_skipped'):
+            print("✅ Keine hardcoded deutschen Strings in den geprüften Dateien (Budget nicht ausreichend)")
+        else:
+            print("✅ Keine hardcoded deutschen Strings gefunden!")
+        return
     
     # ✅ 8. CLI-Summary-Output am Ende
     print()
     print("=" * 60)
     print("📋 ZUSAMMENFASSUNG")
     print("=" * 60)
-    total_files = len(list(extractor.lib_dir.rglob("*.dart")))
-    print(f"✅ Scan abgeschlossen: {total_files} Dateien durchsucht")
-    print(f"🔍 {len(new_matches)} neue deutsche Strings gefunden")
+    print_scan_summary(extractor)
+    print(f"🔍 {stats['new']} neue deutsche Strings gefunden")
     print(f"📄 Report gespeichert als: {args.output}")
+    if stats['localized']:
+        print(f"♻️ {stats['localized']} Strings bereits lokalisiert - vorhandenen Key verwenden")
     
-    if args.json:
+    if json_file:
         print(f"📊 JSON-Daten unter: {json_file}")
-    if args.problems:
+    if problems_file:
         print(f"🔧 Editor-Integration: {problems_file}")
+    if args.sarif:
+        print(f"🛡️ SARIF unter: {args.sarif}")
     
-    high_confidence = len([m for m in new_matches if m.confidence >= 0.8])
-    if high_confidence > 0:
-        print(f"🔥 {high_confidence} Strings mit hoher Konfidenz (≥80%) - Priorität!")
+    if stats['high_confidence'] > 0:
+        print(f"🔥 {stats['high_confidence']} Strings mit hoher Konfidenz (≥80%) - Priorität!")
     
     # ✅ 4. --fail-on-find Modus für CI/CD
-    if args.fail_on_find and new_matches:
-        print(f"❌ CI/CD: {len(new_matches)} hardcoded Strings gefunden - Build fehlgeschlagen!")
+    if args.fail_on_find and stats['new']:
+        print(f"❌ CI/CD: {stats['new']} hardcoded Strings gefunden - Build fehlgeschlagen!")
         exit(1)
     
     print("🎯 Nächste Schritte: Prüfe den Report und aktualisiere .arb-Dateien")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Weltenwind i18n Value Index
+Umgekehrter Index über die .arb-Dateien: normalisierter Text -> Key
+
+Ein Literal, dessen Text schon unter irgendeinem Key übersetzt ist, braucht
+keinen neuen Eintrag - der Extractor markiert es als "bereits lokalisiert
+als X", der Converter verwendet X weiter. Der Index wird einmal aus allen
+app_*.arb gebaut; Werte der Referenzsprache (de) haben Vorrang, danach die
+übrigen Dateien nach Namen. Aufgenommen werden nur Keys, die es in der
+Referenzsprache gibt. Bei mehreren Keys mit gleichem Text gewinnt der erste
+in Datei-Reihenfolge (neue Keys werden hinten angehängt, der Treffer bleibt
+also stabil).
+
+Normalisiert wird nur, was an der Anzeige nichts ändert: Unicode-NFC,
+Leerraum und "..." gegenüber "…". Fast gleiche Texte sind Sache von
+i18n_near_duplicates.
+
+Usage: python i18n_value_index.py [--lang de] [text ...]
+"""
+
+import re
+import json
+import argparse
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+_SPACES = re.compile(r'\s+')
+
+def normalize_value(text: str) -> str:
+    return _SPACES.sub(' ', unicodedata.normalize('NFC', text).replace('...', '…')).strip()
+
+class ValueIndex:
+    def __init__(self):
+        self._keys: Dict[str, str] = {}
+        # Texte, die in der Referenzsprache unter mehreren Keys stehen
+        self.ambiguous = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str, value: str) -> bool:
+        """Nimmt value -> key auf, wenn der Text noch keinen Key hat"""
+        normalized = normalize_value(value)
+        if not normalized:
+            return False
+        current = self._keys.setdefault(normalized, key)
+        return current == key
+
+    def add_arb(self, arb_data: Dict, allowed_keys: Optional[Iterable[str]] = None):
+        allowed = set(allowed_keys) if allowed_keys is not None else None
+        for key, value in arb_data.items():
+            if key.startswith('@') or not isinstance(value, str):
+                continue
+            if allowed is not None and key not in allowed:
+                continue
+            if not self.add(key, value) and allowed is None:
+                self.ambiguous += 1
+
+    def lookup(self, text: str) -> Optional[str]:
+        return self._keys.get(normalize_value(text))
+
+    @classmethod
+    def load(cls, l10n_dir: Path, lang: str = 'de') -> 'ValueIndex':
+        """Index über alle app_*.arb in l10n_dir, Keys der Sprache lang zuerst"""
+        index = cls()
+        reference_file = Path(l10n_dir) / f"app_{lang}.arb"
+        reference = _load_arb(reference_file)
+        index.add_arb(reference)
+        keys = [key for key in reference if not key.startswith('@')]
+        for arb_file in sorted(Path(l10n_dir).glob('app_*.arb')):
+            if arb_file != reference_file:
+                index.add_arb(_load_arb(arb_file), keys)
+        return index
+
+def _load_arb(arb_file: Path) -> Dict:
+    try:
+        with open(arb_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        if arb_file.exists():
+            print(f"⚠️ Fehler beim Lesen von {arb_file}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def main():
+    parser = argparse.ArgumentParser(description='Weltenwind i18n Value Index')
+    parser.add_argument('texts', nargs='*', help='Texte, deren Key gesucht wird')
+    parser.add_argument('--client-root', default=str(Path(__file__).resolve().parent.parent),
+                       help='Pfad zum Client-Root-Verzeichnis')
+    parser.add_argument('--lang', default='de',
+                       help='Referenzsprache (app_<lang>.arb)')
+    args = parser.parse_args()
+
+    index = ValueIndex.load(Path(args.client_root) / "lib" / "l10n", args.lang)
+    print(f"📋 {len(index)} Texte im Index, {index.ambiguous} mehrfach vergeben in app_{args.lang}.arb")
+    missing: List[str] = []
+    for text in args.texts:
+        key = index.lookup(text)
+        if key is None:
+            missing.append(text)
+            print(f"🆕 \"{text}\": noch nicht lokalisiert")
+        else:
+            print(f"♻️ \"{text}\": bereits lokalisiert als {key}")
+    if missing:
+        exit(1)
+
+if __name__ == "__main__":
+    main()
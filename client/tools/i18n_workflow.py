@@ -21,6 +21,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 import datetime
 
+from i18n_findings_db import EXTRACTOR, VALIDATOR, FindingsDB, extraction_scope, relative_file
+
 @dataclass
 class WorkflowConfig:
     """Konfiguration für den i18n-Workflow"""
@@ -32,6 +34,9 @@ class WorkflowConfig:
     run_flutter_commands: bool = True
     fail_on_warnings: bool = False
     output_dir: str = "tools/workflow_reports"
+    scan_jobs: int = 1
+    since_ref: Optional[str] = None
+    findings_db: str = "tools/.i18n_history/findings.db"
 
 @dataclass
 class WorkflowResult:
@@ -53,6 +58,7 @@ class I18nWorkflow:
         self.tools_dir = self.client_root / "tools"
         self.output_dir = self.client_root / config.output_dir
         self.output_dir.mkdir(exist_ok=True)
+        self.findings_db = self.client_root / config.findings_db
         
         # Workflow-State
         self.errors = []
@@ -142,12 +148,19 @@ class I18nWorkflow:
             "python", str(self.tools_dir / "i18n_string_extractor.py"),
             "--output", str(report_file),
             "--json",
-            "--problems"
+            "--problems",
+            "--db", str(self.findings_db)
         ]
         
         if self.config.fail_on_warnings:
             command.append("--fail-on-find")
         
+        if self.config.scan_jobs != 1:
+            command.extend(["--jobs", str(self.config.scan_jobs)])
+        
+        if self.config.since_ref:
+            command.extend(["--since", self.config.since_ref])
+        
         result = self.run_command(command, "String-Extraktion")
         
         # Lade Statistiken aus JSON
@@ -168,11 +181,32 @@ class I18nWorkflow:
         
         self.reports.extend([str(report_file), str(json_file), str(problems_file)])
         
+        # Vergleich mit dem letzten Lauf gleichen Scopes aus der Findings-DB
+        delta = self.findings_delta(EXTRACTOR, extraction_scope(self.config.since_ref))
+        if delta is not None:
+            stats["new_since_last_run"] = delta['new']
+            stats["fixed_since_last_run"] = delta['fixed']
+        
         self.log(f"📊 Strings gefunden: {stats['total_strings']}", "SUCCESS")
         self.log(f"🔥 Hochkonfident (≥80%): {stats['high_confidence']}", "SUCCESS")
+        if delta is not None:
+            self.log(f"🗃️ Seit letztem Lauf: {delta['new']} neu, {delta['fixed']} behoben", "SUCCESS")
         
         return stats
     
+    def findings_delta(self, tool: str, scope: str) -> Optional[Dict[str, int]]:
+        """Neu/behoben im letzten Lauf laut Findings-DB (None ohne Vorlauf)"""
+        if not self.findings_db.exists():
+            return None
+        db = FindingsDB(self.findings_db)
+        try:
+            delta = db.delta(tool, scope)
+        finally:
+            db.close()
+        if delta['previous'] is None:
+            return None
+        return {'new': len(delta['new']), 'fixed': len(delta['fixed'])}
+    
     def convert_strings(self, extraction_json: Path) -> Dict:
         """Konvertiert Strings zu .arb-Format"""
         self.log("🔄 Konvertiere Strings zu .arb-Format...")
@@ -236,6 +270,7 @@ class I18nWorkflow:
                 "python", str(self.tools_dir / "arb_validator.py"),
                 str(arb_file),
                 "--json-report", str(report_file),
+                "--db", str(self.findings_db),
                 "--quiet"
             ]
             
@@ -262,6 +297,11 @@ class I18nWorkflow:
                 except Exception as e:
                     self.log(f"⚠️ Validierungsbericht nicht lesbar: {e}", "WARNING")
             
+            delta = self.findings_delta(VALIDATOR, relative_file(arb_file, self.client_root))
+            if delta is not None:
+                stats["new_since_last_run"] = stats.get("new_since_last_run", 0) + delta['new']
+                stats["fixed_since_last_run"] = stats.get("fixed_since_last_run", 0) + delta['fixed']
+            
             stats["files_validated"] += 1
             self.reports.append(str(report_file))
         
@@ -465,6 +505,10 @@ def main():
                        help='Bei Warnungen fehlschlagen (CI-Modus)')
     parser.add_argument('--output-dir', default='tools/workflow_reports',
                        help='Ausgabe-Verzeichnis für Reports')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Parallele Scan-Prozesse für die String-Extraktion (0 = alle CPU-Kerne)')
+    parser.add_argument('--since', metavar='REF',
+                       help='Nur seit REF geänderte Dart-Zeilen scannen (z.B. origin/develop im PR-Check)')
     
     args = parser.parse_args()
     
@@ -476,7 +520,9 @@ def main():
         create_backups=not args.no_backups,
         run_flutter_commands=not args.no_flutter,
         fail_on_warnings=args.fail_on_warnings,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        scan_jobs=args.jobs,
+        since_ref=args.since
     )
     
     # Workflow starten